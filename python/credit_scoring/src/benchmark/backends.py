@@ -0,0 +1,93 @@
+"""
+backends.py: cold start and resident memory comparison of the torch and NumPy inference backends.
+
+Each measurement runs in a fresh Python process so import time and RSS are not shared between runs.
+"""
+
+import os
+import sys
+import json
+import yaml
+import argparse
+import statistics
+import subprocess
+import logging as log
+from pathlib import Path
+from typing import Dict, Any, List
+from datetime import datetime, timezone
+
+log.basicConfig(level=log.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# runs inside the child process: import + artifact loading + first prediction
+_PROBE = """
+import os, sys, time, json, resource, logging
+t0 = time.perf_counter()
+sys.path.insert(0, os.getcwd())
+logging.disable(logging.CRITICAL)
+from src.server.schemas import CreditRiskInput
+from src.inference.predictor import build_predictor
+predictor_instance = build_predictor()
+t1 = time.perf_counter()
+example = CreditRiskInput(**CreditRiskInput.Config.schema_extra["example"])
+predictor_instance.predict_batch([example])
+t2 = time.perf_counter()
+print(json.dumps({
+    "load_seconds": t1 - t0,
+    "first_prediction_seconds": t2 - t1,
+    "cold_start_seconds": t2 - t0,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "torch_imported": "torch" in sys.modules,
+}))
+"""
+
+
+def measure_backend(backend: str, repeats: int) -> Dict[str, Any]:
+    """
+    Starts `repeats` fresh interpreters with INFERENCE_BACKEND=<backend> and aggregates the probes.
+    """
+    env = {**os.environ, "INFERENCE_BACKEND": backend, "BATCHING_ENABLED": "false"}
+    runs: List[Dict[str, Any]] = []
+    for _ in range(repeats):
+        completed = subprocess.run(
+            [sys.executable, "-c", _PROBE], env=env, capture_output=True, text=True, check=True
+        )
+        runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    return {
+        "runs": repeats,
+        "cold_start_seconds_median": round(statistics.median(r["cold_start_seconds"] for r in runs), 4),
+        "load_seconds_median": round(statistics.median(r["load_seconds"] for r in runs), 4),
+        "first_prediction_ms_median": round(statistics.median(r["first_prediction_seconds"] for r in runs) * 1000, 3),
+        "max_rss_mb_median": round(statistics.median(r["max_rss_mb"] for r in runs), 1),
+        "torch_imported": runs[0]["torch_imported"],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold start and RSS benchmark of the inference backends.")
+    parser.add_argument("--repeats", type=int, default=5, help="Fresh processes per backend.")
+    parser.add_argument("--output", type=str, default="reports/backend_benchmark_report.yaml", help="YAML report path.")
+    cli_args = parser.parse_args()
+
+    results = {}
+    for backend in ("torch", "numpy"):
+        log.info(f"--- Benchmark backend: {backend} ---")
+        results[backend] = measure_backend(backend, cli_args.repeats)
+        log.info(f"✔ {backend}: {results[backend]}")
+
+    report_data = {
+        "benchmark_id": "credit_scoring-inference_backends",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python_version": sys.version.split()[0],
+        "backends": results,
+    }
+    report_path = Path(cli_args.output)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        yaml.dump(report_data, f, indent=2, sort_keys=False)
+    log.info(f"✔ Benchmark report saved locally to {report_path}")
+
+"""
+execute benchmark (requires `python -m src.inference.export` first):
+python -m src.benchmark.backends --repeats 5
+"""
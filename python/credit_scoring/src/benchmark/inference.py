@@ -0,0 +1,273 @@
+"""
+inference.py: latency / throughput benchmark of the credit scoring service.
+
+1. For every model version in `models/`, single-row and batched latency of `CreditRiskPredictor`
+   (encoding + forward + postprocessing, cache disabled) and of the raw `CreditScoringModel` (forward only).
+2. In-process load test of the FastAPI app through an ASGI client (concurrent `/mlp_demo` requests).
+
+The `timing_metrics` listed under `evaluation_params` of each training YAML are filled in per version.
+"""
+
+import os
+import sys
+import time
+import yaml
+import torch
+import asyncio
+import argparse
+import numpy as np
+import logging as log
+from pathlib import Path
+from collections import Counter
+from typing import Dict, Any, List, Sequence
+from datetime import datetime, timezone
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from src.training.model import CreditScoringModel
+from src.server.schemas import CreditRiskInput, SexEnum, HousingEnum, SavingAccountsEnum, CheckingAccountEnum, PurposeEnum
+from src.inference.predictor import CreditRiskPredictor, PREPROCESSOR_PATH, build_registry
+from src.core.config import settings
+
+log.basicConfig(level=log.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+DEFAULT_BATCH_SIZES = [1, 32, 256, 1024]
+
+
+def synthetic_payloads(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Distinct applicant payloads (API aliases, plain values) so the prediction cache never answers them.
+    """
+    rng = np.random.default_rng(seed)
+
+    def choice(enum) -> List[str]:
+        return rng.choice([member.value for member in enum], size=n).tolist()
+
+    sexes, housing, savings = choice(SexEnum), choice(HousingEnum), choice(SavingAccountsEnum)
+    checking, purposes = choice(CheckingAccountEnum), choice(PurposeEnum)
+    return [
+        {
+            "Age": int(rng.integers(19, 76)),
+            "Sex": sexes[i],
+            "Job": int(rng.integers(0, 4)),
+            "Housing": housing[i],
+            "Saving accounts": savings[i],
+            "Checking account": checking[i],
+            "Credit amount": round(float(rng.uniform(250, 18500)), 2),
+            "Duration": int(rng.integers(4, 73)),
+            "Purpose": purposes[i],
+        }
+        for i in range(n)
+    ]
+
+
+def summarize_latencies(timings: Sequence[float], rows_per_call: int = 1) -> Dict[str, float]:
+    """
+    Mean / percentile latency (ms) and row throughput of a list of timings in seconds.
+    """
+    timings = np.asarray(timings, dtype=np.float64)
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+    return {
+        "mean_ms": round(float(timings.mean()) * 1000, 4),
+        "p50_ms": round(float(p50) * 1000, 4),
+        "p95_ms": round(float(p95) * 1000, 4),
+        "p99_ms": round(float(p99) * 1000, 4),
+        "throughput_rows_per_s": round(rows_per_call / float(timings.mean()), 1),
+    }
+
+
+def _time_calls(fn, repeats: int, warmup: int = 3) -> List[float]:
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _training_params(config_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """model_name -> training YAML params."""
+    params_by_model = {}
+    for config_path in sorted(config_dir.glob("*.yaml")):
+        with open(config_path, 'r') as f:
+            params = yaml.safe_load(f)
+        model_name = params.get('model_config', {}).get('model_name')
+        if model_name:
+            params_by_model[model_name] = params
+    return params_by_model
+
+
+def load_raw_model(model_path: Path, model_config: Dict[str, Any]) -> CreditScoringModel:
+    """
+    Eager `CreditScoringModel` (BatchNorm / Dropout modules, no folding) with the trained weights.
+    """
+    model = CreditScoringModel(**model_config)
+    model.load_state_dict(torch.load(model_path, map_location=torch.device('cpu')))
+    return model.eval()
+
+
+def benchmark_version(model_path: Path, model_config: Dict[str, Any], backend: str, batch_sizes: Sequence[int],
+                      repeats: int, eval_batch_size: int = 1, timing_metrics: Sequence[str] = ()) -> Dict[str, Any]:
+    """
+    Latency of the predictor and of the raw model for each batch size, on the same applicants.
+    """
+    benchmark_start = time.perf_counter()
+    predictor = CreditRiskPredictor(
+        model_path=model_path,
+        preprocessor_path=PREPROCESSOR_PATH,
+        model_config=model_config,
+        chunk_size=max(max(batch_sizes), eval_batch_size),
+        backend=backend
+    )
+    raw_model = load_raw_model(model_path, model_config)
+    inputs = [CreditRiskInput(**payload) for payload in synthetic_payloads(max(max(batch_sizes), eval_batch_size))]
+
+    def profile(batch_size: int) -> Dict[str, Dict[str, float]]:
+        batch = inputs[:batch_size]
+        features = torch.from_numpy(predictor.encoder.encode_inputs(batch))
+
+        def raw_forward():
+            with torch.no_grad():
+                torch.sigmoid(raw_model(features))
+
+        return {
+            "predictor": summarize_latencies(_time_calls(lambda: predictor.predict_batch(batch), repeats), batch_size),
+            "raw_model": summarize_latencies(_time_calls(raw_forward, repeats), batch_size),
+        }
+
+    latency = {batch_size: profile(batch_size) for batch_size in batch_sizes}
+    for batch_size, row in latency.items():
+        log.info(
+            f"✔ {model_path.name} | batch={batch_size:>5} | predictor p50 {row['predictor']['p50_ms']:.4f} ms "
+            f"| raw model p50 {row['raw_model']['p50_ms']:.4f} ms"
+        )
+
+    # timing metrics declared in the training YAML, measured at its evaluation batch size
+    evaluation = latency[eval_batch_size] if eval_batch_size in latency else profile(eval_batch_size)
+    measured = {
+        "average_inference_time": evaluation["raw_model"]["mean_ms"],
+        "average_processing_time": evaluation["predictor"]["mean_ms"],
+        "total_benchmark_time": round(time.perf_counter() - benchmark_start, 3),
+    }
+    return {
+        "model": model_path.name,
+        "backend": predictor.backend.name,
+        "timing_metrics": {
+            "unit": "ms (total_benchmark_time: s)",
+            "evaluation_batch_size": eval_batch_size,
+            **{name: measured[name] for name in timing_metrics if name in measured},
+        },
+        "latency": latency,
+    }
+
+
+async def load_test(total_requests: int, concurrency: int, seed: int = 1) -> Dict[str, Any]:
+    """
+    Runs the FastAPI app in process (lifespan included) and sends `total_requests` distinct
+    `/mlp_demo` requests from `concurrency` concurrent clients.
+    """
+    import httpx
+    from src.server.app import app
+
+    payloads = synthetic_payloads(total_requests, seed=seed)
+    latencies: List[float] = []
+    status_codes: Counter = Counter()
+    next_index = iter(range(total_requests))
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            deadline = time.monotonic() + 120
+            while (await client.get("/readyz")).status_code != 200:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("El servicio no estuvo listo a tiempo para el load test.")
+                await asyncio.sleep(0.1)
+            model_version = (await client.get("/readyz")).json()["model_version"]
+
+            async def worker():
+                for i in next_index:
+                    start = time.perf_counter()
+                    response = await client.post("/mlp_demo", json=payloads[i])
+                    elapsed = time.perf_counter() - start
+                    status_codes[response.status_code] += 1
+                    if response.status_code == 200:
+                        latencies.append(elapsed)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            wall_time = time.perf_counter() - start
+
+    return {
+        "model_version": model_version,
+        "requests": total_requests,
+        "concurrency": concurrency,
+        "batching_enabled": settings.BATCHING_ENABLED,
+        "status_codes": {int(code): count for code, count in sorted(status_codes.items())},
+        "wall_time_s": round(wall_time, 3),
+        "throughput_rps": round(total_requests / wall_time, 1),
+        # per-request latency of the successful requests (throughput is the aggregate above)
+        "latency": {k: v for k, v in summarize_latencies(latencies).items() if k.endswith("_ms")} if latencies else None,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Latency / throughput benchmark of the credit scoring predictor, raw model and API.")
+    parser.add_argument("--versions", type=str, default="", help="Comma separated model versions (default: every version in models/).")
+    parser.add_argument("--backend", type=str, default=settings.INFERENCE_BACKEND, choices=["torch", "torch_int8", "numpy"], help="Predictor backend.")
+    parser.add_argument("--batch-sizes", type=str, default=",".join(map(str, DEFAULT_BATCH_SIZES)), help="Comma separated batch sizes.")
+    parser.add_argument("--repeats", type=int, default=100, help="Timed runs per batch size.")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests of the API load test.")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients of the API load test.")
+    parser.add_argument("--skip-load-test", action="store_true", help="Only benchmark the predictor and the raw model.")
+    parser.add_argument("--output", type=str, default="reports/inference_benchmark_report.yaml", help="YAML report path.")
+    cli_args = parser.parse_args()
+
+    available = build_registry().available_versions()
+    versions = [v for v in cli_args.versions.split(",") if v] or sorted(available)
+    unknown = [v for v in versions if v not in available]
+    if unknown:
+        log.error(f"✘ Versiones de modelo desconocidas: {unknown}. Disponibles: {sorted(available)}")
+        sys.exit(1)
+
+    batch_sizes = [int(b) for b in cli_args.batch_sizes.split(",")]
+    training_params = _training_params(Path(settings.TRAINING_CONFIG_DIR))
+    report_data: Dict[str, Any] = {
+        "benchmark_id": "credit_scoring-inference",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python_version": sys.version.split()[0],
+        "torch_version": str(torch.__version__),
+        "torch_threads": torch.get_num_threads(),
+        "repeats": cli_args.repeats,
+        "versions": {},
+    }
+
+    for version in versions:
+        log.info(f"--- Benchmark versión: {version} ---")
+        entry = available[version]
+        evaluation_params = training_params.get(entry["model_path"].name, {}).get("evaluation_params", {})
+        report_data["versions"][version] = benchmark_version(
+            model_path=entry["model_path"],
+            model_config=entry["model_config"],
+            backend=cli_args.backend,
+            batch_sizes=batch_sizes,
+            repeats=cli_args.repeats,
+            eval_batch_size=evaluation_params.get("batch_size", 1),
+            timing_metrics=evaluation_params.get("timing_metrics", [])
+        )
+
+    if not cli_args.skip_load_test:
+        log.info(f"--- Load test: {cli_args.requests} solicitudes, concurrencia {cli_args.concurrency} ---")
+        report_data["load_test"] = asyncio.run(load_test(cli_args.requests, cli_args.concurrency))
+        log.info(f"✔ Load test: {report_data['load_test']}")
+
+    report_path = Path(cli_args.output)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        yaml.dump(report_data, f, indent=2, sort_keys=False)
+    log.info(f"✔ Benchmark report saved locally to {report_path}")
+
+"""
+execute benchmark:
+python -m src.benchmark.inference --repeats 100 --requests 2000 --concurrency 32
+"""
@@ -0,0 +1,151 @@
+"""
+quantization.py: fp32 vs dynamic int8 comparison of CreditScoringModel on CPU.
+
+1. Accuracy parity on the validation split produced by CreditScoringModelTraining.
+2. Latency / throughput for batch sizes 1 ... 4096.
+"""
+
+import os
+import sys
+import math
+import time
+import yaml
+import torch
+import joblib
+import argparse
+import statistics
+import numpy as np
+import logging as log
+from pathlib import Path
+from typing import Dict, Any, List
+from datetime import datetime, timezone
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from src.training.train import CreditScoringModelTraining, setup_logging
+from src.inference.export import load_model_from_config
+from src.inference.quantization import quantize_dynamic_int8
+
+DEFAULT_BATCH_SIZES = [2 ** i for i in range(13)]  # 1 ... 4096
+
+
+def _probabilities(model: torch.nn.Module, x: torch.Tensor) -> np.ndarray:
+    with torch.no_grad():
+        return torch.sigmoid(model(x)).view(-1).numpy()
+
+
+def accuracy_parity(trainer: CreditScoringModelTraining, fp32_model: torch.nn.Module, int8_model: torch.nn.Module) -> Dict[str, Any]:
+    """
+    Scores the validation split with both models and compares their metrics and probabilities.
+    """
+    _, df_val = trainer._load_and_split_data()
+    preprocessor = joblib.load(Path("models") / trainer.preprocessor_filename)
+    x_val, y_val = trainer.data_preprocessor.process_data(df_val, preprocessor)
+    x_val = torch.tensor(x_val, dtype=torch.float32)
+    y_val = y_val.values
+
+    prob_fp32 = _probabilities(fp32_model, x_val)
+    prob_int8 = _probabilities(int8_model, x_val)
+    metrics_fp32 = trainer._compute_metrics(y_val, prob_fp32)
+    metrics_int8 = trainer._compute_metrics(y_val, prob_int8)
+
+    return {
+        "validation_rows": int(len(y_val)),
+        "fp32_metrics": {k: round(float(v), 4) for k, v in metrics_fp32.items() if not math.isnan(v)},
+        "int8_metrics": {k: round(float(v), 4) for k, v in metrics_int8.items() if not math.isnan(v)},
+        "accuracy_drop": round(float(metrics_fp32["accuracy"] - metrics_int8["accuracy"]), 4),
+        "prediction_agreement": round(float(np.mean((prob_fp32 >= 0.5) == (prob_int8 >= 0.5))), 4),
+        "max_probability_diff": round(float(np.max(np.abs(prob_fp32 - prob_int8))), 6),
+        "mean_probability_diff": round(float(np.mean(np.abs(prob_fp32 - prob_int8))), 6),
+    }
+
+
+def latency_profile(model: torch.nn.Module, num_features: int, batch_sizes: List[int], repeats: int) -> Dict[int, Dict[str, float]]:
+    """
+    Median latency and throughput of the forward pass (+ sigmoid) for each batch size.
+    """
+    results = {}
+    for batch_size in batch_sizes:
+        x = torch.randn(batch_size, num_features)
+        for _ in range(3):  # warm-up
+            _probabilities(model, x)
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            _probabilities(model, x)
+            timings.append(time.perf_counter() - start)
+        median = statistics.median(timings)
+        results[batch_size] = {
+            "latency_ms": round(median * 1000, 4),
+            "throughput_rows_per_s": round(batch_size / median, 1),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    setup_logging()
+    parser = argparse.ArgumentParser(description="fp32 vs dynamic int8 benchmark for the credit scoring MLP.")
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="config/training/credit_scoring-training_config-german_credit_risk_v130.yaml",
+        help="Training YAML config of the model to benchmark."
+    )
+    parser.add_argument("--batch-sizes", type=str, default=",".join(map(str, DEFAULT_BATCH_SIZES)), help="Comma separated batch sizes.")
+    parser.add_argument("--repeats", type=int, default=50, help="Timed runs per batch size.")
+    parser.add_argument("--max-accuracy-drop", type=float, default=0.01, help="Maximum accepted accuracy drop of int8 vs fp32.")
+    parser.add_argument("--skip-parity", action="store_true", help="Only run the latency comparison.")
+    cli_args = parser.parse_args()
+
+    config_path = Path(cli_args.config)
+    fp32_model, model_path, num_features = load_model_from_config(config_path)
+    int8_model = quantize_dynamic_int8(fp32_model)
+    log.info(f"✔ Modelo {model_path.name} cuantizado (torch threads: {torch.get_num_threads()}).")
+
+    report_data: Dict[str, Any] = {
+        "benchmark_id": f"{config_path.stem}-int8_quantization",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "model": model_path.name,
+        "torch_version": torch.__version__,
+        "quantized_engine": torch.backends.quantized.engine,
+        "torch_threads": torch.get_num_threads(),
+    }
+
+    parity_ok = True
+    if not cli_args.skip_parity:
+        log.info("--- Accuracy parity (validation split) ---")
+        trainer = CreditScoringModelTraining(config_path)
+        parity = accuracy_parity(trainer, fp32_model, int8_model)
+        parity_ok = parity["accuracy_drop"] <= cli_args.max_accuracy_drop
+        parity["passed"] = parity_ok
+        report_data["accuracy_parity"] = parity
+        log.info(f"✔ Paridad: {parity}")
+
+    log.info("--- Latency / throughput ---")
+    batch_sizes = [int(b) for b in cli_args.batch_sizes.split(",")]
+    fp32_latency = latency_profile(fp32_model, num_features, batch_sizes, cli_args.repeats)
+    int8_latency = latency_profile(int8_model, num_features, batch_sizes, cli_args.repeats)
+    report_data["latency"] = {
+        batch_size: {
+            "fp32": fp32_latency[batch_size],
+            "int8": int8_latency[batch_size],
+            "speedup": round(fp32_latency[batch_size]["latency_ms"] / int8_latency[batch_size]["latency_ms"], 3),
+        }
+        for batch_size in batch_sizes
+    }
+    for batch_size, row in report_data["latency"].items():
+        log.info(f"✔ batch={batch_size:>5} | fp32 {row['fp32']['latency_ms']:.4f} ms | int8 {row['int8']['latency_ms']:.4f} ms | speedup x{row['speedup']}")
+
+    report_path = Path("reports") / f"{config_path.stem}_quantization_report.yaml"
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        yaml.dump(report_data, f, indent=2, sort_keys=False)
+    log.info(f"✔ Quantization report saved locally to {report_path}")
+
+    if not parity_ok:
+        log.error(f"✘ La caída de accuracy int8 supera {cli_args.max_accuracy_drop}.")
+        sys.exit(1)
+
+"""
+execute benchmark:
+python -m src.benchmark.quantization --config config/training/credit_scoring-training_config-german_credit_risk_v130.yaml
+"""
@@ -0,0 +1,159 @@
+"""
+training_speed.py: epoch time of CreditScoringModel training, fp32 vs bf16 autocast x eager vs torch.compile.
+
+Every mode trains a fresh model from the same seed on the split of the training YAML (tensor cache included)
+for `--epochs` epochs, with the training loop of train.py, and reports:
+1. the effective precision / compile after fallbacks,
+2. the compile time, the first epoch time and the median of the remaining epochs,
+3. the speedup of the median epoch vs fp32 eager and the validation loss / AUC reached.
+
+The German dataset is tiny; `--replicate N` tiles the training split N times so the timings approach those
+of the larger internal datasets (the validation split is left as is).
+"""
+
+import os
+import sys
+import copy
+import time
+import yaml
+import torch
+import mlflow
+import argparse
+import platform
+import statistics
+import logging as log
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List
+from datetime import datetime, timezone
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from src.training.train import CreditScoringModelTraining, setup_logging
+from src.training.data_pipeline import build_train_loader
+from src.training.acceleration import compile_for_training
+
+# mode -> training_params.acceleration
+TRAINING_MODES: Dict[str, Dict[str, Any]] = {
+    "fp32_eager": {"precision": "fp32", "compile": False},
+    "bf16_eager": {"precision": "bf16", "compile": False},
+    "fp32_compile": {"precision": "fp32", "compile": True},
+    "bf16_compile": {"precision": "bf16", "compile": True},
+}
+
+
+def time_training_mode(params: Dict[str, Any], mode: str, tensors: Dict[str, torch.Tensor], epochs: int,
+                       checkpoint_dir: Path) -> Dict[str, Any]:
+    """
+    Trains `epochs` epochs in `mode` (early stopping disabled, validation on the last epoch only).
+    """
+    params = copy.deepcopy(params)
+    train_params = params["training_params"]
+    train_params["acceleration"] = {**train_params.get("acceleration", {}), **TRAINING_MODES[mode]}
+    train_params.update({"epochs": epochs, "eval_every_n_epochs": epochs})
+    train_params["early_stopping"] = {**train_params["early_stopping"], "patience": epochs + 1}
+    trainer = CreditScoringModelTraining(params=params)
+    trainer.checkpoint_path = checkpoint_dir / f"{mode}.pt"
+
+    x_train, y_train = tensors["x_train"], tensors["y_train"]
+    x_val, y_val = tensors["x_val"].to(trainer.device), tensors["y_val"].to(trainer.device)
+    model = trainer._build_model(x_train.shape[1])
+    criterion = trainer._setup_loss_function(y_train)
+    optimizer = trainer._build_optimizer(model)
+    scheduler = trainer._build_scheduler(optimizer)
+    started = time.perf_counter()
+    forward_model = compile_for_training(model, trainer.acceleration_cfg, criterion, x_train[:trainer.batch_size].to(trainer.device),
+                                         y_train[:trainer.batch_size].to(trainer.device), trainer.device)
+    compile_seconds = time.perf_counter() - started if forward_model is not model else 0.0
+    train_loader = build_train_loader(x_train, y_train, trainer.batch_size, trainer.data_loader_cfg, seed=trainer.random_state)
+
+    with mlflow.start_run(run_name=f"{trainer.mlflow_project_name}-training_speed-{mode}", nested=True):
+        mlflow.log_params({"mode": mode, "precision": trainer.acceleration_cfg["precision"], "compile": forward_model is not model,
+                           "train_rows": len(x_train), "epochs": epochs})
+        trainer._run_training_loop(model, criterion, optimizer, scheduler, train_loader, x_val, y_val, forward_model=forward_model)
+
+    epoch_times = trainer.epoch_times
+    steady = epoch_times[1:] or epoch_times
+    return {
+        "precision": trainer.acceleration_cfg["precision"],
+        "compiled": forward_model is not model,
+        "compile_seconds": round(compile_seconds, 3),
+        "first_epoch_seconds": round(epoch_times[0], 4),
+        "median_epoch_seconds": round(statistics.median(steady), 4),
+        "rows_per_second": round(len(x_train) / statistics.median(steady), 1),
+        "final_val_loss": round(trainer.history["val_loss"][-1], 4),
+        "final_val_auc": round(trainer.history["val_auc"][-1], 4),
+    }
+
+
+if __name__ == "__main__":
+    setup_logging()
+    parser = argparse.ArgumentParser(description="Epoch time of fp32 / bf16 autocast x eager / torch.compile training.")
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="config/training/credit_scoring-training_config-german_credit_risk_v130.yaml",
+        help="Training YAML config (data, architecture, optimizer)."
+    )
+    parser.add_argument("--modes", type=str, default=",".join(TRAINING_MODES), help="Comma separated training modes.")
+    parser.add_argument("--epochs", type=int, default=5, help="Timed epochs per mode (the first one is reported apart).")
+    parser.add_argument("--replicate", type=int, default=1, help="Times the training split is tiled to emulate a larger dataset.")
+    cli_args = parser.parse_args()
+
+    config_path = Path(cli_args.config)
+    with open(config_path, "r") as f:
+        base_params = yaml.safe_load(f)
+    modes: List[str] = cli_args.modes.split(",")
+    unknown = set(modes) - set(TRAINING_MODES)
+    if unknown:
+        raise ValueError(f"Unknown training modes: {sorted(unknown)} (use {', '.join(TRAINING_MODES)}).")
+
+    base_trainer = CreditScoringModelTraining(params=base_params)
+    arrays, _ = base_trainer._split_and_preprocess()
+    tensors = {name: torch.from_numpy(array) for name, array in arrays.items()}
+    if cli_args.replicate > 1:
+        tensors["x_train"] = tensors["x_train"].repeat(cli_args.replicate, 1)
+        tensors["y_train"] = tensors["y_train"].repeat(cli_args.replicate, 1)
+    log.info(f"✔ {len(tensors['x_train'])} training rows (x{cli_args.replicate}), torch threads: {torch.get_num_threads()}")
+
+    report_data: Dict[str, Any] = {
+        "benchmark_id": f"{config_path.stem}-training_speed",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "torch_version": str(torch.__version__),
+        "device": str(base_trainer.device),
+        "processor": platform.processor() or platform.machine(),
+        "torch_threads": torch.get_num_threads(),
+        "train_rows": len(tensors["x_train"]),
+        "replicate": cli_args.replicate,
+        "batch_size": base_trainer.batch_size,
+        "hidden_layers": base_trainer.hidden_layers,
+        "epochs": cli_args.epochs,
+        "modes": {},
+    }
+
+    mlflow.set_experiment(base_trainer.mlflow_project_name)
+    with mlflow.start_run(run_name=f"{config_path.stem}-training_speed"), TemporaryDirectory() as checkpoint_dir:
+        for mode in modes:
+            log.info(f"--- {mode} ---")
+            report_data["modes"][mode] = time_training_mode(base_params, mode, tensors, cli_args.epochs, Path(checkpoint_dir))
+
+        baseline = report_data["modes"].get("fp32_eager")
+        for mode, row in report_data["modes"].items():
+            if baseline is not None:
+                row["speedup_vs_fp32_eager"] = round(baseline["median_epoch_seconds"] / row["median_epoch_seconds"], 3)
+            log.info(
+                f"✔ {mode:>12} | {row['precision']} compiled={row['compiled']} | epoch {row['median_epoch_seconds']:.4f}s "
+                f"(first {row['first_epoch_seconds']:.4f}s) | speedup x{row.get('speedup_vs_fp32_eager', 'n/a')} | "
+                f"val_loss {row['final_val_loss']:.4f}"
+            )
+
+        report_path = Path("reports") / f"{config_path.stem}_training_speed_report.yaml"
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            yaml.dump(report_data, f, indent=2, sort_keys=False)
+        mlflow.log_artifact(str(report_path), artifact_path="reports")
+        log.info(f"✔ Training speed report saved locally to {report_path}")
+
+"""
+execute benchmark:
+python -m src.benchmark.training_speed --config config/training/credit_scoring-training_config-german_credit_risk_v130.yaml --replicate 50
+"""
@@ -0,0 +1,102 @@
+# src/core/config.py
+
+import os
+from typing import Optional
+
+
+def _get_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _get_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _get_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+def _get_str(name: str, default: str) -> str:
+    value = os.getenv(name)
+    return value.strip() if value not in (None, "") else default
+
+
+def _available_cores() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))  # respects CPU pinning / container cpusets
+    return os.cpu_count() or 1
+
+
+class Settings:
+    """
+    Service configuration read from environment variables.
+    Every value has a default so the service runs locally without a .env file.
+    """
+    def __init__(self):
+        # Production server (src/server/serve.py)
+        self.SERVER_WORKERS: int = _get_int("WEB_CONCURRENCY", 2)
+        self.SERVER_KEEP_ALIVE_SECONDS: int = _get_int("SERVER_KEEP_ALIVE_SECONDS", 5)
+
+        # Model registry
+        self.MODEL_VERSION: str = _get_str("MODEL_VERSION", "v1.3.0")
+        self.MODELS_DIR: str = _get_str("MODELS_DIR", "models")
+        self.TRAINING_CONFIG_DIR: str = _get_str("TRAINING_CONFIG_DIR", "config/training")
+        self.ADMIN_TOKEN: str = _get_str("ADMIN_TOKEN", "")  # admin endpoints are disabled when empty
+
+        # Shadow scoring: comma separated versions scored in the background against the active one
+        self.SHADOW_MODEL_VERSIONS: list = [v.strip() for v in _get_str("SHADOW_MODEL_VERSIONS", "").split(",") if v.strip()]
+        self.SHADOW_QUEUE_MAX_SIZE: int = _get_int("SHADOW_QUEUE_MAX_SIZE", 256)
+
+        # Metrics (GET /metrics, Prometheus text format)
+        self.METRICS_ENABLED: bool = _get_bool("METRICS_ENABLED", True)
+
+        # Logging: records go through a queue and are written by a background thread
+        self.LOG_LEVEL: str = _get_str("LOG_LEVEL", "INFO").upper()
+        self.LOG_FORMAT: str = _get_str("LOG_FORMAT", "json").lower()  # json | text
+        self.LOG_QUEUE_MAX_SIZE: int = _get_int("LOG_QUEUE_MAX_SIZE", 10000)  # records beyond this are dropped
+        self.LOG_REQUEST_SAMPLE_RATE: float = _get_float("LOG_REQUEST_SAMPLE_RATE", 0.01)  # share of /mlp_demo requests logged
+
+        # Inference
+        self.MODEL_BUNDLE_ENABLED: bool = _get_bool("MODEL_BUNDLE_ENABLED", True)  # models/<model>.bundle (checksummed, one read)
+        self.SHARED_ARTIFACTS_ENABLED: bool = _get_bool("SHARED_ARTIFACTS_ENABLED", False)  # mmap models/<model>.shared.bin
+        self.INFERENCE_BACKEND: str = _get_str("INFERENCE_BACKEND", "torch")  # torch | torch_int8 | numpy
+        # calibration + decision threshold of models/<model>.calibration.json; PREDICTION_THRESHOLD overrides the threshold
+        self.CALIBRATION_ENABLED: bool = _get_bool("CALIBRATION_ENABLED", True)
+        threshold = _get_str("PREDICTION_THRESHOLD", "")
+        self.PREDICTION_THRESHOLD: Optional[float] = float(threshold) if threshold else None
+
+        # Inference executor: blocking encoding + forward passes run in this pool, never on the event loop
+        self.INFERENCE_THREADS: int = _get_int("INFERENCE_THREADS", 2)
+        self.INFERENCE_MAX_PENDING: int = _get_int("INFERENCE_MAX_PENDING", 256)  # 429 beyond this
+        # intra-op threads per forward pass so that INFERENCE_THREADS x TORCH_NUM_THREADS ~= available cores
+        self.TORCH_NUM_THREADS: int = _get_int("TORCH_NUM_THREADS", max(1, _available_cores() // max(1, self.INFERENCE_THREADS)))
+
+        # Prediction cache
+        self.PREDICTION_CACHE_ENABLED: bool = _get_bool("PREDICTION_CACHE_ENABLED", True)
+        self.PREDICTION_CACHE_MAX_SIZE: int = _get_int("PREDICTION_CACHE_MAX_SIZE", 4096)
+        self.PREDICTION_CACHE_TTL_SECONDS: float = _get_float("PREDICTION_CACHE_TTL_SECONDS", 3600.0)
+
+        # Drift monitoring (GET /monitoring/drift): live inputs vs. the training reference statistics (PSI / KS)
+        self.DRIFT_MONITORING_ENABLED: bool = _get_bool("DRIFT_MONITORING_ENABLED", True)
+        self.DRIFT_MIN_SAMPLES: int = _get_int("DRIFT_MIN_SAMPLES", 500)  # rows before a drift status is reported
+
+        # Explanations (/mlp_demo/explain): integrated gradients steps and per-applicant cache (0 = disabled)
+        self.EXPLAIN_STEPS: int = _get_int("EXPLAIN_STEPS", 32)
+        self.EXPLANATION_CACHE_MAX_SIZE: int = _get_int("EXPLANATION_CACHE_MAX_SIZE", 1024)
+
+        # Micro-batching (/mlp_demo)
+        self.BATCHING_ENABLED: bool = _get_bool("BATCHING_ENABLED", True)
+        self.BATCH_MAX_SIZE: int = _get_int("BATCH_MAX_SIZE", 32)
+        self.BATCH_MAX_WAIT_MS: float = _get_float("BATCH_MAX_WAIT_MS", 5.0)
+
+        # Batch endpoint (/mlp_demo/batch)
+        self.PREDICT_CHUNK_SIZE: int = _get_int("PREDICT_CHUNK_SIZE", 1024)
+        self.BATCH_ENDPOINT_MAX_ITEMS: int = _get_int("BATCH_ENDPOINT_MAX_ITEMS", 10000)
+
+
+settings = Settings()
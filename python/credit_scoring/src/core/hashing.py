@@ -0,0 +1,15 @@
+"""
+hashing.py: content hashes of artifact and dataset files, shared by the serving bundle and the training caches.
+"""
+
+import hashlib
+from pathlib import Path
+
+
+def file_sha256(path: Path) -> str:
+    """sha256 hex digest of the file contents, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,154 @@
+"""
+metrics.py: in-process counters and histograms exposed in the Prometheus text format (`GET /metrics`).
+
+Kept dependency-free: observing is a lock + a bisect over the bucket bounds, and it is skipped
+entirely when `METRICS_ENABLED=false`.
+"""
+
+import os
+import sys
+import math
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.core.config import settings
+
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096, 16384)
+
+
+def _format_labels(labelnames: Sequence[str], labelvalues: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter, optionally labelled."""
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0):
+        if not REGISTRY.enabled:
+            return
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        with self._lock:
+            return self._values.get(labelvalues, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labelvalues, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram, optionally labelled."""
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float] = LATENCY_BUCKETS, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.labelnames = tuple(labelnames)
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str):
+        if not REGISTRY.enabled:
+            return
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labelvalues: str) -> int:
+        with self._lock:
+            series = self._series.get(labelvalues)
+            return series[2] if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labelvalues, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                    cumulative += bucket_count
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labelvalues, le)} {cumulative}")
+                labels = _format_labels(self.labelnames, labelvalues)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Metrics of the process plus callbacks that report gauges (cache size, queue depth...) at scrape time.
+    """
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: List = []
+        self._gauge_callbacks: List[Tuple[str, str, Sequence[str], Callable[[], Iterable[Tuple[Tuple[str, ...], float]]]]] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_gauge(self, name: str, documentation: str, callback: Callable[[], Iterable[Tuple[Tuple[str, ...], float]]],
+                       labelnames: Sequence[str] = ()):
+        """`callback` returns (labelvalues, value) pairs; it is only called when /metrics is scraped."""
+        self._gauge_callbacks = [entry for entry in self._gauge_callbacks if entry[0] != name]
+        self._gauge_callbacks.append((name, documentation, tuple(labelnames), callback))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for name, documentation, labelnames, callback in self._gauge_callbacks:
+            lines.extend([f"# HELP {name} {documentation}", f"# TYPE {name} gauge"])
+            for labelvalues, value in callback():
+                lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry(enabled=settings.METRICS_ENABLED)
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "credit_scoring_http_requests_total", "HTTP requests by route and status code.", ("route", "status")))
+HTTP_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "credit_scoring_http_request_duration_seconds",
+    "End-to-end request latency (body validation, handler and response serialization).", labelnames=("route",)))
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "credit_scoring_inference_stage_seconds",
+    "Latency of each inference stage: cache_lookup, queue_wait, encode, forward, drift, postprocess, request_log.", labelnames=("stage",)))
+FORWARD_BATCH_ROWS = REGISTRY.register(Histogram(
+    "credit_scoring_forward_batch_rows", "Rows per forward pass.", buckets=SIZE_BUCKETS))
+MICROBATCH_REQUESTS = REGISTRY.register(Histogram(
+    "credit_scoring_microbatch_requests", "Requests grouped into each micro-batch of /mlp_demo.", buckets=SIZE_BUCKETS))
+PREDICTIONS = REGISTRY.register(Counter(
+    "credit_scoring_predictions_total", "Predictions served by label and source (model or cache).", ("prediction", "source")))
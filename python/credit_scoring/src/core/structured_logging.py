@@ -0,0 +1,137 @@
+"""
+structured_logging.py: non-blocking, structured logging for the API processes.
+
+Request threads only put records on a bounded queue; a background `QueueListener` formats them
+(JSON lines or plain text) and writes them to stdout. When the queue is full the record is dropped
+and counted instead of blocking the request.
+"""
+
+import sys
+import copy
+import json
+import queue
+import random
+import logging
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
+
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line. Structured values passed as `extra={"fields": {...}}` become top-level keys.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "pid": record.process,
+            "message": record.getMessage(),
+        }
+        payload.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """The repo's usual text format, with the structured fields appended as JSON."""
+    def __init__(self):
+        super().__init__(TEXT_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = getattr(record, "fields", None)
+        return f"{line} {json.dumps(fields, ensure_ascii=False, default=str)}" if fields else line
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks the caller: records that do not fit are counted in `dropped`.
+    Only the message interpolation happens in the calling thread; formatting and I/O happen in the listener.
+    """
+    def __init__(self, record_queue: queue.Queue):
+        super().__init__(record_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # args may be mutated after the call returns, so the message is resolved here
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _LoggingState:
+    handler: Optional[NonBlockingQueueHandler] = None
+    listener: Optional[QueueListener] = None
+    replaced_handlers: List[logging.Handler] = []
+    previous_level: int = logging.INFO
+
+
+def configure_logging(level: str = "INFO", log_format: str = "json", queue_max_size: int = 10000) -> NonBlockingQueueHandler:
+    """
+    Routes the root logger through a bounded queue drained by a background thread.
+    The console handlers installed by `logging.basicConfig` are replaced (and restored by `shutdown_logging`).
+    """
+    if log_format not in ("json", "text"):
+        raise ValueError(f"Formato de log no soportado: {log_format} (usa json o text).")
+    shutdown_logging()
+    root = logging.getLogger()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter() if log_format == "json" else TextFormatter())
+
+    record_queue: queue.Queue = queue.Queue(maxsize=max(1, queue_max_size))
+    handler = NonBlockingQueueHandler(record_queue)
+    listener = QueueListener(record_queue, stream_handler, respect_handler_level=False)
+
+    # basicConfig console handlers (exact StreamHandler) write synchronously to stderr
+    _LoggingState.replaced_handlers = [h for h in root.handlers if type(h) is logging.StreamHandler]
+    for replaced in _LoggingState.replaced_handlers:
+        root.removeHandler(replaced)
+    _LoggingState.previous_level = root.level
+    root.addHandler(handler)
+    root.setLevel(level)
+    listener.start()
+
+    _LoggingState.handler, _LoggingState.listener = handler, listener
+    return handler
+
+
+def shutdown_logging():
+    """
+    Flushes the queued records, stops the listener and restores the previous handlers.
+    """
+    if _LoggingState.listener is None:
+        return
+    root = logging.getLogger()
+    root.removeHandler(_LoggingState.handler)
+    _LoggingState.listener.stop()
+    for replaced in _LoggingState.replaced_handlers:
+        root.addHandler(replaced)
+    root.setLevel(_LoggingState.previous_level)
+    _LoggingState.handler, _LoggingState.listener, _LoggingState.replaced_handlers = None, None, []
+
+
+def dropped_records() -> int:
+    """Records dropped because the logging queue was full (0 when logging is not configured)."""
+    return _LoggingState.handler.dropped if _LoggingState.handler is not None else 0
+
+
+def sample(rate: float) -> bool:
+    """True for a `rate` share of the calls (1.0 = always, 0.0 = never)."""
+    return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
@@ -0,0 +1,72 @@
+"""
+artifacts.py: paths of the serving artifacts derived from the trained `.pt` weights.
+This module must not import torch so the NumPy backend can use it.
+"""
+
+from pathlib import Path
+
+
+def frozen_model_path(model_path: Path) -> Path:
+    """
+    Path of the frozen TorchScript graph saved next to the `.pt` weights.
+    models/<name>.pt -> models/<name>.torchscript.pt
+    """
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}.torchscript.pt")
+
+
+def numpy_weights_path(model_path: Path) -> Path:
+    """
+    Path of the folded NumPy weights saved next to the `.pt` weights.
+    models/<name>.pt -> models/<name>.npz
+    """
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}.npz")
+
+
+def shared_artifacts_path(model_path: Path) -> Path:
+    """
+    Path of the memory-mappable serving file (encoder tables + folded weights) shared by worker processes.
+    models/<name>.pt -> models/<name>.shared.bin
+    """
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}.shared.bin")
+
+
+def bundle_path(model_path: Path) -> Path:
+    """
+    Path of the versioned model bundle (architecture + weights + encoder tables + calibration, checksummed).
+    models/<name>.pt -> models/<name>.bundle
+    """
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}.bundle")
+
+
+def calibration_path(model_path: Path) -> Path:
+    """
+    Path of the probability calibration and decision threshold fitted on the validation split.
+    models/<name>.pt -> models/<name>.calibration.json
+    """
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}.calibration.json")
+
+
+def reference_stats_path(model_path: Path) -> Path:
+    """
+    Path of the training-data reference statistics used by the drift monitor.
+    models/<name>.pt -> models/<name>.reference_stats.json
+    """
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}.reference_stats.json")
+
+
+def is_up_to_date(derived_path: Path, source_path: Path) -> bool:
+    """
+    True when `derived_path` exists and is not older than `source_path` (if the source exists).
+    """
+    derived_path, source_path = Path(derived_path), Path(source_path)
+    if not derived_path.exists():
+        return False
+    if not source_path.exists():
+        return True
+    return derived_path.stat().st_mtime >= source_path.stat().st_mtime
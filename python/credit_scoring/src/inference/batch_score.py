@@ -0,0 +1,201 @@
+"""
+batch_score.py: offline bulk scoring of an applicant portfolio (CSV or Parquet).
+
+The input file is read in fixed-size chunks, so memory stays bounded regardless of the file size.
+Each chunk is encoded with the compiled preprocessor (vectorized, same output as
+`preprocessor.transform`) and scored in forward passes of `--forward-chunk-size` rows; optionally
+chunks are spread over a process pool. The output keeps the input
+columns and adds `prediction` and `probability`, in the input order.
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import logging as log
+from pathlib import Path
+from collections import deque
+from typing import Iterator, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.inference.predictor import CreditRiskPredictor, PREPROCESSOR_PATH, BEST_MODEL_CONFIG
+from src.inference.registry import ModelRegistry
+from src.core.config import settings
+
+log.basicConfig(level=log.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# dataset index column written by pandas when the CSV was exported
+_INDEX_COLUMN = "Unnamed: 0"
+
+# predictor of each pool worker, built once by the initializer
+_worker_predictor: Optional[CreditRiskPredictor] = None
+
+
+def read_chunks(input_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Streams the input file as DataFrames of at most `chunk_size` rows.
+    """
+    suffix = input_path.suffix.lower()
+    if suffix == ".csv":
+        for chunk in pd.read_csv(input_path, chunksize=chunk_size):
+            yield chunk.drop(columns=[_INDEX_COLUMN], errors="ignore")
+    elif suffix in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Leer Parquet requiere pyarrow (`pip install pyarrow`).")
+        for batch in pq.ParquetFile(input_path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas().drop(columns=[_INDEX_COLUMN], errors="ignore")
+    else:
+        raise ValueError(f"Formato de entrada no soportado: {input_path.suffix} (usa .csv o .parquet).")
+
+
+class OutputWriter:
+    """
+    Appends scored chunks to a CSV or Parquet file without keeping previous chunks in memory.
+    """
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self.suffix = output_path.suffix.lower()
+        if self.suffix not in (".csv", ".parquet", ".pq"):
+            raise ValueError(f"Formato de salida no soportado: {output_path.suffix} (usa .csv o .parquet).")
+        self._parquet_writer = None
+        self._rows = 0
+
+    def write(self, chunk: pd.DataFrame):
+        if self.suffix == ".csv":
+            chunk.to_csv(self.output_path, mode="w" if self._rows == 0 else "a", header=self._rows == 0, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.output_path, table.schema)
+            self._parquet_writer.write_table(table.cast(self._parquet_writer.schema))
+        self._rows += len(chunk)
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+def build_batch_predictor(version: str, backend: str, forward_chunk_size: int, torch_threads: int = 0) -> CreditRiskPredictor:
+    """
+    Predictor of a model version from `models/` (architecture from its training YAML), without cache.
+    """
+    registry = ModelRegistry(
+        models_dir=Path(settings.MODELS_DIR),
+        config_dir=Path(settings.TRAINING_CONFIG_DIR),
+        num_features=BEST_MODEL_CONFIG['num_features'],
+        predictor_factory=None  # only used to resolve the version
+    )
+    versions = registry.available_versions()
+    if version not in versions:
+        raise ValueError(f"Versión de modelo desconocida: {version}. Disponibles: {sorted(versions)}")
+    return CreditRiskPredictor(
+        model_path=versions[version]["model_path"],
+        preprocessor_path=PREPROCESSOR_PATH,
+        model_config=versions[version]["model_config"],
+        chunk_size=forward_chunk_size,
+        backend=backend,
+        torch_threads=torch_threads
+    )
+
+
+def _init_worker(version: str, backend: str, forward_chunk_size: int, torch_threads: int):
+    global _worker_predictor
+    log.getLogger().setLevel(log.WARNING)
+    _worker_predictor = build_batch_predictor(version, backend, forward_chunk_size, torch_threads)
+
+
+def _score(predictor: CreditRiskPredictor, chunk: pd.DataFrame, threshold: Optional[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calibrated probabilities and 'good' mask; without `threshold` the model's calibrated threshold is used.
+    """
+    probabilities = predictor.predict_proba_frame(chunk)
+    return probabilities, probabilities >= (predictor.threshold if threshold is None else threshold)
+
+
+def _score_in_worker(chunk: pd.DataFrame, threshold: Optional[float]) -> Tuple[np.ndarray, np.ndarray]:
+    return _score(_worker_predictor, chunk, threshold)
+
+
+def _with_predictions(chunk: pd.DataFrame, scores: Tuple[np.ndarray, np.ndarray]) -> pd.DataFrame:
+    probabilities, good = scores
+    chunk = chunk.copy()
+    chunk["prediction"] = np.where(good, "good", "bad")
+    chunk["probability"] = probabilities
+    return chunk
+
+
+def score_file(input_path: Path, output_path: Path, version: str, backend: str = "torch", chunk_size: int = 100_000,
+               forward_chunk_size: int = 8192, workers: int = 0, threshold: Optional[float] = None) -> int:
+    """
+    Scores `input_path` into `output_path` and returns the number of scored rows.
+    Each read chunk is scored in forward passes of `forward_chunk_size` rows (bounded activations).
+    With `workers > 0`, at most `2 * workers` chunks are in flight so memory stays bounded.
+    """
+    writer = OutputWriter(output_path)
+    rows = 0
+    start = time.perf_counter()
+    try:
+        if workers > 0:
+            cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+            torch_threads = max(1, cores // workers)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(version, backend, forward_chunk_size, torch_threads)) as pool:
+                pending = deque()
+                for chunk in read_chunks(input_path, chunk_size):
+                    pending.append((chunk, pool.submit(_score_in_worker, chunk, threshold)))
+                    if len(pending) >= 2 * workers:
+                        done_chunk, future = pending.popleft()
+                        writer.write(_with_predictions(done_chunk, future.result()))
+                        rows += len(done_chunk)
+                while pending:
+                    done_chunk, future = pending.popleft()
+                    writer.write(_with_predictions(done_chunk, future.result()))
+                    rows += len(done_chunk)
+        else:
+            predictor = build_batch_predictor(version, backend, forward_chunk_size)
+            for chunk in read_chunks(input_path, chunk_size):
+                writer.write(_with_predictions(chunk, _score(predictor, chunk, threshold)))
+                rows += len(chunk)
+                log.info(f"✔ {rows} filas puntuadas.")
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    log.info(f"✔ {rows} filas puntuadas en {elapsed:.2f} s ({rows / elapsed if elapsed else 0:.0f} filas/s) -> {output_path}")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline bulk scoring of a credit applicant portfolio (CSV or Parquet).")
+    parser.add_argument("--input", type=str, required=True, help="Applicant file with the german_credit_risk.csv columns (.csv or .parquet).")
+    parser.add_argument("--output", type=str, required=True, help="Output file (.csv or .parquet).")
+    parser.add_argument("--version", type=str, default="v1.3.0", help="Model version in models/.")
+    parser.add_argument("--backend", type=str, default="torch", choices=["torch", "torch_int8", "numpy"], help="Inference backend.")
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="Rows read, encoded and scored at a time.")
+    parser.add_argument("--forward-chunk-size", type=int, default=8192, help="Rows per forward pass.")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 = score in this process).")
+    parser.add_argument("--threshold", type=float, default=None, help="Probability threshold for 'good' (default: the calibrated threshold of the model).")
+    cli_args = parser.parse_args()
+
+    score_file(
+        input_path=Path(cli_args.input),
+        output_path=Path(cli_args.output),
+        version=cli_args.version,
+        backend=cli_args.backend,
+        chunk_size=cli_args.chunk_size,
+        forward_chunk_size=cli_args.forward_chunk_size,
+        workers=cli_args.workers,
+        threshold=cli_args.threshold
+    )
+
+"""
+execute bulk scoring:
+python -m src.inference.batch_score --input portfolio.csv --output scored.parquet --workers 4
+"""
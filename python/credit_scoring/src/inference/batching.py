@@ -0,0 +1,162 @@
+"""
+batching.py: asyncio micro-batcher that groups concurrent requests into a single vectorized prediction.
+"""
+
+import asyncio
+import logging as log
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+
+class MicroBatcher:
+    """
+    Collects concurrent requests during a short window and resolves them with one call to `predict_batch_fn`.
+
+    A batch is flushed as soon as it reaches `max_batch_size` items or `max_wait_ms`
+    milliseconds after its first item arrived, whichever happens first. Batches run in `executor`
+    (the loop's default executor when None), up to `max_concurrent_batches` at a time (size it to the
+    executor's threads; 1 by default); while every slot is busy new requests keep queueing and join the next batch. `on_batch`, if given, receives the queue wait (seconds) of every
+    request of each batch before it is scored.
+    """
+    def __init__(self, predict_batch_fn: Callable[[List[Any]], List[Any]], max_batch_size: int = 32, max_wait_ms: float = 5.0,
+                 executor: Optional[Executor] = None, on_batch: Optional[Callable[[List[float]], None]] = None,
+                 max_concurrent_batches: int = 1):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size debe ser >= 1.")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms debe ser >= 0.")
+        if max_concurrent_batches < 1:
+            raise ValueError("max_concurrent_batches debe ser >= 1.")
+
+        self.predict_batch_fn = predict_batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.executor = executor
+        self.on_batch = on_batch
+        self.max_concurrent_batches = max_concurrent_batches
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self):
+        """
+        Start the background worker. Must be called from inside the running event loop.
+        """
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+        log.info(
+            f"✔ Micro-batcher iniciado (max_batch_size={self.max_batch_size}, max_wait_ms={self.max_wait * 1000:.1f}, "
+            f"max_concurrent_batches={self.max_concurrent_batches})"
+        )
+
+    async def stop(self):
+        """
+        Stop the worker, cancel the batches in flight and fail every request still waiting in the queue.
+        """
+        if self._worker is None:
+            return
+        tasks = [self._worker, *self._in_flight]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+        self._in_flight.clear()
+
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("El micro-batcher se detuvo antes de procesar la solicitud."))
+        log.info("✔ Micro-batcher detenido.")
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Enqueue one item and wait for its individual result.
+        """
+        if not self.is_running:
+            raise RuntimeError("El micro-batcher no está en ejecución.")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put_nowait((item, future, loop.time()))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[Any, asyncio.Future, float]]:
+        """
+        Wait for the first item, then keep collecting until the batch is full or the window closes.
+        """
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            # drain what is already queued without yielding to the loop
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # a batch is only closed once a slot is free, so requests arriving meanwhile join it
+            await self._slots.acquire()
+            try:
+                batch = await self._collect_batch()
+            except BaseException:
+                self._slots.release()
+                raise
+
+            # requests whose client already went away are not scored
+            batch = [(item, future, enqueued_at) for item, future, enqueued_at in batch if not future.done()]
+            if not batch:
+                self._slots.release()
+                continue
+
+            if self.on_batch is not None:
+                now = loop.time()
+                self.on_batch([now - enqueued_at for _, _, enqueued_at in batch])
+            task = loop.create_task(self._score_batch([(item, future) for item, future, _ in batch]))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _score_batch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """
+        Scores one batch in the executor and resolves the future of each request; always frees its slot.
+        """
+        loop = asyncio.get_running_loop()
+        items = [item for item, _ in batch]
+        try:
+            # blocking preprocessing + forward pass runs outside the event loop
+            results = await loop.run_in_executor(self.executor, self.predict_batch_fn, items)
+            if len(results) != len(items):
+                raise RuntimeError(f"predict_batch devolvió {len(results)} resultados para {len(items)} solicitudes.")
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            log.error(f"✘ Error al procesar un lote de {len(items)} solicitudes: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._slots.release()
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,149 @@
+"""
+bundle.py: single versioned file with everything needed to serve one model version.
+
+`models/<name>.bundle` holds, in the memory-mappable layout of `shared_artifacts.py`:
+- the architecture (`CreditScoringModel.get_model_info()`) the weights belong to,
+- the trained state dict (eager model: int8 quantization, explanations) and the BatchNorm-folded weights (serving),
+- the compiled encoder tables and the sha256 of the preprocessor they were compiled from,
+- the calibration map and decision threshold,
+- the reference statistics of the training data (drift monitoring),
+- a sha256 checksum of the header and of every array, verified when the bundle is opened.
+
+The predictor opens it with a single `np.memmap` instead of `torch.load` + `joblib.load` + the calibration JSON.
+This module must not import torch so the NumPy backend can use it.
+"""
+
+import os
+import sys
+import numpy as np
+import logging as log
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.core.hashing import file_sha256
+from src.inference.encoder import CompiledFeatureEncoder
+from src.inference.numpy_backend import NumpyMLP
+from src.inference.calibration import ProbabilityCalibrator
+from src.inference.shared_artifacts import (
+    encoder_header, encoder_from_header, content_checksum, write_mapped_file, map_file, folded_model_from_arrays
+)
+
+_MAGIC = b"GENIABDL"
+BUNDLE_FORMAT_VERSION = 1
+_STATE_PREFIX = "state/"
+# keys of get_model_info() that define the architecture (the rest are derived counters)
+ARCHITECTURE_KEYS = ("num_features", "hidden_layers", "dropout_rate", "use_batch_norm", "activation_fn")
+
+
+def model_config_from_info(model_info: Dict[str, Any]) -> Dict[str, Any]:
+    """`CreditScoringModel` constructor arguments from `get_model_info()`."""
+    return {
+        "num_features": model_info["num_features"],
+        "hidden_layers": list(model_info["architecture"]["hidden_layers"]),
+        "dropout_rate": model_info["dropout_rate"],
+        "use_batch_norm": model_info["use_batch_norm"],
+        "activation_fn": model_info["activation_fn"],
+    }
+
+
+class ModelBundle:
+    """
+    Opened bundle. Array attributes are zero-copy views of the mapping.
+    """
+    def __init__(self, path: Path, header: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self.path = Path(path)
+        self.header = header
+        self.model_info: Dict[str, Any] = header["model_info"]
+        self.model_config = model_config_from_info(self.model_info)
+        self.preprocessor_sha256: str = header["preprocessor"]["sha256"]
+        self.checksum: str = header["checksum"]
+        self.encoder: CompiledFeatureEncoder = encoder_from_header(header["encoder"])
+        folded = header["folded_model"]
+        self.folded_model: NumpyMLP = folded_model_from_arrays(arrays, folded["num_layers"], folded["activation_fn"])
+        self.calibrator: Optional[ProbabilityCalibrator] = (
+            ProbabilityCalibrator.from_dict(header["calibration"]) if header.get("calibration") else None
+        )
+        self.reference_stats: Optional[Dict[str, Any]] = header.get("reference_stats")
+        self._state_arrays = {name[len(_STATE_PREFIX):]: array for name, array in arrays.items() if name.startswith(_STATE_PREFIX)}
+
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Trained (unfolded) state dict as torch tensors, for the eager `CreditScoringModel`.
+        """
+        import torch
+        # copies: load_state_dict copies anyway and torch warns on read-only buffers
+        return {name: torch.tensor(np.array(array)) for name, array in self._state_arrays.items()}
+
+    def check_model_config(self, model_config: Dict[str, Any]):
+        """
+        Raises ValueError when `model_config` (e.g. from the training YAML) describes another architecture.
+        """
+        mismatched = {
+            key: (model_config[key], self.model_config[key])
+            for key in ARCHITECTURE_KEYS
+            if key in model_config and model_config[key] != self.model_config[key]
+        }
+        if mismatched:
+            raise ValueError(f"La arquitectura configurada no coincide con la del bundle {self.path} (configurada, bundle): {mismatched}")
+
+
+def save_model_bundle(path: Path, model_info: Dict[str, Any], state_dict: Dict[str, np.ndarray], folded_model: NumpyMLP,
+                      encoder: CompiledFeatureEncoder, preprocessor_path: Path,
+                      calibrator: Optional[ProbabilityCalibrator] = None,
+                      reference_stats: Optional[Dict[str, Any]] = None) -> Path:
+    """
+    Writes the bundle. `state_dict` maps parameter/buffer names to NumPy arrays.
+    """
+    if encoder.num_features != model_info["num_features"] or folded_model.num_features != model_info["num_features"]:
+        raise ValueError(
+            f"El preprocesador genera {encoder.num_features} features, pero el modelo espera {model_info['num_features']}."
+        )
+    arrays: Dict[str, np.ndarray] = {}
+    for i, (w_t, b) in enumerate(zip(folded_model.weights_t, folded_model.biases)):
+        arrays[f"weight_t_{i}"] = np.ascontiguousarray(w_t, dtype=np.float32)
+        arrays[f"bias_{i}"] = np.ascontiguousarray(b, dtype=np.float32)
+    for name, array in state_dict.items():
+        arrays[_STATE_PREFIX + name] = np.ascontiguousarray(array)
+
+    preprocessor_path = Path(preprocessor_path)
+    header: Dict[str, Any] = {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "model_info": model_info,
+        "preprocessor": {"filename": preprocessor_path.name, "sha256": file_sha256(preprocessor_path)},
+        "encoder": encoder_header(encoder),
+        "folded_model": {"num_layers": len(folded_model.weights_t), "activation_fn": folded_model.activation_fn},
+        "calibration": calibrator.to_dict() if calibrator is not None else None,
+        "reference_stats": reference_stats,
+    }
+    header = write_mapped_file(path, _MAGIC, header, arrays, with_checksum=True)
+    log.info(f"✔ Bundle del modelo guardado en: {path} (sha256 {header['checksum'][:12]})")
+    return Path(path)
+
+
+def load_model_bundle(path: Path, preprocessor_path: Optional[Path] = None, writable: bool = False,
+                      verify: bool = True) -> ModelBundle:
+    """
+    Opens a bundle with a single mapping.
+    - `verify`: recomputes the checksum (rejects truncated or corrupted files).
+    - `preprocessor_path`: when the file exists, it must be the preprocessor the bundle was built with.
+    - `writable`: copy-on-write mapping, needed when torch wraps the folded weights.
+    Raises ValueError when any check fails.
+    """
+    header, arrays = map_file(path, _MAGIC, writable=writable)
+    if header.get("format_version") != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Versión de formato de bundle no soportada en {path}: {header.get('format_version')}")
+    if verify:
+        checksum = content_checksum(header, (arrays[entry["name"]] for entry in header["arrays"]))
+        if checksum != header.get("checksum"):
+            raise ValueError(f"Checksum inválido en el bundle {path}: el archivo está corrupto o incompleto.")
+    if preprocessor_path is not None and Path(preprocessor_path).exists():
+        expected = header["preprocessor"]["sha256"]
+        if file_sha256(preprocessor_path) != expected:
+            raise ValueError(
+                f"El preprocesador {preprocessor_path} no corresponde al bundle {path} "
+                f"(construido con {header['preprocessor']['filename']}, sha256 {expected[:12]})."
+            )
+    return ModelBundle(path, header, arrays)
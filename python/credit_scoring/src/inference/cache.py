@@ -0,0 +1,91 @@
+"""
+cache.py: bounded LRU/TTL cache of predictions keyed on the validated applicant features.
+"""
+
+import time
+import threading
+from enum import Enum
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+def canonical_key(input_data: Any) -> Tuple:
+    """
+    Canonical, hashable key of a validated `CreditRiskInput`: (field, value) pairs sorted by field,
+    enums reduced to their value and numbers to float, so equal payloads always share a key
+    regardless of field order or alias usage (e.g. 35 and 35.0 are the same applicant).
+    """
+    items = []
+    for name, value in input_data:
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = float(value)
+        items.append((name, value))
+    return tuple(sorted(items))
+
+
+class PredictionCache:
+    """
+    Thread-safe LRU cache with optional TTL.
+
+    Each predictor owns its caches, so entries never outlive the artifacts that produced them:
+    loading a new model version (or reloading the same one) builds a predictor with empty caches.
+    """
+    def __init__(self, max_size: int = 4096, ttl_seconds: float = 0.0):
+        if max_size < 1:
+            raise ValueError("max_size debe ser >= 1.")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return dict(value)
+
+    def put(self, key: Hashable, value: Dict[str, Any]):
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else 0.0
+        with self._lock:
+            self._entries[key] = (expires_at, dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -0,0 +1,136 @@
+"""
+calibration.py: probability calibration (Platt / isotonic) and decision threshold of a trained model.
+
+Fitted on the validation split by the training pipeline and saved as `models/<model>.calibration.json`
+next to the `.pt` weights. Applying it only needs NumPy (no sklearn, no torch at serving time).
+"""
+
+import json
+import numpy as np
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+CALIBRATION_METHODS = ("platt", "isotonic", "none")
+THRESHOLD_CRITERIA = ("youden", "f1")
+
+_EPSILON = 1e-7
+
+
+def _logit(probabilities: np.ndarray) -> np.ndarray:
+    clipped = np.clip(probabilities, _EPSILON, 1.0 - _EPSILON)
+    return np.log(clipped / (1.0 - clipped))
+
+
+class ProbabilityCalibrator:
+    """
+    Maps raw model probabilities of 'good' to calibrated probabilities and holds the decision threshold.
+    - platt: p' = sigmoid(slope * logit(p) + intercept)
+    - isotonic: piecewise-linear interpolation of the fitted non-decreasing steps (clipped at the ends)
+    - none: identity (only the threshold is used)
+    """
+    def __init__(self, method: str = "none", threshold: float = 0.5, slope: float = 1.0, intercept: float = 0.0,
+                 x_thresholds: Optional[Sequence[float]] = None, y_thresholds: Optional[Sequence[float]] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        if method not in CALIBRATION_METHODS:
+            raise ValueError(f"Método de calibración no soportado: {method} (usa {', '.join(CALIBRATION_METHODS)}).")
+        if not 0.0 < threshold < 1.0:
+            raise ValueError(f"El umbral de decisión debe estar en (0, 1): {threshold}")
+        self.method = method
+        self.threshold = float(threshold)
+        self.slope = float(slope)
+        self.intercept = float(intercept)
+        self.x_thresholds = np.asarray(x_thresholds if x_thresholds is not None else [], dtype=np.float64)
+        self.y_thresholds = np.asarray(y_thresholds if y_thresholds is not None else [], dtype=np.float64)
+        if method == "isotonic" and (len(self.x_thresholds) == 0 or len(self.x_thresholds) != len(self.y_thresholds)):
+            raise ValueError("La calibración isotónica requiere x_thresholds e y_thresholds del mismo largo.")
+        self.metadata = dict(metadata or {})
+
+    def apply(self, probabilities: np.ndarray) -> np.ndarray:
+        """
+        Calibrated probabilities, same shape and dtype as the input.
+        """
+        probabilities = np.asarray(probabilities)
+        if self.method == "none":
+            return probabilities
+        if self.method == "platt":
+            calibrated = 1.0 / (1.0 + np.exp(-(self.slope * _logit(probabilities.astype(np.float64)) + self.intercept)))
+        else:
+            calibrated = np.interp(probabilities, self.x_thresholds, self.y_thresholds)
+        return calibrated.astype(probabilities.dtype, copy=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "threshold": self.threshold,
+            "slope": self.slope,
+            "intercept": self.intercept,
+            "x_thresholds": self.x_thresholds.tolist(),
+            "y_thresholds": self.y_thresholds.tolist(),
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProbabilityCalibrator":
+        return cls(**data)
+
+    def save(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "ProbabilityCalibrator":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def optimal_threshold(y_true: np.ndarray, y_prob: np.ndarray, criterion: str = "youden") -> float:
+    """
+    Decision threshold from the validation curves:
+    - youden: ROC point maximizing TPR - FPR.
+    - f1: precision-recall point maximizing F1.
+    """
+    from sklearn.metrics import roc_curve, precision_recall_curve
+    if criterion == "youden":
+        fpr, tpr, thresholds = roc_curve(y_true, y_prob)
+        # the first ROC threshold is +inf (nothing predicted positive)
+        best = int(np.argmax((tpr - fpr)[1:])) + 1
+        threshold = thresholds[best]
+    elif criterion == "f1":
+        precision, recall, thresholds = precision_recall_curve(y_true, y_prob)
+        # the last precision/recall point has no threshold
+        f1 = 2 * precision[:-1] * recall[:-1] / np.maximum(precision[:-1] + recall[:-1], _EPSILON)
+        threshold = thresholds[int(np.argmax(f1))]
+    else:
+        raise ValueError(f"Criterio de umbral no soportado: {criterion} (usa {', '.join(THRESHOLD_CRITERIA)}).")
+    return float(np.clip(threshold, _EPSILON, 1.0 - _EPSILON))
+
+
+def fit_calibrator(y_true: np.ndarray, y_prob: np.ndarray, method: str = "platt",
+                   threshold_criterion: str = "youden") -> ProbabilityCalibrator:
+    """
+    Fits the calibration map on (labels, raw probabilities) and picks the threshold on the calibrated probabilities.
+    """
+    y_true = np.asarray(y_true).reshape(-1)
+    y_prob = np.asarray(y_prob, dtype=np.float64).reshape(-1)
+    if method == "platt":
+        from sklearn.linear_model import LogisticRegression
+        regression = LogisticRegression(C=1e6)  # practically unregularized, as in Platt scaling
+        regression.fit(_logit(y_prob).reshape(-1, 1), y_true)
+        calibrator = ProbabilityCalibrator("platt", slope=regression.coef_[0, 0], intercept=regression.intercept_[0])
+    elif method == "isotonic":
+        from sklearn.isotonic import IsotonicRegression
+        regression = IsotonicRegression(out_of_bounds="clip", y_min=0.0, y_max=1.0)
+        regression.fit(y_prob, y_true)
+        calibrator = ProbabilityCalibrator("isotonic", x_thresholds=regression.X_thresholds_, y_thresholds=regression.y_thresholds_)
+    elif method == "none":
+        calibrator = ProbabilityCalibrator("none")
+    else:
+        raise ValueError(f"Método de calibración no soportado: {method} (usa {', '.join(CALIBRATION_METHODS)}).")
+
+    calibrated = calibrator.apply(y_prob)
+    calibrator.threshold = optimal_threshold(y_true, calibrated, threshold_criterion)
+    calibrator.metadata = {"threshold_criterion": threshold_criterion, "fitted_rows": int(len(y_true))}
+    return calibrator
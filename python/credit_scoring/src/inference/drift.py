@@ -0,0 +1,268 @@
+"""
+drift.py: streaming monitoring of the live input distribution against the training data.
+
+`reference_statistics` summarizes the training split at training time (`models/<model>.reference_stats.json`,
+also embedded in the model bundle):
+- numerical features: mean / std and the counts of quantile bins (edges in original units),
+- categorical features: counts per fitted category plus unknown values.
+
+Missing values reach the encoder in two spellings: NaN in the training data (the category fitted on NaN) and
+the API's "NA" (`SavingAccountsEnum.na`), which is not a fitted category and leaves the block at zero, as in
+`preprocessor.transform`. For features with a NaN category the report counts unknown values under "NA" on both
+sides, so missing values are bucketed the same way at training and serving without changing the encoding.
+
+`DriftMonitor.update` folds every encoded batch into fixed-size sketches (running mean / variance, counts over
+the reference bins, category counts): memory does not grow with traffic and the update is a handful of
+vectorized NumPy operations on the float32 buffer the forward pass already uses. `report` compares the sketches
+with the reference with the Population Stability Index (PSI) and, for numerical features, the
+Kolmogorov-Smirnov distance between the binned CDFs.
+This module must not import torch so the NumPy backend can use it.
+"""
+
+import json
+import threading
+import numpy as np
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_BINS = 10
+# PSI < 0.1: stable, 0.1 - 0.25: moderate shift, >= 0.25: significant shift
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+_EPSILON = 1e-4
+_MISSING_LABEL = "NA"
+_UNKNOWN_LABEL = "__unknown__"
+
+
+def psi(expected_counts: np.ndarray, actual_counts: np.ndarray) -> float:
+    """
+    Population Stability Index between two count vectors over the same bins (empty bins smoothed).
+    """
+    expected = np.maximum(np.asarray(expected_counts, dtype=np.float64) / max(np.sum(expected_counts), 1), _EPSILON)
+    actual = np.maximum(np.asarray(actual_counts, dtype=np.float64) / max(np.sum(actual_counts), 1), _EPSILON)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def ks_distance(expected_counts: np.ndarray, actual_counts: np.ndarray) -> float:
+    """
+    Kolmogorov-Smirnov statistic between the CDFs of two count vectors over the same ordered bins.
+    """
+    expected = np.cumsum(expected_counts, dtype=np.float64) / max(np.sum(expected_counts), 1)
+    actual = np.cumsum(actual_counts, dtype=np.float64) / max(np.sum(actual_counts), 1)
+    return float(np.max(np.abs(actual - expected)))
+
+
+def drift_status(value: float) -> str:
+    if value >= PSI_SIGNIFICANT:
+        return "significant"
+    return "moderate" if value >= PSI_MODERATE else "stable"
+
+
+def _category_label(value: Any) -> str:
+    return _MISSING_LABEL if value is None or (isinstance(value, float) and np.isnan(value)) else str(value)
+
+
+def _missing_position(values: List[Any]) -> Optional[int]:
+    """Index of the category fitted on missing values (NaN), if any."""
+    labels = [_category_label(value) for value in values]
+    return labels.index(_MISSING_LABEL) if _MISSING_LABEL in labels else None
+
+
+def _fold_unknown_into_missing(counts: np.ndarray, missing: Optional[int]) -> np.ndarray:
+    """Counts with the unknown bucket (last) moved into the missing category."""
+    counts = np.array(counts, dtype=np.int64)
+    if missing is not None:
+        counts[missing] += counts[-1]
+        counts[-1] = 0
+    return counts
+
+
+def _standardized_edges(edges: List[np.ndarray], means: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """
+    (features, max_edges) matrix of bin edges in the standardized units of the encoded buffer, padded with +inf.
+    Binning the encoded values directly keeps training and serving on the same float32 rounding (integer
+    features such as Job sit exactly on their edges).
+    """
+    matrix = np.full((len(edges), max((len(e) for e in edges), default=0)), np.inf)
+    for j, (feature_edges, mean, scale) in enumerate(zip(edges, means, scales)):
+        matrix[j, :len(feature_edges)] = (np.asarray(feature_edges, dtype=np.float64) - mean) / scale
+    return matrix
+
+
+def _bin_indices(numeric: np.ndarray, edge_matrix: np.ndarray) -> np.ndarray:
+    """(n, features) bin index per value: number of edges <= value (same as searchsorted side='right')."""
+    return (numeric[:, :, None] >= edge_matrix).sum(axis=2)
+
+
+def reference_statistics(encoder: "CompiledFeatureEncoder", features: np.ndarray, bins: int = DEFAULT_BINS) -> Dict[str, Any]:
+    """
+    Reference statistics of the (n, num_features) encoded training matrix produced by `encoder`'s preprocessor.
+    Numerical bins are the inner quantiles of the training values (duplicates merged for discrete features).
+    """
+    features = np.asarray(features)
+    n_numeric = len(encoder.numerical_features)
+    raw = features[:, :n_numeric].astype(np.float64) * encoder.scales + encoder.means
+
+    edges = [np.unique(np.quantile(raw[:, j], np.linspace(0, 1, bins + 1)[1:-1])) for j in range(n_numeric)]
+    indices = _bin_indices(features[:, :n_numeric].astype(np.float64), _standardized_edges(edges, encoder.means, encoder.scales))
+
+    numerical = {}
+    for j, name in enumerate(encoder.numerical_features):
+        column = raw[:, j]
+        counts = np.bincount(indices[:, j], minlength=len(edges[j]) + 1)
+        numerical[name] = {
+            "mean": float(column.mean()),
+            "std": float(column.std()),
+            "edges": edges[j].tolist(),
+            "counts": counts.tolist(),
+        }
+
+    categorical = {}
+    offset = n_numeric
+    for name, values in zip(encoder.categorical_features, encoder.categories):
+        counts = np.rint(features[:, offset:offset + len(values)].sum(axis=0)).astype(np.int64)
+        categorical[name] = {
+            "categories": [_category_label(value) for value in values],
+            "counts": counts.tolist() + [int(len(features) - counts.sum())],  # last bucket: unknown values
+        }
+        offset += len(values)
+    return {"rows": int(len(features)), "bins": bins, "numerical": numerical, "categorical": categorical}
+
+
+def save_reference_statistics(path: Path, statistics: Dict[str, Any]) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(statistics, f, indent=2)
+    return path
+
+
+def load_reference_statistics(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class DriftMonitor:
+    """
+    Streaming sketches of the encoded inputs scored by one predictor, compared on demand with the reference.
+    Thread safe: the batch statistics are computed outside the lock and merged under it.
+    """
+    def __init__(self, reference: Dict[str, Any], encoder: "CompiledFeatureEncoder", min_samples: int = 500):
+        if list(reference["numerical"]) != list(encoder.numerical_features) or list(reference["categorical"]) != list(encoder.categorical_features):
+            raise ValueError("Las estadísticas de referencia no corresponden a las features del encoder.")
+        for name, values in zip(encoder.categorical_features, encoder.categories):
+            if reference["categorical"][name]["categories"] != [_category_label(value) for value in values]:
+                raise ValueError(f"Las categorías de referencia de '{name}' no corresponden al encoder.")
+        self.reference = reference
+        self.min_samples = min_samples
+        self.numerical_features = list(encoder.numerical_features)
+        self.categorical_features = list(encoder.categorical_features)
+        self._n_numeric = len(self.numerical_features)
+        self._means = encoder.means
+        self._scales = encoder.scales
+
+        edges = [reference["numerical"][name]["edges"] for name in self.numerical_features]
+        self._edge_matrix = _standardized_edges(edges, self._means, self._scales)
+        # all histograms live in one flat array: feature j uses [bin_offsets[j], bin_offsets[j + 1])
+        self._bin_offsets = np.cumsum([0] + [len(feature_edges) + 1 for feature_edges in edges])
+        self._category_sizes = [len(values) for values in encoder.categories]
+        self._missing_positions = [_missing_position(values) for values in encoder.categories]
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            # column sums of the encoded buffer: numerical sums followed by the category counts
+            self._sums = np.zeros(self._n_numeric + sum(self._category_sizes))
+            self._squares = np.zeros(self._n_numeric)
+            self._histogram = np.zeros(int(self._bin_offsets[-1]), dtype=np.int64)
+
+    def update(self, features: np.ndarray):
+        """
+        Adds a (n, num_features) encoded batch to the sketches.
+        """
+        n = len(features)
+        if n == 0:
+            return
+        # numerical values are standardized (mean ~0, std ~1 on the training data), so running
+        # sums and sums of squares in float64 give the mean / variance without cancellation issues
+        sums = features.sum(axis=0, dtype=np.float64)
+        numeric = features[:, :self._n_numeric]
+        squares = np.einsum("ij,ij->j", numeric, numeric, dtype=np.float64)
+        bins = _bin_indices(numeric, self._edge_matrix) + self._bin_offsets[:-1]
+        histogram = np.bincount(bins.ravel(), minlength=len(self._histogram))
+
+        with self._lock:
+            self.count += n
+            self._sums += sums
+            self._squares += squares
+            self._histogram += histogram
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Live statistics, PSI / KS per feature and the overall status (worst feature, or `insufficient_data`).
+        """
+        with self._lock:
+            count = self.count
+            sums, squares, histogram = self._sums.copy(), self._squares.copy(), self._histogram.copy()
+        mean = sums[:self._n_numeric] / max(count, 1)
+        variance = np.maximum(squares / max(count, 1) - np.square(mean), 0.0)
+        category_counts = sums[self._n_numeric:]
+
+        numerical: Dict[str, Any] = {}
+        for j, name in enumerate(self.numerical_features):
+            reference = self.reference["numerical"][name]
+            live = histogram[self._bin_offsets[j]:self._bin_offsets[j + 1]]
+            value = psi(reference["counts"], live) if count else 0.0
+            numerical[name] = {
+                "psi": round(value, 6),
+                "ks": round(ks_distance(reference["counts"], live), 6) if count else 0.0,
+                "status": drift_status(value),
+                "mean": float(mean[j] * self._scales[j] + self._means[j]) if count else None,
+                "std": float(np.sqrt(variance[j]) * self._scales[j]) if count else None,
+                "reference_mean": reference["mean"],
+                "reference_std": reference["std"],
+                "edges": reference["edges"],
+                "counts": live.tolist(),
+                "reference_counts": reference["counts"],
+            }
+
+        categorical: Dict[str, Any] = {}
+        offset = 0
+        for name, size, missing in zip(self.categorical_features, self._category_sizes, self._missing_positions):
+            reference = self.reference["categorical"][name]
+            counts = np.rint(category_counts[offset:offset + size]).astype(np.int64)
+            # the API's "NA" arrives as an unknown value: count it with the NaN category of the training data
+            live = _fold_unknown_into_missing(np.append(counts, count - counts.sum()), missing)
+            reference_counts = _fold_unknown_into_missing(reference["counts"], missing)
+            value = psi(reference_counts, live) if count else 0.0
+            labels: List[str] = reference["categories"] + [_UNKNOWN_LABEL]
+            categorical[name] = {
+                "psi": round(value, 6),
+                "status": drift_status(value),
+                "counts": dict(zip(labels, live.tolist())),
+                "reference_counts": dict(zip(labels, reference_counts.tolist())),
+            }
+            offset += size
+
+        statuses = [entry["status"] for entry in list(numerical.values()) + list(categorical.values())]
+        if count < self.min_samples:
+            status = "insufficient_data"
+        else:
+            status = max(statuses, key=["stable", "moderate", "significant"].index, default="stable")
+        return {
+            "status": status,
+            "rows": count,
+            "min_samples": self.min_samples,
+            "reference_rows": self.reference["rows"],
+            "thresholds": {"psi_moderate": PSI_MODERATE, "psi_significant": PSI_SIGNIFICANT},
+            "numerical": numerical,
+            "categorical": categorical,
+        }
+
+    def psi_values(self) -> Dict[str, float]:
+        """Feature -> PSI (for the Prometheus gauge)."""
+        report = self.report()
+        return {name: entry["psi"] for section in ("numerical", "categorical") for name, entry in report[section].items()}
+
@@ -0,0 +1,151 @@
+"""
+encoder.py: compiled feature encoder that replaces the sklearn ColumnTransformer on the inference hot path.
+"""
+
+import math
+import numpy as np
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+
+# key used in the lookup tables for the category fitted on missing values (NaN)
+_MISSING = object()
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+class CompiledFeatureEncoder:
+    """
+    Reproduces `preprocessor.transform` without pandas or sklearn at call time.
+
+    Built once from the fitted `StandardScaler` (means/scales) and `OneHotEncoder` (categories)
+    of the ColumnTransformer, it writes features straight into a float32 buffer:
+    - numerical columns: (x - mean) / scale, computed in float64 like sklearn and stored as float32.
+    - categorical columns: category -> column index lookup tables. Unknown categories leave
+      the block at zero, exactly like `OneHotEncoder(handle_unknown="ignore")`.
+    """
+    def __init__(self, numerical_features: Sequence[str], means: Sequence[float], scales: Sequence[float],
+                 categorical_features: Sequence[str], categories: Sequence[Sequence[Any]]):
+        self.numerical_features = list(numerical_features)
+        self.categorical_features = list(categorical_features)
+        self.means = np.asarray(means, dtype=np.float64)
+        self.scales = np.asarray(scales, dtype=np.float64)
+        self.categories = [list(values) for values in categories]
+
+        # enum/category -> output column index
+        self.lookup_tables: List[Dict[Any, int]] = []
+        offset = len(self.numerical_features)
+        for values in self.categories:
+            table = {}
+            for position, value in enumerate(values):
+                table[_MISSING if _is_missing(value) else value] = offset + position
+            self.lookup_tables.append(table)
+            offset += len(values)
+        self.num_features = offset
+
+        # Pydantic attribute for each dataset column ('Credit amount' -> 'Credit_amount')
+        self._numerical_attrs = [name.replace(' ', '_') for name in self.numerical_features]
+        self._categorical_attrs = [name.replace(' ', '_') for name in self.categorical_features]
+
+    @classmethod
+    def from_preprocessor(cls, preprocessor: "ColumnTransformer") -> "CompiledFeatureEncoder":
+        """
+        Compile the encoder from the fitted ColumnTransformer saved by the training pipeline.
+        """
+        # sklearn is only needed to compile; workers loading the shared artifacts never import it
+        from sklearn.preprocessing import StandardScaler, OneHotEncoder
+        transformers = {name: (transformer, columns) for name, transformer, columns in preprocessor.transformers_}
+        try:
+            num_pipeline, numerical_features = transformers['num']
+            cat_pipeline, categorical_features = transformers['cat']
+        except KeyError as e:
+            raise ValueError(f"El preprocesador no tiene el transformador esperado: {e}")
+
+        scaler = num_pipeline.named_steps['scaler']
+        onehot = cat_pipeline.named_steps['onehot']
+        if not isinstance(scaler, StandardScaler) or not isinstance(onehot, OneHotEncoder):
+            raise ValueError("El preprocesador debe usar StandardScaler y OneHotEncoder.")
+        if not (scaler.with_mean and scaler.with_std):
+            raise ValueError("El StandardScaler debe usar with_mean=True y with_std=True.")
+        if onehot.drop is not None or onehot.handle_unknown != 'ignore':
+            raise ValueError("El OneHotEncoder debe usar drop=None y handle_unknown='ignore'.")
+
+        output_indices = preprocessor.output_indices_
+        if output_indices['num'].start != 0 or output_indices['cat'].start != len(numerical_features):
+            raise ValueError("El orden de las columnas del preprocesador no es [numéricas, categóricas].")
+        remainder = output_indices.get('remainder')
+        if remainder is not None and remainder.stop > remainder.start:
+            raise ValueError("El preprocesador tiene columnas 'remainder' que el encoder no soporta.")
+
+        return cls(
+            numerical_features=numerical_features,
+            means=scaler.mean_,
+            scales=scaler.scale_,
+            categorical_features=categorical_features,
+            categories=onehot.categories_
+        )
+
+    def _allocate(self, n_rows: int, out: Optional[np.ndarray]) -> np.ndarray:
+        if out is None:
+            return np.zeros((n_rows, self.num_features), dtype=np.float32)
+        if out.shape[0] < n_rows or out.shape[1] != self.num_features or out.dtype != np.float32:
+            raise ValueError(f"El buffer debe ser float32 con forma (>= {n_rows}, {self.num_features}).")
+        buffer = out[:n_rows]
+        buffer.fill(0.0)
+        return buffer
+
+    def _fill(self, buffer: np.ndarray, numeric_rows: List[List[float]], categorical_rows: List[List[Any]]) -> np.ndarray:
+        n_numeric = len(self.numerical_features)
+        if numeric_rows:
+            numeric = np.asarray(numeric_rows, dtype=np.float64).reshape(-1, n_numeric)
+            buffer[:, :n_numeric] = (numeric - self.means) / self.scales
+
+        rows, cols = [], []
+        for row, values in enumerate(categorical_rows):
+            for table, value in zip(self.lookup_tables, values):
+                index = table.get(_MISSING if _is_missing(value) else getattr(value, 'value', value))
+                if index is not None:
+                    rows.append(row)
+                    cols.append(index)
+        buffer[rows, cols] = 1.0
+        return buffer
+
+    def encode_inputs(self, inputs: Sequence[Any], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Encode validated `CreditRiskInput` objects. Returns a (n, num_features) float32 array.
+        """
+        buffer = self._allocate(len(inputs), out)
+        numeric_rows = [[getattr(item, attr) for attr in self._numerical_attrs] for item in inputs]
+        categorical_rows = [[getattr(item, attr) for attr in self._categorical_attrs] for item in inputs]
+        return self._fill(buffer, numeric_rows, categorical_rows)
+
+    def encode_frame(self, df: "pd.DataFrame", out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Vectorized encoding of a DataFrame with the original dataset columns (bulk scoring).
+        Missing values (NaN/None) map to the category fitted on NaN, like in `encode_records`.
+        """
+        buffer = self._allocate(len(df), out)
+        n_numeric = len(self.numerical_features)
+        numeric = df[self.numerical_features].to_numpy(dtype=np.float64)
+        buffer[:, :n_numeric] = (numeric - self.means) / self.scales
+
+        rows = np.arange(len(df))
+        for name, table in zip(self.categorical_features, self.lookup_tables):
+            column = df[name]
+            mapping = {value: index for value, index in table.items() if value is not _MISSING}
+            indices = np.array(column.map(mapping), dtype=np.float64)
+            indices[column.isna().to_numpy()] = table.get(_MISSING, np.nan)
+            known = ~np.isnan(indices)
+            buffer[rows[known], indices[known].astype(np.intp)] = 1.0
+        return buffer
+
+    def encode_records(self, records: Iterable[Mapping[str, Any]], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Encode dicts keyed by the original dataset columns ('Credit amount', 'Saving accounts', ...).
+        """
+        records = list(records)
+        buffer = self._allocate(len(records), out)
+        numeric_rows = [[record[name] for name in self.numerical_features] for record in records]
+        categorical_rows = [[record[name] for name in self.categorical_features] for record in records]
+        return self._fill(buffer, numeric_rows, categorical_rows)
@@ -0,0 +1,59 @@
+"""
+executor.py: dedicated, bounded thread pool for the blocking inference work of the API.
+"""
+
+import threading
+import logging as log
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+
+class InferenceOverloadedError(RuntimeError):
+    """Raised when the inference queue is full; the API answers 429 so clients back off."""
+
+
+class InferenceExecutor(ThreadPoolExecutor):
+    """
+    Thread pool that runs encoding + forward passes outside the asyncio event loop, with admission control.
+
+    `admit()` reserves one of `max_pending` slots for a request for as long as it waits (micro-batcher
+    queue included) or runs; once every slot is taken new requests are rejected immediately instead of
+    piling up on the event loop.
+    """
+    def __init__(self, max_workers: int = 2, max_pending: int = 256):
+        if max_workers < 1:
+            raise ValueError("max_workers debe ser >= 1.")
+        if max_pending < 1:
+            raise ValueError("max_pending debe ser >= 1.")
+        super().__init__(max_workers=max_workers, thread_name_prefix="inference")
+        self.num_threads = max_workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._admission_lock = threading.Lock()
+        log.info(f"✔ Executor de inferencia creado (threads={max_workers}, max_pending={max_pending}).")
+
+    @contextmanager
+    def admit(self):
+        """
+        Holds one pending slot for the duration of the block; raises InferenceOverloadedError when full.
+        """
+        with self._admission_lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise InferenceOverloadedError(f"Cola de inferencia llena ({self.max_pending} solicitudes en curso).")
+            self.pending += 1
+        try:
+            yield
+        finally:
+            with self._admission_lock:
+                self.pending -= 1
+
+    def stats(self):
+        with self._admission_lock:
+            return {
+                "threads": self.num_threads,
+                "pending": self.pending,
+                "max_pending": self.max_pending,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,196 @@
+"""
+export.py: freezes a trained CreditScoringModel into the serving artifacts.
+
+Each BatchNorm1d is folded into the preceding Linear layer and Dropout layers are removed,
+so the exported graphs only run Linear -> activation blocks:
+- models/<name>.torchscript.pt: frozen TorchScript graph (torch backend).
+- models/<name>.npz: folded weights for the pure-NumPy backend.
+- models/<name>.shared.bin: compiled encoder + folded weights in one memory-mappable file, shared
+  by the worker processes of `src.server.serve`.
+- models/<name>.bundle: versioned, checksummed bundle (architecture, trained and folded weights,
+  encoder tables, calibration) that the predictor opens in one read.
+"""
+
+import os
+import sys
+import yaml
+import torch
+import joblib
+import argparse
+import torch.nn as nn
+import logging as log
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from torch.nn.utils.fusion import fuse_linear_bn_eval
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.training.model import CreditScoringModel
+from src.inference.artifacts import frozen_model_path, numpy_weights_path, shared_artifacts_path, bundle_path, calibration_path, reference_stats_path, is_up_to_date
+from src.inference.numpy_backend import NumpyMLP
+from src.inference.encoder import CompiledFeatureEncoder
+from src.inference.shared_artifacts import save_shared_artifacts
+from src.inference.bundle import save_model_bundle
+from src.inference.calibration import ProbabilityCalibrator
+from src.inference.drift import load_reference_statistics
+
+log.basicConfig(level=log.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def fold_batch_norm(model: nn.Module) -> nn.Sequential:
+    """
+    Returns an eval-only copy of `model.network` with every BatchNorm folded into
+    the preceding Linear and without Dropout layers.
+    """
+    layers = list(model.eval().network)
+    fused = []
+    i = 0
+    while i < len(layers):
+        layer = layers[i]
+        if isinstance(layer, nn.Linear) and i + 1 < len(layers) and isinstance(layers[i + 1], nn.BatchNorm1d):
+            fused.append(fuse_linear_bn_eval(layer, layers[i + 1]))
+            i += 2
+            continue
+        if isinstance(layer, nn.BatchNorm1d):
+            raise ValueError(f"BatchNorm en la posición {i} no está precedido por una capa Linear.")
+        if not isinstance(layer, nn.Dropout):
+            fused.append(layer)
+        i += 1
+    return nn.Sequential(*fused).eval()
+
+
+def export_frozen_model(model: nn.Module, output_path: Path, num_features: int, atol: float = 1e-5) -> Path:
+    """
+    Folds, scripts and freezes the model, checks it against the eager model and saves it.
+    """
+    model = model.cpu().eval()
+    fused = fold_batch_norm(model)
+    frozen = torch.jit.freeze(torch.jit.script(fused))
+
+    # parity check against the eager model
+    example = torch.randn(64, num_features)
+    with torch.no_grad():
+        expected = model(example)
+        actual = frozen(example)
+    max_diff = (expected - actual).abs().max().item()
+    if max_diff > atol:
+        raise RuntimeError(f"El grafo congelado difiere del modelo original (max diff={max_diff:.2e}).")
+
+    torch.jit.save(frozen, str(output_path))
+    log.info(f"✔ Grafo TorchScript congelado guardado en: {output_path} (max diff={max_diff:.2e})")
+    return Path(output_path)
+
+
+def fold_to_numpy(model: nn.Module) -> NumpyMLP:
+    """
+    Folded weights of `model` as a `NumpyMLP`.
+    """
+    linears = [layer for layer in fold_batch_norm(model.cpu().eval()) if isinstance(layer, nn.Linear)]
+    return NumpyMLP(
+        weights=[layer.weight.detach().numpy() for layer in linears],
+        biases=[layer.bias.detach().numpy() for layer in linears],
+        activation_fn=model.activation_fn_name
+    )
+
+
+def export_numpy_weights(model: nn.Module, output_path: Path, num_features: int, atol: float = 1e-5) -> Path:
+    """
+    Folds the model into NumPy weight arrays, checks them against the eager model and saves them as `.npz`.
+    """
+    model = model.cpu().eval()
+    numpy_model = fold_to_numpy(model)
+
+    # parity check against the eager model
+    example = torch.randn(64, num_features)
+    with torch.no_grad():
+        expected = model(example).numpy()
+    max_diff = float(abs(expected - numpy_model(example.numpy())).max())
+    if max_diff > atol:
+        raise RuntimeError(f"Los pesos NumPy difieren del modelo original (max diff={max_diff:.2e}).")
+
+    numpy_model.save_npz(output_path)
+    log.info(f"✔ Pesos NumPy (BatchNorm plegado) guardados en: {output_path} (max diff={max_diff:.2e})")
+    return Path(output_path)
+
+
+def export_shared_artifacts(model: nn.Module, preprocessor_path: Path, output_path: Path, weights_path: Path) -> Path:
+    """
+    Compiles the fitted preprocessor and folds the model (trained weights saved at `weights_path`) into the
+    memory-mappable serving file.
+    """
+    numpy_model = fold_to_numpy(model)
+    encoder = CompiledFeatureEncoder.from_preprocessor(joblib.load(preprocessor_path))
+    if encoder.num_features != numpy_model.num_features:
+        raise ValueError(f"El preprocesador genera {encoder.num_features} features, pero el modelo espera {numpy_model.num_features}.")
+    return save_shared_artifacts(output_path, encoder, numpy_model, weights_path, preprocessor_path)
+
+
+def export_model_bundle(model: CreditScoringModel, preprocessor_path: Path, output_path: Path,
+                        calibrator: Optional[ProbabilityCalibrator] = None,
+                        reference_stats: Optional[Dict[str, Any]] = None) -> Path:
+    """
+    Writes the versioned bundle of a trained model: `get_model_info()`, trained and folded weights,
+    the encoder compiled from `preprocessor_path` (and its sha256), the calibration and the drift reference statistics.
+    """
+    model = model.cpu().eval()
+    state_dict = {name: tensor.detach().cpu().numpy() for name, tensor in model.state_dict().items()}
+    encoder = CompiledFeatureEncoder.from_preprocessor(joblib.load(preprocessor_path))
+    return save_model_bundle(output_path, model.get_model_info(), state_dict, fold_to_numpy(model), encoder,
+                             preprocessor_path, calibrator=calibrator, reference_stats=reference_stats)
+
+
+def load_model_from_config(config_path: Path) -> Tuple[CreditScoringModel, Path, int]:
+    """
+    Rebuilds the trained model described by a training YAML and loads its weights.
+    The number of input features is read from the first Linear layer of the state dict.
+    """
+    with open(config_path, 'r') as f:
+        params = yaml.safe_load(f)
+
+    model_cfg = params['model_config']
+    model_path = Path("models") / model_cfg['model_name']
+    state_dict = torch.load(model_path, map_location=torch.device('cpu'))
+    num_features = state_dict['network.0.weight'].shape[1]
+
+    architecture = model_cfg['architecture']
+    model = CreditScoringModel(
+        num_features=num_features,
+        hidden_layers=architecture['hidden_layers'],
+        dropout_rate=architecture['dropout_rate'],
+        use_batch_norm=architecture['use_batch_norm'],
+        activation_fn=architecture['activation_fn']
+    )
+    model.load_state_dict(state_dict)
+    return model.eval(), model_path, num_features
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a trained credit scoring model as frozen TorchScript, NumPy, shared and bundle serving artifacts.")
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="config/training/credit_scoring-training_config-german_credit_risk_v130.yaml",
+        help="Path to the training YAML config of the model to export."
+    )
+    cli_args = parser.parse_args()
+
+    config_path = Path(cli_args.config)
+    model, model_path, num_features = load_model_from_config(config_path)
+    export_frozen_model(model, frozen_model_path(model_path), num_features)
+    export_numpy_weights(model, numpy_weights_path(model_path), num_features)
+
+    with open(config_path, 'r') as f:
+        preprocessor_filename = yaml.safe_load(f)['data_source']['data_path']['preprocessor_filename']
+    export_shared_artifacts(model, Path("models") / preprocessor_filename, shared_artifacts_path(model_path), model_path)
+
+    # the calibration and reference statistics saved at training time go into the bundle when they match these weights
+    path_calibration = calibration_path(model_path)
+    calibrator = ProbabilityCalibrator.load(path_calibration) if is_up_to_date(path_calibration, model_path) else None
+    path_reference = reference_stats_path(model_path)
+    reference_stats = load_reference_statistics(path_reference) if is_up_to_date(path_reference, model_path) else None
+    export_model_bundle(model, Path("models") / preprocessor_filename, bundle_path(model_path), calibrator=calibrator,
+                        reference_stats=reference_stats)
+
+"""
+execute export:
+python -m src.inference.export --config config/training/credit_scoring-training_config-german_credit_risk_v130.yaml
+"""
@@ -0,0 +1,94 @@
+"""
+numpy_backend.py: pure-NumPy inference backend. Serving with it never imports torch.
+
+The weights are produced by `src.inference.export`, which folds each BatchNorm into the preceding
+Linear layer and drops Dropout, so the forward pass is a chain of `x @ W.T + b` and activations.
+"""
+
+import numpy as np
+import logging as log
+from pathlib import Path
+from typing import List, Optional
+
+
+class NumpyMLP:
+    """
+    Folded CreditScoringModel evaluated with vectorized NumPy (float32).
+    """
+    def __init__(self, weights: List[np.ndarray], biases: List[np.ndarray], activation_fn: str = "ReLU"):
+        if len(weights) != len(biases) or not weights:
+            raise ValueError("Se requiere el mismo número (>0) de pesos y bias.")
+        if activation_fn not in ("ReLU", "LeakyReLU", "GELU"):
+            raise ValueError(f"Función de activación no soportada: {activation_fn}")
+        # (in, out) contiguous matrices so the forward pass is x @ W
+        self.weights_t = [np.ascontiguousarray(np.asarray(w, dtype=np.float32).T) for w in weights]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self.activation_fn = activation_fn
+        self.num_features = self.weights_t[0].shape[0]
+
+    @classmethod
+    def from_npz(cls, path: Path) -> "NumpyMLP":
+        with np.load(path, allow_pickle=False) as data:
+            num_layers = int(data['num_layers'])
+            weights = [data[f'weight_{i}'] for i in range(num_layers)]
+            biases = [data[f'bias_{i}'] for i in range(num_layers)]
+            activation_fn = str(data['activation_fn'])
+        return cls(weights, biases, activation_fn)
+
+    def save_npz(self, path: Path):
+        arrays = {'num_layers': np.array(len(self.weights_t)), 'activation_fn': np.array(self.activation_fn)}
+        for i, (w_t, b) in enumerate(zip(self.weights_t, self.biases)):
+            arrays[f'weight_{i}'] = w_t.T
+            arrays[f'bias_{i}'] = b
+        np.savez(path, **arrays)
+
+    def _activate(self, x: np.ndarray) -> np.ndarray:
+        if self.activation_fn == "ReLU":
+            return np.maximum(x, 0, out=x)
+        if self.activation_fn == "LeakyReLU":
+            return np.where(x > 0, x, x * np.float32(0.01))
+        from scipy.special import erf  # exact GELU, same as nn.GELU()
+        return x * np.float32(0.5) * (np.float32(1.0) + erf(x / np.float32(np.sqrt(2.0))))
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Logits of shape (n, 1) for a (n, num_features) float32 array.
+        """
+        last = len(self.weights_t) - 1
+        for i, (w_t, b) in enumerate(zip(self.weights_t, self.biases)):
+            x = x @ w_t
+            x += b
+            if i < last:
+                x = self._activate(x)
+        return x
+
+
+class NumpyBackend:
+    """
+    Runs the forward pass with NumPy from the folded `.npz` weights exported next to the `.pt` file,
+    or from an already loaded `model` (e.g. memory-mapped from the shared serving file).
+    """
+    name = "numpy"
+
+    def __init__(self, weights_path: Path, model: Optional[NumpyMLP] = None):
+        self.weights_path = Path(weights_path)
+        if model is not None:
+            self.model = model
+            return
+        try:
+            self.model = NumpyMLP.from_npz(self.weights_path)
+        except FileNotFoundError:
+            log.error(
+                f"✘ Pesos NumPy no encontrados en {self.weights_path}. "
+                "Ejecuta `python -m src.inference.export` para generarlos."
+            )
+            raise
+        log.info(f"✔ Pesos NumPy (BatchNorm plegado) cargados desde: {self.weights_path}")
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """
+        Probability of 'good' for each row of a (n, num_features) float32 array.
+        """
+        logits = self.model(features).reshape(-1)
+        # sigmoid(x) = 0.5 * (1 + tanh(x / 2)), numerically stable for large |x|
+        return np.float32(0.5) * (np.float32(1.0) + np.tanh(logits * np.float32(0.5)))
@@ -3,93 +3,431 @@ predictor.py: this class is responsible for loading the artifacts and making the
 """
 
 import os
+import time
+import threading
 import joblib
-import torch
-import pandas as pd
+import numpy as np
 import logging as log
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence
 
 import sys
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from training.model import CreditScoringModel
-from server.schemas import CreditRiskInput
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.server.schemas import CreditRiskInput
+from src.inference.encoder import CompiledFeatureEncoder
+from src.inference.artifacts import (
+    numpy_weights_path, shared_artifacts_path, bundle_path, calibration_path, reference_stats_path,
+    is_up_to_date
+)
+from src.inference.calibration import ProbabilityCalibrator
+from src.inference.drift import DriftMonitor, load_reference_statistics
+from src.inference.cache import PredictionCache, canonical_key
+from src.inference.registry import ModelRegistry
+from src.core.config import settings
+from src.core.metrics import STAGE_SECONDS, FORWARD_BATCH_ROWS, PREDICTIONS
 
 log.basicConfig(level=log.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# private key of the cache entries holding the encoded row, so cache hits still feed the drift sketches
+_FEATURES_KEY = "_features"
+
 
 class CreditRiskPredictor:
     """
     Orchestrates the loading of artifacts and the execution of inference.
     """
-    def __init__(self, model_path: Path, preprocessor_path: Path, model_config: Dict[str, Any]):
+    def __init__(self, model_path: Path, preprocessor_path: Path, model_config: Dict[str, Any], chunk_size: int = 1024, backend: str = "torch",
+                 cache_size: int = 0, cache_ttl_seconds: float = 0.0, torch_threads: int = 0, use_shared_artifacts: bool = False,
+                 explain_steps: int = 32, explanation_cache_size: int = 0, use_calibration: bool = True,
+                 threshold: Optional[float] = None, use_bundle: bool = True, monitor_drift: bool = False,
+                 drift_min_samples: int = 500):
+        if chunk_size < 1:
+            raise ValueError("chunk_size debe ser >= 1.")
+        if backend not in ("torch", "torch_int8", "numpy"):
+            raise ValueError(f"Backend de inferencia no soportado: {backend}")
         self.model_path = model_path
         self.preprocessor_path = preprocessor_path
         self.model_config = model_config
+        self.chunk_size = chunk_size
+        self.backend_name = backend
+        self.torch_threads = torch_threads
+        self.use_shared_artifacts = use_shared_artifacts
+        self.use_bundle = use_bundle
+        self.bundle = None
+        # streaming input-distribution sketches compared with the training reference (None when disabled)
+        self.monitor_drift = monitor_drift
+        self.drift_min_samples = drift_min_samples
+        self.drift = None
+        self.use_calibration = use_calibration
+        self.threshold_override = threshold
+        self.calibrator = None
+        self.threshold = 0.5
+        self.backend = None
         self.model = None
         self.preprocessor = None
+        self.encoder = None
+        # cache of repeated payloads; disabled when cache_size == 0
+        self.cache = PredictionCache(cache_size, cache_ttl_seconds) if cache_size > 0 else None
+        # optional ShadowScorer: candidate models scored on the same encoded features, off the request path
+        self.shadow = None
+        # model version served by this predictor (set by the ModelRegistry), tags its shadow batches
+        self.version: Optional[str] = None
+        # integrated gradients explainer, built on the first explanation request
+        self.explain_steps = explain_steps
+        self.explanation_cache = PredictionCache(explanation_cache_size, cache_ttl_seconds) if explanation_cache_size > 0 else None
+        self._explainer = None
+        self._explainer_lock = threading.Lock()
+        # per-thread (chunk_size, num_features) float32 buffer the request chunks are encoded into
+        self._feature_buffers = threading.local()
         self._load_artifacts()
         
+    def _load_bundle(self):
+        """
+        Versioned bundle `<model>.bundle` opened with a single mapping, or None when it is disabled, missing
+        or older than the `.pt` weights (then the other artifacts are loaded). A bundle with a bad checksum,
+        built from another preprocessor or for another architecture raises ValueError.
+        """
+        if not self.use_bundle:
+            return None
+        path = bundle_path(self.model_path)
+        if not is_up_to_date(path, self.model_path):
+            if path.exists():
+                log.warning(f"✘ El bundle {path} es más antiguo que los pesos .pt; se ignora.")
+            return None
+        from src.inference.bundle import load_model_bundle
+        bundle = load_model_bundle(path, preprocessor_path=self.preprocessor_path, writable=self.backend_name == "torch")
+        bundle.check_model_config(self.model_config)
+        log.info(f"✔ Bundle del modelo cargado desde: {path} (sha256 {bundle.checksum[:12]})")
+        return bundle
+        
+    def _load_shared_artifacts(self):
+        """
+        Encoder + folded weights memory-mapped from `<model>.shared.bin`, or None when the file is
+        missing or was not built from the current `.pt` weights / preprocessor (sha256 recorded in its header);
+        then the regular artifacts are loaded.
+        """
+        if not self.use_shared_artifacts:
+            return None
+        shared_path = shared_artifacts_path(self.model_path)
+        if not shared_path.exists():
+            log.warning(f"✘ Artefactos compartidos {shared_path} ausentes; se cargan los artefactos individuales.")
+            return None
+        if self.backend_name == "torch_int8":
+            log.warning("✘ El backend torch_int8 cuantiza su propia copia de los pesos; se cargan los artefactos individuales.")
+            return None
+        from src.inference.shared_artifacts import load_shared_artifacts
+        try:
+            encoder, shared_model = load_shared_artifacts(shared_path, self.model_path, self.preprocessor_path,
+                                                          writable=self.backend_name == "torch")
+        except ValueError as e:
+            log.warning(f"✘ Artefactos compartidos desactualizados ({e}); se cargan los artefactos individuales.")
+            return None
+        log.info(f"✔ Encoder y pesos mapeados desde: {shared_path}")
+        return encoder, shared_model
+        
     def _load_artifacts(self):
         """
         Load the artifacts from the path.
         """
-        try:
-            self.preprocessor = joblib.load(self.preprocessor_path)
-            log.info(f"✔ Archivo preprocesador cargado desde: {self.preprocessor_path}")
-        except FileNotFoundError:
-            log.error(f"✘ Archivo preprocesador no encontrado en {self.preprocessor_path}")
-            raise
+        self.bundle = self._load_bundle()
+        shared = self._load_shared_artifacts() if self.bundle is None else None
+        shared_model = None
+        if self.bundle is not None:
+            # architecture, encoder and folded weights all come from the bundle
+            self.model_config = self.bundle.model_config
+            self.encoder, shared_model = self.bundle.encoder, self.bundle.folded_model
+        elif shared is not None:
+            self.encoder, shared_model = shared
+        else:
+            try:
+                self.preprocessor = joblib.load(self.preprocessor_path)
+                log.info(f"✔ Archivo preprocesador cargado desde: {self.preprocessor_path}")
+            except FileNotFoundError:
+                log.error(f"✘ Archivo preprocesador no encontrado en {self.preprocessor_path}")
+                raise
+            
+            # compile the fitted preprocessor into lookup tables for the hot path
+            self.encoder = CompiledFeatureEncoder.from_preprocessor(self.preprocessor)
+        if self.encoder.num_features != self.model_config['num_features']:
+            raise ValueError(
+                f"El preprocesador genera {self.encoder.num_features} features, "
+                f"pero el modelo espera {self.model_config['num_features']}."
+            )
+        log.info(f"✔ Encoder compilado con {self.encoder.num_features} features.")
         
-        try:
-            # Recreate the architecture of the model
-            self.model = CreditScoringModel(
-                num_features=self.model_config['num_features'], # Este valor debe ser el correcto post-procesamiento
-                hidden_layers=self.model_config['hidden_layers'],
-                dropout_rate=self.model_config['dropout_rate'],
-                use_batch_norm=self.model_config['use_batch_norm'],
-                activation_fn=self.model_config['activation_fn']
+        # the torch backend is imported lazily so the numpy backend never loads torch
+        if self.backend_name == "numpy":
+            from src.inference.numpy_backend import NumpyBackend
+            weights_path = numpy_weights_path(self.model_path)
+            if shared_model is None and not is_up_to_date(weights_path, self.model_path):
+                log.warning(f"✘ Los pesos NumPy {weights_path} son más antiguos que los pesos .pt; vuelve a exportarlos.")
+            self.backend = NumpyBackend(weights_path, model=shared_model)
+            if self.backend.model.num_features != self.encoder.num_features:
+                raise ValueError(
+                    f"Los pesos NumPy esperan {self.backend.model.num_features} features, "
+                    f"pero el preprocesador genera {self.encoder.num_features}."
+                )
+        else:
+            from src.inference.torch_backend import TorchBackend
+            self.backend = TorchBackend(
+                self.model_path,
+                self.model_config,
+                quantized=self.backend_name == "torch_int8",
+                num_threads=self.torch_threads,
+                shared_model=shared_model,
+                # torch_int8 quantizes the eager model built from the trained (unfolded) weights
+                state_dict=self.bundle.state_dict() if self.bundle is not None and self.backend_name == "torch_int8" else None
             )
-            # load weights trained
-            self.model.load_state_dict(torch.load(self.model_path, map_location=torch.device('cpu')))
-            self.model.eval()  # mode: eval
-            log.info(f"✔ Pesos del modelo cargados desde: {self.model_path}")
-            log.info("✔ Modelo y preprocesador cargados exitosamente.")
-        except FileNotFoundError:
-            log.error(f"✘ Archivo de modelo no encontrado en {self.model_path}")
-            raise
-        except Exception as e:
-            log.error(f"✘ Error al cargar el modelo: {e}")
-            raise
+        self.model = self.backend.model
+        log.info(f"✔ Modelo y preprocesador cargados exitosamente (backend: {self.backend.name}).")
         
-    def predict(self, input_data: CreditRiskInput) -> Dict[str, Any]:
+        self._load_calibration()
+        self._load_drift_monitor()
+    
+    def _load_calibration(self):
+        """
+        Calibration map and decision threshold fitted at training time (from the bundle, else `<model>.calibration.json`).
+        Without them (or when the file is older than the weights) probabilities are served raw with threshold 0.5.
+        """
+        path = calibration_path(self.model_path)
+        self.calibrator = ProbabilityCalibrator("none")
+        if self.use_calibration:
+            if self.bundle is not None and self.bundle.calibrator is not None:
+                self.calibrator = self.bundle.calibrator
+                log.info(f"✔ Calibración '{self.calibrator.method}' cargada desde el bundle (umbral: {self.calibrator.threshold:.4f})")
+            elif is_up_to_date(path, self.model_path):
+                self.calibrator = ProbabilityCalibrator.load(path)
+                log.info(f"✔ Calibración '{self.calibrator.method}' cargada desde: {path} (umbral: {self.calibrator.threshold:.4f})")
+            elif path.exists():
+                log.warning(f"✘ La calibración {path} es más antigua que los pesos .pt; se usan probabilidades sin calibrar.")
+            else:
+                log.warning(f"✘ Calibración no encontrada en {path}; se usan probabilidades sin calibrar y umbral 0.5.")
+        self.threshold = self.threshold_override if self.threshold_override is not None else self.calibrator.threshold
+        
+    def _load_drift_monitor(self):
+        """
+        Drift monitor over the reference statistics of the training data (from the bundle, else
+        `<model>.reference_stats.json`). Monitoring is skipped when they are missing or stale.
+        """
+        if not self.monitor_drift:
+            return
+        path = reference_stats_path(self.model_path)
+        if self.bundle is not None and self.bundle.reference_stats is not None:
+            reference, source = self.bundle.reference_stats, "el bundle"
+        elif is_up_to_date(path, self.model_path):
+            reference, source = load_reference_statistics(path), str(path)
+        else:
+            log.warning(f"✘ Estadísticas de referencia no encontradas o desactualizadas en {path}; el monitoreo de drift queda deshabilitado.")
+            return
+        try:
+            self.drift = DriftMonitor(reference, self.encoder, min_samples=self.drift_min_samples)
+        except ValueError as e:
+            log.warning(f"✘ {e} El monitoreo de drift queda deshabilitado.")
+            return
+        log.info(f"✔ Monitoreo de drift con estadísticas de referencia de {source} ({reference['rows']} filas).")
+        
+    def predict(self, input_data: CreditRiskInput, cache_lookup: bool = True) -> Dict[str, Any]:
         """
         Make the prediction.
         """
-        # 1. convert Pydantic input to DataFrame
-        input_df = pd.DataFrame([input_data.dict(by_alias=True)])
+        result = self.predict_batch([input_data], cache_lookup=cache_lookup)[0]
+        # the API logs a sampled structured record per request; this line is only formatted at DEBUG
+        log.debug("✔ Predicción generada: %s con probabilidad: %.4f", result['prediction'], result['probability'])
+        return result
+    
+    def lookup(self, input_data: CreditRiskInput) -> Optional[Dict[str, Any]]:
+        """
+        Cached prediction for this applicant, or None if it is not cached (or the cache is disabled).
+        """
+        if self.cache is None:
+            return None
+        start = time.perf_counter()
+        result = self.cache.get(canonical_key(input_data))
+        STAGE_SECONDS.observe(time.perf_counter() - start, "cache_lookup")
+        if result is not None:
+            PREDICTIONS.inc(result["prediction"], "cache")
+            self._monitor_cached([result])
+        return result
+
+    def _monitor_cached(self, results: List[Dict[str, Any]]):
+        """
+        Adds the encoded rows stored with cache hits to the drift sketches (and strips them from the results),
+        so the live distribution covers every scored request, not only the unique applicants.
+        """
+        rows = [row for row in (result.pop(_FEATURES_KEY, None) for result in results) if row is not None]
+        if self.drift is not None and rows:
+            start = time.perf_counter()
+            self.drift.update(np.stack(rows))
+            STAGE_SECONDS.observe(time.perf_counter() - start, "drift")
+    
+    def warmup(self, batch_sizes: Sequence[int] = (1, 32)):
+        """
+        Runs synthetic batches through the backend so the first real request does not pay
+        for lazy initialization (TorchScript profiling, allocator, BLAS threads).
+        """
+        rng = np.random.default_rng(0)
+        for batch_size in batch_sizes:
+            features = rng.standard_normal((batch_size, self.encoder.num_features)).astype(np.float32)
+            self.backend.predict_proba(features)
+        log.info(f"✔ Warm-up completado con lotes sintéticos de tamaño {list(batch_sizes)}.")
+    
+    def predict_batch(self, inputs: List[CreditRiskInput], cache_lookup: bool = True) -> List[Dict[str, Any]]:
+        """
+        Make the predictions for several applicants.
+        Inputs are processed in chunks of `chunk_size` rows so memory stays bounded
+        for very large payloads; each chunk is a single preprocessing step and a single forward pass.
+        Cached applicants are answered from the cache; use `cache_lookup=False` when the caller
+        already checked it with `lookup` (results are still stored).
+        """
+        if self.cache is None:
+            return self._predict_uncached(inputs)
+        
+        # repeated payloads skip preprocessing and the forward pass
+        keys = [canonical_key(item) for item in inputs]
+        if cache_lookup:
+            start = time.perf_counter()
+            results: List[Optional[Dict[str, Any]]] = [self.cache.get(key) for key in keys]
+            STAGE_SECONDS.observe(time.perf_counter() - start, "cache_lookup")
+            hits = [result for result in results if result is not None]
+            for result in hits:
+                PREDICTIONS.inc(result["prediction"], "cache")
+            self._monitor_cached(hits)
+        else:
+            results = [None] * len(inputs)
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            computed = self._predict_uncached([inputs[i] for i in missing], keep_features=self.drift is not None)
+            for i, result in zip(missing, computed):
+                self.cache.put(keys[i], result)
+                result.pop(_FEATURES_KEY, None)
+                results[i] = result
+        return results
+    
+    def explain(self, inputs: List[CreditRiskInput]) -> List[Dict[str, Any]]:
+        """
+        Prediction plus per-field integrated gradients attributions for each applicant.
+        Explanations are cached per applicant (same canonical key as the prediction cache).
+        """
+        keys = [canonical_key(item) for item in inputs]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(inputs)
+        if self.explanation_cache is not None:
+            results = [self.explanation_cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            missing_inputs = [inputs[i] for i in missing]
+            predictions = self.predict_batch(missing_inputs)
+            features = self.encoder.encode_inputs(missing_inputs)
+            explainer = self._get_explainer()
+            # bounded activations: every applicant adds `steps` interpolated rows to the pass
+            rows_per_pass = max(1, self.chunk_size // explainer.steps)
+            explanations = []
+            for start in range(0, len(features), rows_per_pass):
+                explanations.extend(explainer.explain(features[start:start + rows_per_pass]))
+            for i, prediction, explanation in zip(missing, predictions, explanations):
+                # attributions stay in raw log-odds; the reference probability is calibrated like the prediction
+                baseline_probability = float(self.calibrator.apply(np.array([explanation["baseline_probability"]]))[0])
+                results[i] = {**prediction, **explanation, "baseline_probability": baseline_probability,
+                              "method": "integrated_gradients", "steps": explainer.steps}
+                if self.explanation_cache is not None:
+                    self.explanation_cache.put(keys[i], results[i])
+        return results
+    
+    def _get_explainer(self):
+        if self._explainer is None:
+            with self._explainer_lock:
+                if self._explainer is None:
+                    # torch is only imported when explanations are requested (numpy backend stays torch-free)
+                    from src.inference.explain import IntegratedGradientsExplainer, load_explanation_model
+                    state_dict = self.bundle.state_dict() if self.bundle is not None else None
+                    model = load_explanation_model(self.model_path, self.model_config, state_dict=state_dict)
+                    self._explainer = IntegratedGradientsExplainer(model, self.encoder, steps=self.explain_steps)
+        return self._explainer
+    
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """
+        Calibrated probability of 'good' for already encoded features.
+        """
+        return self.calibrator.apply(self.backend.predict_proba(features))
+    
+    def predict_proba_frame(self, df: "pd.DataFrame") -> np.ndarray:
+        """
+        Probability of 'good' for every row of a DataFrame with the dataset columns (bulk scoring).
+        Rows are encoded and scored in chunks of `chunk_size`, reusing one feature buffer.
+        """
+        probabilities = np.empty(len(df), dtype=np.float32)
+        buffer = np.empty((min(self.chunk_size, max(len(df), 1)), self.encoder.num_features), dtype=np.float32)
+        for start in range(0, len(df), self.chunk_size):
+            chunk = df.iloc[start:start + self.chunk_size]
+            features = self.encoder.encode_frame(chunk, out=buffer)
+            probabilities[start:start + len(chunk)] = self.predict_proba(features)
+        return probabilities
+
+    def _feature_buffer(self) -> np.ndarray:
+        """
+        Preallocated encoding buffer of the calling thread (inference threads score chunks concurrently),
+        reallocated only if `chunk_size` has been raised since it was created.
+        """
+        buffer = getattr(self._feature_buffers, "buffer", None)
+        if buffer is None or len(buffer) < self.chunk_size:
+            buffer = np.empty((self.chunk_size, self.encoder.num_features), dtype=np.float32)
+            self._feature_buffers.buffer = buffer
+        return buffer
+
+    def _predict_uncached(self, inputs: List[CreditRiskInput], keep_features: bool = False) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(inputs), self.chunk_size):
+            results.extend(self._predict_chunk(inputs[start:start + self.chunk_size], keep_features=keep_features))
+        return results
+    
+    def _predict_chunk(self, inputs: List[CreditRiskInput], keep_features: bool = False) -> List[Dict[str, Any]]:
+        """
+        Vectorized prediction for one chunk of applicants.
+        With `keep_features` each result also carries a copy of its encoded row (to be cached).
+        """
+        # 1. encode Pydantic inputs straight into this thread's float32 buffer (same output as preprocessor.transform)
+        start = time.perf_counter()
+        processed_features = self.encoder.encode_inputs(inputs, out=self._feature_buffer())
+        encoded = time.perf_counter()
         
-        # 2. apply preprocessing
-        processed_features = self.preprocessor.transform(input_df)
+        # 2. make prediction
+        probabilities = self.predict_proba(processed_features)
+        predicted = time.perf_counter()
         
-        # 3. convert to Pytorch tensor
-        input_tensor = torch.tensor(processed_features, dtype=torch.float32)
+        # 3. shadow models score a copy of the encoded rows asynchronously (never blocks this request);
+        #    the buffer itself is reused by the next chunk of this thread
+        shadow = self.shadow
+        if shadow is not None:
+            shadow.submit(self.version, processed_features.copy(), probabilities, self.threshold)
         
-        # 4. make prediction
-        with torch.no_grad():
-            logits = self.model(input_tensor)
-            probability = torch.sigmoid(logits).item()
+        # 4. input-distribution sketches (a few vectorized operations on the same buffer)
+        if self.drift is not None:
+            self.drift.update(processed_features)
+        monitored = time.perf_counter()
             
-        # 5. format outout
-        prediction = 'good' if probability >= 0.5 else 'bad'
-        log.info(f"✔ Predicción generada: {prediction} con probabilidad: {probability:.4f}")
-        
-        return {
-            "prediction": prediction,
-            "probability": probability
-        }
+        # 5. format output
+        results = [
+            {
+                "prediction": 'good' if probability >= self.threshold else 'bad',
+                "probability": probability
+            }
+            for probability in probabilities.tolist()
+        ]
+        if keep_features:
+            for result, row in zip(results, processed_features):
+                result[_FEATURES_KEY] = row.copy()
+        STAGE_SECONDS.observe(encoded - start, "encode")
+        STAGE_SECONDS.observe(predicted - encoded, "forward")
+        if self.drift is not None:
+            STAGE_SECONDS.observe(monitored - predicted, "drift")
+        STAGE_SECONDS.observe(time.perf_counter() - monitored, "postprocess")
+        FORWARD_BATCH_ROWS.observe(len(inputs))
+        n_good = int(np.count_nonzero(probabilities >= self.threshold))
+        PREDICTIONS.inc("good", "model", amount=n_good)
+        PREDICTIONS.inc("bad", "model", amount=len(inputs) - n_good)
+        return results
         
 
+# architecture of the default model; when its bundle is present the architecture is read from the bundle
 BEST_MODEL_CONFIG = {
     'num_features': 26, 
     'hidden_layers': [256, 128, 64, 64],
@@ -102,10 +440,40 @@ BEST_MODEL_CONFIG = {
 MODEL_PATH = Path("models/genia_services_mlp_credit_scoring_model_v1.3.0_20250824.pt")
 PREPROCESSOR_PATH = Path("models/german_credit_risk_preprocessor.joblib")
 
-# Instancia única (Singleton) del predictor para ser usada por la API.
-# Esto asegura que el modelo se carga una sola vez al iniciar el servidor.
-predictor_instance = CreditRiskPredictor(
-    model_path=MODEL_PATH,
-    preprocessor_path=PREPROCESSOR_PATH,
-    model_config=BEST_MODEL_CONFIG
-)
\ No newline at end of file
+
+def build_predictor(model_path: Path = MODEL_PATH, model_config: Dict[str, Any] = BEST_MODEL_CONFIG) -> CreditRiskPredictor:
+    """
+    Builds the predictor configured by the environment.
+    Loading the artifacts is blocking: the API calls it from a background task at startup
+    so the server binds immediately and only reports ready once the model is warm.
+    """
+    return CreditRiskPredictor(
+        model_path=model_path,
+        preprocessor_path=PREPROCESSOR_PATH,
+        model_config=model_config,
+        chunk_size=settings.PREDICT_CHUNK_SIZE,
+        backend=settings.INFERENCE_BACKEND,
+        cache_size=settings.PREDICTION_CACHE_MAX_SIZE if settings.PREDICTION_CACHE_ENABLED else 0,
+        cache_ttl_seconds=settings.PREDICTION_CACHE_TTL_SECONDS,
+        torch_threads=settings.TORCH_NUM_THREADS,
+        use_shared_artifacts=settings.SHARED_ARTIFACTS_ENABLED,
+        explain_steps=settings.EXPLAIN_STEPS,
+        explanation_cache_size=settings.EXPLANATION_CACHE_MAX_SIZE,
+        use_calibration=settings.CALIBRATION_ENABLED,
+        threshold=settings.PREDICTION_THRESHOLD,
+        use_bundle=settings.MODEL_BUNDLE_ENABLED,
+        monitor_drift=settings.DRIFT_MONITORING_ENABLED,
+        drift_min_samples=settings.DRIFT_MIN_SAMPLES
+    )
+
+
+def build_registry() -> ModelRegistry:
+    """
+    Registry over every model version in `models/`; the architecture of each one comes from its training YAML.
+    """
+    return ModelRegistry(
+        models_dir=Path(settings.MODELS_DIR),
+        config_dir=Path(settings.TRAINING_CONFIG_DIR),
+        num_features=BEST_MODEL_CONFIG['num_features'],
+        predictor_factory=build_predictor
+    )
@@ -0,0 +1,24 @@
+"""
+quantization.py: dynamic int8 quantization of CreditScoringModel for CPU serving.
+"""
+
+import os
+import sys
+import torch
+import torch.nn as nn
+from torch.ao.quantization import quantize_dynamic
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.inference.export import fold_batch_norm
+
+
+def quantize_dynamic_int8(model: nn.Module) -> nn.Module:
+    """
+    Folds BatchNorm into the Linear layers and applies dynamic int8 quantization to every nn.Linear.
+    Weights are stored as int8; activations are quantized on the fly per batch.
+    """
+    supported_engines = [engine for engine in torch.backends.quantized.supported_engines if engine != 'none']
+    if not supported_engines:
+        raise RuntimeError("Esta build de PyTorch no tiene un motor de cuantización disponible.")
+    fused = fold_batch_norm(model)
+    return quantize_dynamic(fused, {nn.Linear}, dtype=torch.qint8).eval()
@@ -0,0 +1,175 @@
+"""
+registry.py: registry of the trained model versions in `models/` with zero-downtime hot swap.
+"""
+
+import os
+import re
+import sys
+import yaml
+import threading
+import logging as log
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.inference.shadow import ShadowScorer
+
+# genia_services_mlp_credit_scoring_model_v1.3.0_20250824.pt -> v1.3.0
+_VERSION_PATTERN = re.compile(r"_(v\d+\.\d+\.\d+)_\d+\.pt$")
+
+
+class ModelRegistry:
+    """
+    Discovers the model versions shipped in `models_dir` and their architecture from the training YAMLs,
+    loads a version in the background, warms it up and atomically swaps the active predictor.
+
+    Requests keep a reference to the predictor they started with, so in-flight requests finish on the
+    old version while new requests go to the new one.
+    """
+    def __init__(self, models_dir: Path, config_dir: Path, num_features: int,
+                 predictor_factory: Callable[[Path, Dict[str, Any]], Any],
+                 warmup_batch_sizes: tuple = (1, 32, 256)):
+        self.models_dir = Path(models_dir)
+        self.config_dir = Path(config_dir)
+        self.num_features = num_features
+        self.predictor_factory = predictor_factory
+        self.warmup_batch_sizes = warmup_batch_sizes
+
+        self._active = None
+        self._active_version: Optional[str] = None
+        self._swap_lock = threading.Lock()
+        self.loading_version: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.history: List[Dict[str, Any]] = []
+        self.shadow = None  # ShadowScorer attached to whichever predictor is active
+
+    @property
+    def active(self):
+        """Predictor serving new requests (None until the first version is loaded)."""
+        return self._active
+
+    @property
+    def active_version(self) -> Optional[str]:
+        return self._active_version
+
+    def _architectures(self) -> Dict[str, Dict[str, Any]]:
+        """model_name -> architecture, read from the training YAML configs."""
+        architectures = {}
+        for config_path in sorted(self.config_dir.glob("*.yaml")):
+            with open(config_path, 'r') as f:
+                params = yaml.safe_load(f)
+            model_cfg = params.get('model_config', {})
+            if 'model_name' in model_cfg and 'architecture' in model_cfg:
+                architectures[model_cfg['model_name']] = model_cfg['architecture']
+        return architectures
+
+    def available_versions(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Versions with weights in `models_dir` and a matching training config.
+        """
+        architectures = self._architectures()
+        versions = {}
+        for model_path in sorted(self.models_dir.glob("*.pt")):
+            match = _VERSION_PATTERN.search(model_path.name)
+            if match is None or model_path.name not in architectures:
+                continue
+            architecture = architectures[model_path.name]
+            versions[match.group(1)] = {
+                "model_path": model_path,
+                "model_config": {
+                    'num_features': self.num_features,
+                    'hidden_layers': architecture['hidden_layers'],
+                    'dropout_rate': architecture['dropout_rate'],
+                    'use_batch_norm': architecture['use_batch_norm'],
+                    'activation_fn': architecture['activation_fn']
+                }
+            }
+        return versions
+
+    def load(self, version: str):
+        """
+        Builds and warms up the predictor of `version` without touching the active one (blocking).
+        """
+        versions = self.available_versions()
+        if version not in versions:
+            raise KeyError(f"Versión de modelo desconocida: {version}. Disponibles: {sorted(versions)}")
+        entry = versions[version]
+        predictor = self.predictor_factory(entry["model_path"], entry["model_config"])
+        predictor.version = version
+        predictor.warmup(self.warmup_batch_sizes)
+        return predictor
+
+    def activate(self, version: str):
+        """
+        Loads `version` and makes it the active predictor. Swaps are serialized; the switch itself
+        is a single reference assignment, so no request ever sees a half-loaded model.
+        """
+        with self._swap_lock:
+            self.loading_version = version
+            try:
+                log.info(f"--- Cargando versión de modelo {version} ---")
+                predictor = self.load(version)
+            except Exception as e:
+                self.last_error = f"{version}: {e}"
+                log.error(f"✘ No se pudo activar la versión {version}: {e}", exc_info=True)
+                raise
+            finally:
+                self.loading_version = None
+
+            previous_version, previous = self._active_version, self._active
+            if self.shadow is not None:
+                if version in self.shadow.shadows:
+                    # a model is never compared against itself
+                    self.shadow.remove_shadow(version)
+                    log.warning(f"✘ La versión {version} pasa a ser la activa; se retira de los modelos shadow.")
+                self.shadow.set_primary_version(version, predictor.threshold)
+                predictor.shadow = self.shadow
+            self._active = predictor
+            self._active_version = version
+            if previous is not None:
+                # requests still running on the replaced predictor stop feeding the shadow aggregates
+                previous.shadow = None
+            self.last_error = None
+            self.history.append({
+                "version": version,
+                "previous_version": previous_version,
+                "activated_at": datetime.now(timezone.utc).isoformat(),
+            })
+            log.info(f"✔ Versión activa: {version} (anterior: {previous_version})")
+            return predictor
+
+    def enable_shadow(self, versions: List[str], max_queue_size: int = 1024):
+        """
+        Loads `versions` as shadow models: they score the encoded features of every primary forward
+        pass in the background. The active version is skipped if listed (blocking).
+        """
+        shadows, shadow_thresholds = {}, {}
+        for version in versions:
+            if version == self._active_version:
+                log.warning(f"✘ La versión {version} ya es la activa; no se usa como shadow.")
+                continue
+            predictor = self.load(version)
+            shadows[version] = predictor.predict_proba  # calibrated, like the primary probabilities
+            shadow_thresholds[version] = predictor.threshold
+            log.info(f"✔ Modelo shadow {version} cargado.")
+        if not shadows:
+            return None
+        threshold = self._active.threshold if self._active is not None else 0.5
+        shadow = ShadowScorer(shadows, threshold=threshold, shadow_thresholds=shadow_thresholds,
+                              max_queue_size=max_queue_size)
+        shadow.set_primary_version(self._active_version)
+        self.shadow = shadow
+        if self._active is not None:
+            self._active.shadow = shadow
+        return shadow
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "active_version": self._active_version,
+            "loading_version": self.loading_version,
+            "last_error": self.last_error,
+            "available_versions": sorted(self.available_versions()),
+            "shadow_versions": sorted(self.shadow.shadows) if self.shadow is not None else [],
+            "history": self.history[-10:],
+        }
@@ -0,0 +1,180 @@
+"""
+shadow.py: shadow scoring of candidate model versions on live traffic, off the request path.
+"""
+
+import queue
+import threading
+import numpy as np
+import logging as log
+from typing import Any, Callable, Dict, Optional
+
+# (n, num_features) float32 features -> (n,) probabilities of 'good'
+ScoreFn = Callable[[np.ndarray], np.ndarray]
+
+
+class ShadowStats:
+    """
+    Running agreement / probability-delta aggregates of one shadow model against the primary one.
+    """
+    def __init__(self):
+        self.rows = 0
+        self.agreements = 0
+        self.sum_abs_delta = 0.0
+        self.sum_delta = 0.0
+        self.max_abs_delta = 0.0
+        self.primary_good = 0
+        self.shadow_good = 0
+        self.errors = 0
+
+    def update(self, primary: np.ndarray, shadow: np.ndarray, primary_threshold: float, shadow_threshold: float):
+        delta = shadow.astype(np.float64) - primary.astype(np.float64)
+        primary_labels = primary >= primary_threshold
+        shadow_labels = shadow >= shadow_threshold
+        self.rows += len(delta)
+        self.agreements += int(np.count_nonzero(primary_labels == shadow_labels))
+        self.sum_abs_delta += float(np.abs(delta).sum())
+        self.sum_delta += float(delta.sum())
+        self.max_abs_delta = max(self.max_abs_delta, float(np.abs(delta).max(initial=0.0)))
+        self.primary_good += int(np.count_nonzero(primary_labels))
+        self.shadow_good += int(np.count_nonzero(shadow_labels))
+
+    def as_dict(self) -> Dict[str, Any]:
+        rows = self.rows
+        return {
+            "rows": rows,
+            "agreement_rate": round(self.agreements / rows, 4) if rows else None,
+            "mean_abs_delta": round(self.sum_abs_delta / rows, 6) if rows else None,
+            "mean_delta": round(self.sum_delta / rows, 6) if rows else None,
+            "max_abs_delta": round(self.max_abs_delta, 6),
+            "primary_good_rate": round(self.primary_good / rows, 4) if rows else None,
+            "shadow_good_rate": round(self.shadow_good / rows, 4) if rows else None,
+            "errors": self.errors,
+        }
+
+
+class ShadowScorer:
+    """
+    Scores the already-encoded feature buffer of each primary forward pass with one or more shadow
+    models on a background thread and aggregates how much they agree with the primary model.
+
+    `submit` only enqueues references to arrays the primary path already computed, so the request
+    never waits for a shadow model. When the queue is full the batch is dropped (and counted)
+    instead of slowing the primary path down.
+
+    Each model labels with its own decision threshold: `threshold` is the primary's and
+    `shadow_thresholds` the shadows' (defaulting to the primary's).
+    """
+    def __init__(self, shadows: Dict[str, ScoreFn], threshold: float = 0.5,
+                 shadow_thresholds: Optional[Dict[str, float]] = None, max_queue_size: int = 1024):
+        if not shadows:
+            raise ValueError("Se requiere al menos un modelo shadow.")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size debe ser >= 1.")
+        self.shadows = dict(shadows)
+        self.threshold = threshold
+        self.shadow_thresholds = {version: (shadow_thresholds or {}).get(version, threshold) for version in self.shadows}
+        self.primary_version: Optional[str] = None
+        self.dropped_batches = 0
+        self.stale_batches = 0
+        self._stats = {version: ShadowStats() for version in self.shadows}
+        self._stats_lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._worker = threading.Thread(target=self._run, name="shadow-scorer", daemon=True)
+        self._worker.start()
+
+    def set_primary_version(self, version: Optional[str], threshold: Optional[float] = None):
+        """
+        Aggregates are always relative to one primary version; switching it resets them.
+        `threshold` is the decision threshold of the new primary (unchanged when None).
+        """
+        with self._stats_lock:
+            if version != self.primary_version:
+                self._stats = {shadow_version: ShadowStats() for shadow_version in self.shadows}
+                self.dropped_batches = 0
+                self.stale_batches = 0
+            self.primary_version = version
+            if threshold is not None:
+                self.threshold = threshold
+
+    def remove_shadow(self, version: str):
+        """
+        Stops scoring `version` in the background (e.g. when it becomes the primary). The scorer stays
+        attached with the remaining shadows, possibly none.
+        """
+        with self._stats_lock:
+            self.shadows.pop(version, None)
+            self.shadow_thresholds.pop(version, None)
+            self._stats.pop(version, None)
+
+    def submit(self, primary_version: Optional[str], features: np.ndarray, primary_probabilities: np.ndarray,
+               threshold: float):
+        """
+        Non-blocking: hands the encoded features and the probabilities of the primary model `primary_version`
+        (labelled with its `threshold`) to the shadow worker. Batches of any other version, e.g. requests still
+        running on the predictor replaced by a hot swap, are discarded and counted as stale.
+        The caller must not reuse `features` afterwards.
+        """
+        if primary_version != self.primary_version:
+            with self._stats_lock:
+                self.stale_batches += 1
+            return
+        try:
+            self._queue.put_nowait((primary_version, features, primary_probabilities, threshold))
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped_batches += 1
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            primary_version, features, primary_probabilities, primary_threshold = item
+            with self._stats_lock:
+                # batches queued before a primary swap are not scored nor mixed into the new aggregates
+                stale = primary_version != self.primary_version
+                if stale:
+                    self.stale_batches += 1
+                shadows = [] if stale else list(self.shadows.items())
+            for version, score_fn in shadows:
+                try:
+                    shadow_probabilities = np.asarray(score_fn(features)).reshape(-1)
+                except Exception as e:
+                    log.warning(f"✘ Error en el modelo shadow {version}: {e}")
+                    with self._stats_lock:
+                        if primary_version == self.primary_version and version in self._stats:
+                            self._stats[version].errors += 1
+                    continue
+                with self._stats_lock:
+                    # the primary may have been swapped while this batch was being scored
+                    if primary_version != self.primary_version:
+                        self.stale_batches += 1
+                        break
+                    if version in self._stats:
+                        self._stats[version].update(primary_probabilities, shadow_probabilities, primary_threshold,
+                                                    self.shadow_thresholds[version])
+            self._queue.task_done()
+
+    def join(self):
+        """Blocks until every submitted batch has been scored (used by tests and benchmarks)."""
+        self._queue.join()
+
+    def close(self):
+        """Stops the worker once the queued batches are scored."""
+        self._queue.put(None)
+        self._worker.join(timeout=5)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "primary_version": self.primary_version,
+                "threshold": self.threshold,
+                "queue_size": self._queue.qsize(),
+                "dropped_batches": self.dropped_batches,
+                "stale_batches": self.stale_batches,
+                "shadows": {
+                    version: {"threshold": self.shadow_thresholds[version], **stats.as_dict()}
+                    for version, stats in self._stats.items()
+                },
+            }
@@ -0,0 +1,210 @@
+"""
+shared_artifacts.py: one memory-mappable file with everything a serving worker needs.
+
+The file holds the compiled encoder (scaler statistics + one-hot categories) and the BatchNorm-folded
+weights. Workers `np.memmap` it instead of running `joblib.load` + `torch.load`, so every worker process
+maps the same page-cache pages (no per-worker copy of the weights) and starts without unpickling
+the sklearn preprocessor.
+
+Layout: 8-byte magic | uint64 (little endian) header length | JSON header | arrays aligned to 64 bytes.
+The header records the sha256 of the `.pt` weights and of the preprocessor the file was built from; loading
+checks them, since modification times do not survive a git checkout, a DVC pull or a container COPY.
+"""
+
+import os
+import sys
+import json
+import struct
+import hashlib
+import numpy as np
+import logging as log
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.core.hashing import file_sha256
+from src.inference.encoder import CompiledFeatureEncoder, _is_missing
+from src.inference.numpy_backend import NumpyMLP
+
+_MAGIC = b"GENIASHM"
+_FORMAT_VERSION = 2  # 2: sha256 of the source weights and preprocessor in the header
+_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _json_value(value: Any) -> Any:
+    """Categories are numpy scalars/strings; the category fitted on NaN is stored as null."""
+    if _is_missing(value):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def encoder_header(encoder: CompiledFeatureEncoder) -> Dict[str, Any]:
+    """JSON tables of the compiled encoder (scaler statistics + one-hot categories)."""
+    return {
+        "numerical_features": encoder.numerical_features,
+        "means": encoder.means.tolist(),
+        "scales": encoder.scales.tolist(),
+        "categorical_features": encoder.categorical_features,
+        "categories": [[_json_value(value) for value in values] for values in encoder.categories],
+    }
+
+
+def encoder_from_header(encoder_cfg: Dict[str, Any]) -> CompiledFeatureEncoder:
+    return CompiledFeatureEncoder(
+        numerical_features=encoder_cfg["numerical_features"],
+        means=encoder_cfg["means"],
+        scales=encoder_cfg["scales"],
+        categorical_features=encoder_cfg["categorical_features"],
+        categories=encoder_cfg["categories"]
+    )
+
+
+def content_checksum(header: Dict[str, Any], arrays: Iterable[np.ndarray]) -> str:
+    """
+    sha256 of the header (without its own `checksum` entry) followed by the raw bytes of every array.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps({k: v for k, v in header.items() if k != "checksum"}, sort_keys=True).encode("utf-8"))
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array).view(np.uint8))
+    return digest.hexdigest()
+
+
+def write_mapped_file(path: Path, magic: bytes, header: Dict[str, Any], arrays: Dict[str, np.ndarray],
+                      with_checksum: bool = False) -> Dict[str, Any]:
+    """
+    Writes `header` (plus the `arrays` table of offsets) and the arrays with the shared layout.
+    With `with_checksum=True` the header also gets a `checksum` of its content and the array bytes.
+    Returns the header as written.
+    """
+    header = dict(header)
+    if with_checksum:
+        header["checksum"] = "0" * 64  # same length as the final digest, so the offsets do not move
+    # offsets depend on the header size, which depends on the offsets: reserve room and fix point
+    header_size = 0
+    while True:
+        offset = _align(len(magic) + 8 + header_size)
+        header["arrays"] = []
+        for name, array in arrays.items():
+            header["arrays"].append({"name": name, "dtype": array.dtype.str, "shape": list(array.shape), "offset": offset})
+            offset = _align(offset + array.nbytes)
+        encoded = json.dumps(header).encode("utf-8")
+        if len(encoded) <= header_size:
+            break
+        header_size = len(encoded) + 256
+    if with_checksum:
+        header["checksum"] = content_checksum(header, arrays.values())
+        encoded = json.dumps(header).encode("utf-8")
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(magic)
+        f.write(struct.pack("<Q", header_size))
+        f.write(encoded.ljust(header_size, b" "))
+        for entry, array in zip(header["arrays"], arrays.values()):
+            f.seek(entry["offset"])
+            f.write(array.tobytes())
+    # atomic replace: workers mapping the previous file keep their (unlinked) pages
+    os.replace(tmp_path, path)
+    return header
+
+
+def map_file(path: Path, magic: bytes, writable: bool = False) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Maps a file written by `write_mapped_file`: (header, name -> zero-copy array view).
+    """
+    mapping = np.memmap(path, dtype=np.uint8, mode="c" if writable else "r")
+    if bytes(mapping[:len(magic)]) != magic:
+        raise ValueError(f"{path} no tiene el formato esperado ({magic.decode()}).")
+    (header_size,) = struct.unpack("<Q", bytes(mapping[len(magic):len(magic) + 8]))
+    start = len(magic) + 8
+    header = json.loads(bytes(mapping[start:start + header_size]).decode("utf-8"))
+
+    arrays: Dict[str, np.ndarray] = {}
+    for entry in header["arrays"]:
+        dtype = np.dtype(entry["dtype"])
+        nbytes = int(np.prod(entry["shape"])) * dtype.itemsize
+        offset = entry["offset"]
+        arrays[entry["name"]] = mapping[offset:offset + nbytes].view(dtype).reshape(entry["shape"])
+    return header, arrays
+
+
+def save_shared_artifacts(path: Path, encoder: CompiledFeatureEncoder, model: NumpyMLP, weights_path: Path,
+                          preprocessor_path: Path) -> Path:
+    """
+    Writes the encoder and the folded weights of `model` as a single memory-mappable file, recording the
+    sha256 of the `.pt` weights and of the preprocessor they come from.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    for i, (w_t, b) in enumerate(zip(model.weights_t, model.biases)):
+        arrays[f"weight_t_{i}"] = np.ascontiguousarray(w_t, dtype=np.float32)
+        arrays[f"bias_{i}"] = np.ascontiguousarray(b, dtype=np.float32)
+
+    header: Dict[str, Any] = {
+        "format_version": _FORMAT_VERSION,
+        "encoder": encoder_header(encoder),
+        "model": {"num_layers": len(model.weights_t), "activation_fn": model.activation_fn},
+        "sources": {
+            name: {"filename": Path(source).name, "sha256": file_sha256(source)}
+            for name, source in (("weights", weights_path), ("preprocessor", preprocessor_path))
+        },
+    }
+    write_mapped_file(path, _MAGIC, header, arrays)
+    log.info(f"✔ Artefactos compartidos (encoder + pesos plegados) guardados en: {path}")
+    return Path(path)
+
+
+def folded_model_from_arrays(arrays: Dict[str, np.ndarray], num_layers: int, activation_fn: str) -> NumpyMLP:
+    # NumpyMLP stores W.T; passing the transposed view of the stored W.T keeps it zero-copy
+    weights: List[np.ndarray] = [arrays[f"weight_t_{i}"].T for i in range(num_layers)]
+    biases: List[np.ndarray] = [arrays[f"bias_{i}"] for i in range(num_layers)]
+    return NumpyMLP(weights, biases, activation_fn)
+
+
+def check_shared_sources(path: Path, header: Dict[str, Any], weights_path: Optional[Path] = None,
+                         preprocessor_path: Optional[Path] = None):
+    """
+    Raises ValueError when the header of the shared file at `path` is not the supported format, or when an
+    existing `weights_path` / `preprocessor_path` is not the file it was built from.
+    """
+    if header.get("format_version") != _FORMAT_VERSION:
+        raise ValueError(f"Versión de formato no soportada en {path}: {header.get('format_version')}")
+    for name, source in (("weights", weights_path), ("preprocessor", preprocessor_path)):
+        if source is None or not Path(source).exists():
+            continue
+        expected = header["sources"][name]
+        if file_sha256(source) != expected["sha256"]:
+            raise ValueError(
+                f"{source} no corresponde a los artefactos compartidos {path} "
+                f"(construidos con {expected['filename']}, sha256 {expected['sha256'][:12]})."
+            )
+
+
+def verify_shared_artifacts(path: Path, weights_path: Path, preprocessor_path: Path):
+    """
+    Checks that the shared file was built from `weights_path` and `preprocessor_path` without loading it
+    (only the header is read). Raises ValueError otherwise.
+    """
+    header, _ = map_file(path, _MAGIC)
+    check_shared_sources(path, header, weights_path, preprocessor_path)
+
+
+def load_shared_artifacts(path: Path, weights_path: Optional[Path] = None, preprocessor_path: Optional[Path] = None,
+                          writable: bool = False) -> Tuple[CompiledFeatureEncoder, NumpyMLP]:
+    """
+    Maps the shared serving file. The weight arrays are zero-copy views of the mapping; with
+    `writable=True` the mapping is copy-on-write (needed by torch, which expects writable buffers),
+    pages are still shared until written, and serving never writes them.
+    When given (and present), `weights_path` and `preprocessor_path` must be the files the shared file was
+    built from (sha256); raises ValueError otherwise.
+    """
+    header, arrays = map_file(path, _MAGIC, writable=writable)
+    check_shared_sources(path, header, weights_path, preprocessor_path)
+    encoder = encoder_from_header(header["encoder"])
+    model = folded_model_from_arrays(arrays, header["model"]["num_layers"], header["model"]["activation_fn"])
+    return encoder, model
@@ -0,0 +1,130 @@
+"""
+torch_backend.py: PyTorch inference backend (frozen TorchScript graph or eager CreditScoringModel).
+"""
+
+import os
+import sys
+import torch
+import torch.nn as nn
+import numpy as np
+import logging as log
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.training.model import CreditScoringModel
+from src.inference.artifacts import frozen_model_path, is_up_to_date
+from src.inference.quantization import quantize_dynamic_int8
+
+
+class TorchBackend:
+    """
+    Runs the forward pass with PyTorch. Prefers the frozen TorchScript graph when it is up to date, then
+    `shared_model` (a NumpyMLP mapped from the shared serving file or the bundle, whose buffers the Linear layers
+    use directly), then the eager model from the `.pt` weights.
+    With `quantized=True` the Linear layers of the eager model run with dynamic int8 quantization (CPU only);
+    `state_dict` (from the bundle) replaces its `.pt` weights.
+    `num_threads > 0` sets the torch intra-op thread pool (process wide) used by each forward pass.
+    """
+    def __init__(self, model_path: Path, model_config: Dict[str, Any], quantized: bool = False, num_threads: int = 0,
+                 shared_model: Optional[Any] = None, state_dict: Optional[Dict[str, torch.Tensor]] = None):
+        if num_threads > 0 and torch.get_num_threads() != num_threads:
+            torch.set_num_threads(num_threads)
+            log.info(f"✔ Threads intra-op de torch: {num_threads}")
+        self.model_path = Path(model_path)
+        self.model_config = model_config
+        self.quantized = quantized
+        self.state_dict = state_dict
+        if quantized:
+            self.model = self._load_quantized_model()
+        else:
+            self.model = self._load_frozen_model()
+            if self.model is None:
+                self.model = self._load_shared_model(shared_model) if shared_model is not None else self._load_eager_model()
+
+    @property
+    def name(self) -> str:
+        return "torch_int8" if self.quantized else "torch"
+
+    def _load_quantized_model(self):
+        model = self._load_eager_model()
+        try:
+            quantized_model = quantize_dynamic_int8(model)
+            log.info("✔ Modelo cuantizado dinámicamente a int8 (capas Linear).")
+            return quantized_model
+        except Exception as e:
+            log.warning(f"✘ No se pudo cuantizar el modelo, se usará fp32: {e}")
+            self.quantized = False
+            return model
+
+    def _load_shared_model(self, shared_model):
+        """
+        Folded Linear -> activation graph whose parameters are zero-copy views of the shared mapping.
+        """
+        activations = {"ReLU": nn.ReLU, "LeakyReLU": nn.LeakyReLU, "GELU": nn.GELU}
+        layers = []
+        last = len(shared_model.weights_t) - 1
+        for i, (w_t, b) in enumerate(zip(shared_model.weights_t, shared_model.biases)):
+            linear = nn.Linear(w_t.shape[0], w_t.shape[1])
+            # (in, out) buffer -> (out, in) view, no copy
+            linear.weight = nn.Parameter(torch.from_numpy(w_t).t(), requires_grad=False)
+            linear.bias = nn.Parameter(torch.from_numpy(b), requires_grad=False)
+            layers.append(linear)
+            if i < last:
+                layers.append(activations[shared_model.activation_fn]())
+        log.info("✔ Pesos del modelo mapeados desde los artefactos compartidos.")
+        return nn.Sequential(*layers).eval()
+
+    def _load_frozen_model(self) -> Optional[torch.jit.ScriptModule]:
+        """
+        Frozen TorchScript graph exported next to the `.pt` weights, or None when it is missing, stale or unreadable.
+        """
+        frozen_path = frozen_model_path(self.model_path)
+        if is_up_to_date(frozen_path, self.model_path):
+            # frozen graph: BatchNorm folded into Linear, no Dropout
+            try:
+                model = torch.jit.load(str(frozen_path), map_location=torch.device('cpu'))
+                model.eval()
+                log.info(f"✔ Grafo TorchScript congelado cargado desde: {frozen_path}")
+                return model
+            except Exception as e:
+                log.warning(f"✘ No se pudo cargar el grafo congelado {frozen_path}, se usarán los pesos: {e}")
+        elif frozen_path.exists():
+            log.warning(f"✘ El grafo congelado {frozen_path} es más antiguo que los pesos; se ignora.")
+        return None
+
+    def _load_eager_model(self):
+        try:
+            # Recreate the architecture of the model
+            model = CreditScoringModel(
+                num_features=self.model_config['num_features'], # Este valor debe ser el correcto post-procesamiento
+                hidden_layers=self.model_config['hidden_layers'],
+                dropout_rate=self.model_config['dropout_rate'],
+                use_batch_norm=self.model_config['use_batch_norm'],
+                activation_fn=self.model_config['activation_fn']
+            )
+            # load weights trained
+            if self.state_dict is not None:
+                model.load_state_dict(self.state_dict)
+                log.info("✔ Pesos del modelo cargados desde el bundle.")
+            else:
+                model.load_state_dict(torch.load(self.model_path, map_location=torch.device('cpu')))
+                log.info(f"✔ Pesos del modelo cargados desde: {self.model_path}")
+            model.eval()  # mode: eval
+            return model
+        except FileNotFoundError:
+            log.error(f"✘ Archivo de modelo no encontrado en {self.model_path}")
+            raise
+        except Exception as e:
+            log.error(f"✘ Error al cargar el modelo: {e}")
+            raise
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """
+        Probability of 'good' for each row of a (n, num_features) float32 array.
+        """
+        # wrap the buffer as a Pytorch tensor (no copy)
+        input_tensor = torch.from_numpy(features)
+        with torch.no_grad():
+            logits = self.model(input_tensor)
+            return torch.sigmoid(logits).view(-1).numpy()
@@ -1,26 +1,75 @@
 """
-python/credit_scoring/src/server/app.py:  uses FastAPI to create the /predict endpoint that receives the data, passes it to the predictor_instance, and returns the result.
+python/credit_scoring/src/server/app.py:  uses FastAPI to create the /predict endpoint that receives the data, passes it to the predictor, and returns the result.
 """
 
 import os
 import sys
+import time
+import asyncio
 import logging as log
+from typing import List
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import RedirectResponse
+from fastapi import FastAPI, HTTPException, Request, Depends, Header
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import RedirectResponse, JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from src.server.schemas import CreditRiskInput, CreditRiskOutput
-from src.inference.predictor import predictor_instance
+from src.server.schemas import CreditRiskInput, CreditRiskOutput, CreditRiskExplanation
+from src.inference.predictor import CreditRiskPredictor, build_registry
+from src.inference.batching import MicroBatcher
+from src.inference.executor import InferenceExecutor, InferenceOverloadedError
+from src.core.config import settings
+from src.core.metrics import REGISTRY, HTTP_REQUESTS, HTTP_REQUEST_SECONDS, STAGE_SECONDS, MICROBATCH_REQUESTS
+from src.core.structured_logging import configure_logging, shutdown_logging, dropped_records, sample
 
 log.basicConfig(level=log.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+
+async def load_predictor(app: FastAPI):
+    """
+    Loads and warms up the configured model version off the event loop. The service is ready once this
+    finishes; a bad artifact leaves the pod alive (liveness) but never ready (readiness).
+    """
+    try:
+        await run_in_threadpool(app.state.registry.activate, settings.MODEL_VERSION)
+        log.info("✔ Servicio listo para recibir tráfico.")
+    except Exception as e:
+        app.state.load_error = str(e)
+        log.error(f"✘ Error al cargar los artefactos del modelo: {e}", exc_info=True)
+        return
+    if settings.SHADOW_MODEL_VERSIONS:
+        # shadow models never gate readiness: traffic is served by the primary model meanwhile
+        try:
+            await run_in_threadpool(app.state.registry.enable_shadow, settings.SHADOW_MODEL_VERSIONS, settings.SHADOW_QUEUE_MAX_SIZE)
+        except Exception as e:
+            log.error(f"✘ Error al cargar los modelos shadow: {e}", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    configure_logging(settings.LOG_LEVEL, settings.LOG_FORMAT, settings.LOG_QUEUE_MAX_SIZE)
+    app.state.registry = build_registry()
+    app.state.load_error = None
+    app.state.background_tasks = set()
+    loader = asyncio.create_task(load_predictor(app))
+    if settings.BATCHING_ENABLED:
+        batcher.start()
+    yield
+    loader.cancel()
+    await batcher.stop()
+    if app.state.registry.shadow is not None:
+        app.state.registry.shadow.close()
+    shutdown_logging()
+
+
 # init FastAPI
 app = FastAPI(
     title="API de Inferencia para Scoring de Crédito",
     description="Un microservicio para predecir el riesgo crediticio usando un modelo MLP con PyTorch.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 origins = [
@@ -37,18 +86,170 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """
+    Latency and status of every request, labelled with the route template (not the raw path).
+    """
+    if not REGISTRY.enabled:
+        return await call_next(request)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", "unmatched")
+        HTTP_REQUEST_SECONDS.observe(time.perf_counter() - start, route_path)
+        HTTP_REQUESTS.inc(route_path, str(status))
+
+
+def _predict_batch_without_lookup(items: List[CreditRiskInput]):
+    # the endpoint already looked up the cache before enqueuing
+    return app.state.registry.active.predict_batch(items, cache_lookup=False)
+
+
+# executor de inferencia: el preprocesamiento y el forward pass nunca bloquean el event loop
+inference_executor = InferenceExecutor(
+    max_workers=settings.INFERENCE_THREADS,
+    max_pending=settings.INFERENCE_MAX_PENDING
+)
+
+
+def _observe_microbatch(queue_waits: List[float]):
+    MICROBATCH_REQUESTS.observe(len(queue_waits))
+    for wait in queue_waits:
+        STAGE_SECONDS.observe(wait, "queue_wait")
+
+
+# micro-batcher: agrupa solicitudes concurrentes en un solo forward pass
+batcher = MicroBatcher(
+    predict_batch_fn=_predict_batch_without_lookup,
+    max_batch_size=settings.BATCH_MAX_SIZE,
+    max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+    executor=inference_executor,
+    on_batch=_observe_microbatch,
+    # one batch in flight per inference thread
+    max_concurrent_batches=inference_executor.num_threads
+)
+
+
+# gauges de /metrics: se evalúan al renderizar, sobre el estado actual de cada componente
+def _cache_gauges():
+    registry = getattr(app.state, "registry", None)
+    predictor = registry.active if registry is not None else None
+    if predictor is None or predictor.cache is None:
+        return []
+    stats = predictor.cache.stats()
+    return [((name,), stats[name]) for name in ("size", "hits", "misses", "evictions", "expirations")]
+
+
+def _executor_gauges():
+    stats = inference_executor.stats()
+    return [((name,), stats[name]) for name in ("pending", "max_pending", "rejected", "threads")]
+
+
+def _drift_gauges():
+    registry = getattr(app.state, "registry", None)
+    predictor = registry.active if registry is not None else None
+    if predictor is None or predictor.drift is None:
+        return []
+    return [((feature,), value) for feature, value in predictor.drift.psi_values().items()]
+
+
+REGISTRY.register_gauge("credit_scoring_prediction_cache", "Prediction cache size and counters of the active model.", _cache_gauges, ("stat",))
+REGISTRY.register_gauge("credit_scoring_inference_executor", "Inference executor occupancy and 429 rejections.", _executor_gauges, ("stat",))
+REGISTRY.register_gauge("credit_scoring_feature_psi", "Population stability index of each input feature against the training data.",
+                        _drift_gauges, ("feature",))
+REGISTRY.register_gauge("credit_scoring_log_records_dropped", "Log records dropped because the logging queue was full.",
+                        lambda: [((), dropped_records())])
+
+
+def _log_prediction(request: CreditRiskInput, result: dict, source: str):
+    """
+    One structured record per sampled request (LOG_REQUEST_SAMPLE_RATE); the payload is only
+    serialized when the record is going to be emitted.
+    """
+    if not (log.getLogger().isEnabledFor(log.INFO) and sample(settings.LOG_REQUEST_SAMPLE_RATE)):
+        return
+    start = time.perf_counter()
+    log.info("✔ Predicción generada", extra={"fields": {
+        "request": request.dict(by_alias=True),
+        "prediction": result["prediction"],
+        "probability": round(result["probability"], 6),
+        "source": source
+    }})
+    STAGE_SECONDS.observe(time.perf_counter() - start, "request_log")
+
+
+def _overloaded(e: InferenceOverloadedError) -> HTTPException:
+    log.warning(f"✘ Solicitud rechazada por saturación: {e}")
+    return HTTPException(
+        status_code=429,
+        detail="El servicio está saturado. Intenta de nuevo en unos segundos.",
+        headers={"Retry-After": "1"}
+    )
+
+
+def get_predictor(request: Request) -> CreditRiskPredictor:
+    """
+    Returns the loaded predictor or rejects the request fast with 503 while the model is loading.
+    """
+    registry = getattr(request.app.state, "registry", None)
+    predictor = registry.active if registry is not None else None
+    if predictor is None:
+        raise HTTPException(
+            status_code=503,
+            detail="El modelo aún no está listo. Intenta de nuevo en unos segundos.",
+            headers={"Retry-After": "1"}
+        )
+    return predictor
+
+
 # EndPoint API
 @app.get("/", include_in_schema=False)
 async def root():
     """Redirige a la documentación de la API."""
     return RedirectResponse(url="/docs")
 
+
+@app.get("/healthz", tags=["Health"])
+async def health_check():
+    """Verifica que el servicio esté vivo"""
+    return {"status": "ok", "service": "credit_scoring"}
+
+
+@app.get("/readyz", tags=["Health"])
+async def readiness_check(request: Request):
+    """Verifica que el modelo esté cargado y listo para recibir tráfico"""
+    registry = getattr(request.app.state, "registry", None)
+    if registry is not None and registry.active is not None:
+        predictor = registry.active
+        return {
+            "status": "ready",
+            "service": "credit_scoring",
+            "model_version": registry.active_version,
+            "model": predictor.model_path.name,
+            "backend": predictor.backend.name,
+            "bundle_sha256": predictor.bundle.checksum if predictor.bundle is not None else None,
+            "calibration": predictor.calibrator.method,
+            "threshold": predictor.threshold
+        }
+    load_error = getattr(request.app.state, "load_error", None)
+    if load_error is not None:
+        return JSONResponse(status_code=503, content={"status": "error", "service": "credit_scoring", "detail": load_error})
+    return JSONResponse(status_code=503, content={"status": "loading", "service": "credit_scoring"})
+
+
 @app.post("/mlp_demo", 
           response_model=CreditRiskOutput,
           tags=["Predicciones"],
           summary="Realiza una predicción de riesgo crediticio")
 
-async def predict_credit_risk(request: CreditRiskInput) -> CreditRiskOutput:
+async def predict_credit_risk(request: CreditRiskInput, predictor: CreditRiskPredictor = Depends(get_predictor)) -> CreditRiskOutput:
     """
     Receives applicant data and returns a credit risk prediction.
     
@@ -56,18 +257,195 @@ async def predict_credit_risk(request: CreditRiskInput) -> CreditRiskOutput:
     - Output: JSON with the prediction (good or bad) and the associated probability.
     """
     try:
-        log.info(f"Recibida solicitud para predicción: {request.dict(by_alias=True)}")
-        prediction_result = predictor_instance.predict(request)
+        # repeated payloads are answered from the cache without waiting for a batch
+        prediction_result = predictor.lookup(request)
+        source = "cache"
+        if prediction_result is None:
+            source = "model"
+            with inference_executor.admit():
+                if batcher.is_running:
+                    prediction_result = await batcher.submit(request)
+                else:
+                    loop = asyncio.get_running_loop()
+                    prediction_result = await loop.run_in_executor(inference_executor, predictor.predict, request, False)
+        _log_prediction(request, prediction_result, source)
         return CreditRiskOutput(**prediction_result)
+    except InferenceOverloadedError as e:
+        raise _overloaded(e)
     except Exception as e:
         log.error(f"Error durante la predicción: {e}", exc_info=True)
         raise HTTPException(
             status_code=500, 
             detail=f"Ocurrió un error interno al procesar la solicitud: {e}"
         )
+
+
+@app.post("/mlp_demo/batch",
+          response_model=List[CreditRiskOutput],
+          tags=["Predicciones"],
+          summary="Realiza predicciones de riesgo crediticio para un lote de solicitantes")
+
+async def predict_credit_risk_batch(requests: List[CreditRiskInput], predictor: CreditRiskPredictor = Depends(get_predictor)) -> List[CreditRiskOutput]:
+    """
+    Receives a list of applicants and returns one credit risk prediction per applicant, in the same order.
+    
+    - Input: JSON array with applicant attributes.
+    - Output: JSON array with the prediction (good or bad) and the associated probability.
+    """
+    if len(requests) > settings.BATCH_ENDPOINT_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"El lote contiene {len(requests)} solicitantes; el máximo permitido es {settings.BATCH_ENDPOINT_MAX_ITEMS}."
+        )
+    try:
+        log.info("Recibida solicitud de predicción por lote con %d solicitantes.", len(requests))
+        with inference_executor.admit():
+            loop = asyncio.get_running_loop()
+            prediction_results = await loop.run_in_executor(inference_executor, predictor.predict_batch, requests)
+        return [CreditRiskOutput(**result) for result in prediction_results]
+    except InferenceOverloadedError as e:
+        raise _overloaded(e)
+    except Exception as e:
+        log.error(f"Error durante la predicción por lote: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500, 
+            detail=f"Ocurrió un error interno al procesar la solicitud: {e}"
+        )
+
+
+@app.post("/mlp_demo/explain",
+          response_model=CreditRiskExplanation,
+          tags=["Predicciones"],
+          summary="Explica una predicción de riesgo crediticio con el aporte de cada campo")
+
+async def explain_credit_risk(request: CreditRiskInput, predictor: CreditRiskPredictor = Depends(get_predictor)) -> CreditRiskExplanation:
+    """
+    Receives applicant data and returns the prediction together with per-field attributions
+    (integrated gradients over the model logit), so underwriters can see why it was scored 'good' or 'bad'.
+    """
+    try:
+        with inference_executor.admit():
+            loop = asyncio.get_running_loop()
+            explanations = await loop.run_in_executor(inference_executor, predictor.explain, [request])
+        return CreditRiskExplanation(**explanations[0])
+    except InferenceOverloadedError as e:
+        raise _overloaded(e)
+    except Exception as e:
+        log.error(f"Error durante la explicación: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500, 
+            detail=f"Ocurrió un error interno al procesar la solicitud: {e}"
+        )
+
+
+@app.get("/cache/stats", tags=["Monitoreo"], summary="Estadísticas del caché de predicciones")
+async def prediction_cache_stats(predictor: CreditRiskPredictor = Depends(get_predictor)):
+    """
+    Returns hit/miss/eviction counters of the prediction cache.
+    """
+    if predictor.cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **predictor.cache.stats()}
+
+
+@app.get("/metrics", tags=["Monitoreo"], summary="Métricas en formato de texto de Prometheus", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """
+    Per-stage latency histograms, request counters and batch-size distributions of this worker process.
+    """
+    if not REGISTRY.enabled:
+        raise HTTPException(status_code=404, detail="Las métricas están deshabilitadas (METRICS_ENABLED=false).")
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/monitoring/drift", tags=["Monitoreo"], summary="Drift de la distribución de entradas contra los datos de entrenamiento")
+async def input_drift(request: Request, predictor: CreditRiskPredictor = Depends(get_predictor)):
+    """
+    Returns, per input feature, the live distribution of the applicants scored by the active model in this
+    worker (cache hits included) next to the training reference, with PSI (and KS for numerical features).
+    """
+    if predictor.drift is None:
+        return {"enabled": False}
+    return {"enabled": True, "model_version": request.app.state.registry.active_version, **predictor.drift.report()}
+
+
+@app.get("/inference/stats", tags=["Monitoreo"], summary="Ocupación del executor de inferencia")
+async def inference_executor_stats():
+    """
+    Returns the inference threads, requests in flight and requests rejected with 429.
+    """
+    return inference_executor.stats()
+
+
+@app.get("/shadow/stats", tags=["Monitoreo"], summary="Comparación en vivo de los modelos shadow contra el modelo activo")
+async def shadow_scoring_stats(request: Request):
+    """
+    Returns, for each shadow model, the agreement rate and probability deltas against the active model
+    over the live traffic scored since the active version was loaded.
+    """
+    registry = getattr(request.app.state, "registry", None)
+    if registry is None or registry.shadow is None:
+        return {"enabled": False}
+    return {"enabled": True, **registry.shadow.stats()}
+
+
+def require_admin(x_admin_token: str = Header(default="")):
+    """
+    Admin endpoints require the X-Admin-Token header; they are disabled when ADMIN_TOKEN is not configured.
+    """
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Los endpoints de administración están deshabilitados (ADMIN_TOKEN no configurado).")
+    if x_admin_token != settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=401, detail="Token de administración inválido.")
+
+
+@app.get("/admin/models", tags=["Administración"], summary="Versiones de modelo disponibles y activa", dependencies=[Depends(require_admin)])
+async def list_model_versions(request: Request):
+    """
+    Returns the active model version, the versions available in models/ and the swap history.
+    """
+    return request.app.state.registry.status()
+
+
+@app.post("/admin/drift/reset", tags=["Administración"], summary="Reinicia la ventana de monitoreo de drift",
+          dependencies=[Depends(require_admin)])
+async def reset_input_drift(predictor: CreditRiskPredictor = Depends(get_predictor)):
+    """
+    Clears the drift sketches of the active model in this worker (e.g. after a known change in the traffic).
+    """
+    if predictor.drift is None:
+        raise HTTPException(status_code=404, detail="El monitoreo de drift no está habilitado para el modelo activo.")
+    predictor.drift.reset()
+    return {"status": "reset"}
+
+
+@app.post("/admin/models/{version}/activate", status_code=202, tags=["Administración"],
+          summary="Activa otra versión del modelo sin downtime", dependencies=[Depends(require_admin)])
+async def activate_model_version(version: str, request: Request):
+    """
+    Loads `version` in the background, warms it up with synthetic batches and atomically swaps the active predictor.
+    In-flight requests finish on the previous version.
+    """
+    registry = request.app.state.registry
+    if version not in registry.available_versions():
+        raise HTTPException(status_code=404, detail=f"Versión de modelo desconocida: {version}")
+    if registry.loading_version is not None:
+        raise HTTPException(status_code=409, detail=f"Ya se está cargando la versión {registry.loading_version}.")
+
+    async def swap():
+        try:
+            await run_in_threadpool(registry.activate, version)
+        except Exception:
+            pass  # already logged and exposed in registry.last_error
+
+    task = asyncio.create_task(swap())
+    # keep a reference so the task is not garbage collected before it finishes
+    request.app.state.background_tasks.add(task)
+    task.add_done_callback(request.app.state.background_tasks.discard)
+    return {"status": "loading", "version": version, "active_version": registry.active_version}
         
 
 """
 local execute:
 uvicorn src.server.app:app --reload
-"""
\ No newline at end of file
+"""
@@ -3,6 +3,7 @@ python/credit_scoring/src/server/schemas.py: this file ensures that data enterin
 """
 
 from enum import Enum
+from typing import Dict
 from pydantic import BaseModel, Field
 
 
@@ -84,5 +85,14 @@ class CreditRiskOutput(BaseModel):
     """
     prediction: str = Field(..., description="Predicción del riesgo ('good' o 'bad').")
     probability: float = Field(..., ge=0, le=1, description="Probabilidad de que el riesgo sea 'good'.")
-    
-        
\ No newline at end of file
+
+
+class CreditRiskExplanation(CreditRiskOutput):
+    """
+    Prediction plus the contribution of each input field (integrated gradients, log-odds).
+    """
+    baseline_probability: float = Field(..., ge=0, le=1, description="Probabilidad del solicitante de referencia (features numéricas en la media, sin categorías).")
+    attributions: Dict[str, float] = Field(..., description="Aporte de cada campo al log-odds de 'good': positivo acerca a 'good', negativo a 'bad'.")
+    convergence_delta: float = Field(..., description="Diferencia entre la suma de aportes y logit(solicitante) - logit(referencia).")
+    method: str = Field(..., description="Método de atribución.")
+    steps: int = Field(..., description="Pasos de interpolación de integrated gradients.")
@@ -0,0 +1,92 @@
+"""
+serve.py: production entry point of the API (multi-process, no --reload).
+
+Runs `WEB_CONCURRENCY` uvicorn worker processes. Each worker memory-maps the same
+`models/<model>.bundle` (or `models/<model>.shared.bin`: compiled encoder + folded weights) instead of loading the `.pt`
+weights and the joblib preprocessor on its own, so extra workers add almost no model memory and
+become ready as soon as the mapping is open.
+"""
+
+import os
+import sys
+import argparse
+import logging as log
+
+import uvicorn
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.core.config import settings, _available_cores
+from src.inference.artifacts import shared_artifacts_path, bundle_path, is_up_to_date
+from src.inference.predictor import PREPROCESSOR_PATH, build_registry
+from src.inference.shared_artifacts import verify_shared_artifacts
+
+log.basicConfig(level=log.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def check_shared_artifacts(version: str) -> bool:
+    """
+    True when the bundle of `version` exists and is newer than its `.pt` weights (the bundle checks the preprocessor
+    by sha256 when loaded), or when its shared serving file was built from the current `.pt` weights and
+    preprocessor (sha256 recorded in its header).
+    """
+    versions = build_registry().available_versions()
+    if version not in versions:
+        log.warning(f"✘ Versión de modelo desconocida: {version}. Disponibles: {sorted(versions)}")
+        return False
+    model_path = versions[version]["model_path"]
+    path_bundle = bundle_path(model_path)
+    if settings.MODEL_BUNDLE_ENABLED and is_up_to_date(path_bundle, model_path):
+        log.info(f"✔ Los workers mapearán el bundle del modelo: {path_bundle}")
+        return True
+    shared_path = shared_artifacts_path(model_path)
+    try:
+        verify_shared_artifacts(shared_path, model_path, PREPROCESSOR_PATH)
+    except (OSError, ValueError) as e:
+        log.warning(
+            f"✘ {shared_path} no existe o está desactualizado ({e}): cada worker cargará sus propios artefactos. "
+            "Ejecuta `python -m src.inference.export` para generarlo."
+        )
+        return False
+    log.info(f"✔ Los workers mapearán los artefactos compartidos: {shared_path}")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Production server for the credit scoring API.")
+    parser.add_argument("--host", type=str, default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8080")))
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS, help="Worker processes (WEB_CONCURRENCY).")
+    cli_args = parser.parse_args()
+
+    workers = max(1, cli_args.workers)
+    check_shared_artifacts(settings.MODEL_VERSION)
+
+    # workers are spawned and read their settings from the environment
+    os.environ.setdefault("SHARED_ARTIFACTS_ENABLED", "true")
+    # split the cores among workers so workers x inference threads x torch threads ~= available cores
+    os.environ.setdefault(
+        "TORCH_NUM_THREADS",
+        str(max(1, _available_cores() // (workers * max(1, settings.INFERENCE_THREADS))))
+    )
+    log.info(
+        f"--- Iniciando {workers} workers en {cli_args.host}:{cli_args.port} "
+        f"(torch threads por worker: {os.environ['TORCH_NUM_THREADS']}) ---"
+    )
+    uvicorn.run(
+        "src.server.app:app",
+        host=cli_args.host,
+        port=cli_args.port,
+        workers=workers,
+        proxy_headers=True,
+        forwarded_allow_ips="*",
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE_SECONDS
+    )
+
+
+if __name__ == "__main__":
+    main()
+
+"""
+production execute:
+python -m src.server.serve --port 8080 --workers 4
+"""
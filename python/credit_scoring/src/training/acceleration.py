@@ -0,0 +1,94 @@
+"""
+acceleration.py: mixed precision and torch.compile for training, configured by `training_params.acceleration`.
+
+- precision: `bf16` runs the forward pass and the loss of every training step under `torch.autocast` with
+  bfloat16 (weights, optimizer state and gradients stay fp32; BCEWithLogitsLoss autocasts to fp32).
+  Falls back to fp32 when the device has no native bf16 support (on CPU: oneDNN bf16, AVX512-BF16 / AMX),
+  where emulated bf16 is slower than fp32.
+- compile: `torch.compile` of `CreditScoringModel` for the training steps. The compiled module shares the
+  parameters of the eager model, so checkpoints, evaluation and the exported artifacts use the eager one.
+  Compilation is forced by a probe step on a sample batch; any failure (no C++ compiler, unsupported
+  platform or torch version) falls back to eager mode.
+"""
+
+import time
+import torch
+import torch.nn as nn
+import logging as log
+from contextlib import AbstractContextManager
+from typing import Any, Dict, Optional
+
+PRECISIONS = ("fp32", "bf16")
+COMPILE_MODES = ("default", "reduce-overhead", "max-autotune")
+
+DEFAULT_ACCELERATION_CONFIG: Dict[str, Any] = {
+    "precision": "fp32",
+    "compile": False,
+    "compile_mode": "default",
+}
+
+
+def bf16_supported(device: torch.device) -> bool:
+    """Native bfloat16 support of the device."""
+    if device.type == "cuda":
+        return torch.cuda.is_bf16_supported()
+    try:
+        return bool(torch.backends.mkldnn.is_available() and torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except (AttributeError, RuntimeError):
+        return False
+
+
+def resolve_acceleration_config(config: Optional[Dict[str, Any]], device: torch.device) -> Dict[str, Any]:
+    """
+    `training_params.acceleration` merged over the defaults, with bf16 downgraded to fp32 when unsupported.
+    """
+    resolved = {**DEFAULT_ACCELERATION_CONFIG, **(config or {})}
+    if resolved["precision"] not in PRECISIONS:
+        raise ValueError(f"acceleration.precision not supported: {resolved['precision']} (use {', '.join(PRECISIONS)}).")
+    if resolved["compile_mode"] not in COMPILE_MODES:
+        raise ValueError(f"acceleration.compile_mode not supported: {resolved['compile_mode']} (use {', '.join(COMPILE_MODES)}).")
+    resolved["compile"] = bool(resolved["compile"])
+    if resolved["precision"] == "bf16" and not bf16_supported(device):
+        log.warning(f"✘ bf16 is not natively supported on this {device.type}: training in fp32.")
+        resolved["precision"] = "fp32"
+    return resolved
+
+
+def autocast_context(config: Dict[str, Any], device: torch.device) -> AbstractContextManager:
+    """Autocast of the training steps (a no-op context in fp32)."""
+    return torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=config["precision"] == "bf16")
+
+
+def compile_for_training(model: nn.Module, config: Dict[str, Any], criterion: nn.Module, x_sample: torch.Tensor,
+                         y_sample: torch.Tensor, device: torch.device) -> nn.Module:
+    """
+    Compiled module sharing the parameters of `model`, or `model` itself when compile is disabled or fails.
+    The probe forward/backward leaves the model untouched: gradients are cleared, BatchNorm running
+    statistics restored and the RNG stream (Dropout) preserved.
+    """
+    if not config["compile"]:
+        return model
+    if not hasattr(torch, "compile"):
+        log.warning(f"✘ torch.compile is not available in torch {torch.__version__}: training in eager mode.")
+        return model
+
+    buffers = {name: buffer.detach().clone() for name, buffer in model.named_buffers()}
+    started = time.perf_counter()
+    try:
+        compiled = torch.compile(model, mode=config["compile_mode"])
+        model.train()
+        with torch.random.fork_rng():
+            with autocast_context(config, device):
+                loss = criterion(compiled(x_sample), y_sample)
+            loss.backward()
+    except Exception as e:
+        log.warning(f"✘ torch.compile failed ({type(e).__name__}: {e}): training in eager mode.")
+        compiled = model
+    finally:
+        model.zero_grad(set_to_none=True)
+        with torch.no_grad():
+            for name, buffer in model.named_buffers():
+                buffer.copy_(buffers[name])
+    if compiled is not model:
+        log.info(f"✔ model compiled with torch.compile (mode={config['compile_mode']}) in {time.perf_counter() - started:.1f}s")
+    return compiled
@@ -0,0 +1,52 @@
+"""
+classification_metrics.py: binary classification metrics with vectorized torch ops.
+
+Used by the training loop every epoch, on the device the tensors already live on, instead of copying them to
+NumPy for sklearn. Results match sklearn's `accuracy_score`, `precision_recall_fscore_support(average='binary',
+zero_division=0)` and `roc_auc_score` (ties get their average rank).
+"""
+
+import torch
+from typing import Dict
+
+
+def roc_auc(y_true: torch.Tensor, scores: torch.Tensor) -> float:
+    """
+    ROC-AUC as the normalized Mann-Whitney U statistic; NaN when only one class is present.
+    """
+    positives = y_true.reshape(-1) > 0.5
+    scores = scores.reshape(-1).to(torch.float64)
+    n_pos = int(positives.sum())
+    n_neg = positives.numel() - n_pos
+    if n_pos == 0 or n_neg == 0:
+        return float("nan")
+    sorted_scores, order = torch.sort(scores)
+    _, inverse, counts = torch.unique_consecutive(sorted_scores, return_inverse=True, return_counts=True)
+    # 1-based average rank of every group of tied scores
+    average_ranks = torch.cumsum(counts, 0).to(torch.float64) - (counts.to(torch.float64) - 1) / 2
+    rank_sum = average_ranks[inverse][positives[order]].sum()
+    return float((rank_sum - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg))
+
+
+def binary_classification_metrics(y_true: torch.Tensor, y_prob: torch.Tensor, threshold: float = 0.5) -> Dict[str, float]:
+    """
+    accuracy, precision, recall, f1 and roc_auc of the probabilities of the positive class.
+    """
+    positives = y_true.reshape(-1) > 0.5
+    y_prob = y_prob.reshape(-1)
+    predicted = y_prob >= threshold
+    counts = torch.stack([
+        (predicted & positives).sum(),   # tp
+        (predicted & ~positives).sum(),  # fp
+        (~predicted & positives).sum(),  # fn
+    ]).tolist()  # a single device -> host copy
+    tp, fp, fn = counts
+    n = positives.numel()
+    tn = n - tp - fp - fn
+    return {
+        "accuracy": (tp + tn) / n if n else float("nan"),
+        "precision": tp / (tp + fp) if tp + fp else 0.0,
+        "recall": tp / (tp + fn) if tp + fn else 0.0,
+        "f1": 2 * tp / (2 * tp + fp + fn) if tp + fp + fn else 0.0,
+        "roc_auc": roc_auc(y_true, y_prob),
+    }
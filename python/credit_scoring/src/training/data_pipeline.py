@@ -0,0 +1,151 @@
+"""
+data_pipeline.py: training input pipeline configured by `training_params.data_loader` of the training YAML.
+
+Two modes:
+- memory: the preprocessed training split is held as tensors. Each step gathers a whole mini-batch with a
+  single indexing operation (BatchSampler over a RandomSampler), reshuffled every epoch by a seeded generator.
+- streaming: the preprocessed split is written as `.npy` chunk files and read back memory-mapped, one chunk at
+  a time (chunk order and rows within each chunk reshuffled every epoch), so only the chunks in flight are resident.
+  Every loader writes into its own `run-*` directory under `chunk_dir`, removed with the dataset, so concurrent
+  runs (e.g. sweep trials) never overwrite each other's chunks.
+
+Both run through a `DataLoader`, so `num_workers` worker processes can prefetch `prefetch_factor` batches each,
+and batches can be placed in pinned (page-locked) memory for asynchronous host-to-GPU copies.
+"""
+
+import shutil
+import weakref
+import tempfile
+import numpy as np
+import logging as log
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import torch
+from torch.utils.data import DataLoader, TensorDataset, IterableDataset, BatchSampler, RandomSampler, SequentialSampler, get_worker_info
+
+DATA_LOADER_MODES = ("memory", "streaming")
+
+DEFAULT_DATA_LOADER_CONFIG: Dict[str, Any] = {
+    "mode": "memory",
+    "shuffle": True,
+    "num_workers": 0,
+    "prefetch_factor": 2,
+    "pin_memory": "auto",
+    "drop_last": False,
+    "chunk_rows": 4096,
+    "chunk_dir": "cache/train_chunks",
+}
+
+
+def resolve_data_loader_config(config: Optional[Dict[str, Any]], device: torch.device) -> Dict[str, Any]:
+    """
+    `training_params.data_loader` merged over the defaults; `pin_memory: auto` pins only when training on CUDA.
+    """
+    resolved = {**DEFAULT_DATA_LOADER_CONFIG, **(config or {})}
+    if resolved["mode"] not in DATA_LOADER_MODES:
+        raise ValueError(f"data_loader.mode not supported: {resolved['mode']} (use {', '.join(DATA_LOADER_MODES)}).")
+    if resolved["pin_memory"] == "auto":
+        resolved["pin_memory"] = device.type == "cuda"
+    resolved["pin_memory"] = bool(resolved["pin_memory"]) and torch.cuda.is_available()
+    if int(resolved["num_workers"]) < 0 or int(resolved["chunk_rows"]) < 1:
+        raise ValueError("data_loader.num_workers must be >= 0 and data_loader.chunk_rows >= 1.")
+    return resolved
+
+
+def write_chunks(x: np.ndarray, y: np.ndarray, directory: Path, chunk_rows: int) -> List[Path]:
+    """
+    Writes (x, y) as `x_00000.npy` / `y_00000.npy` chunk pairs of at most `chunk_rows` rows.
+    Chunks of a previous run in the same directory are removed first.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for stale in list(directory.glob("x_*.npy")) + list(directory.glob("y_*.npy")):
+        stale.unlink()
+    paths = []
+    for index, start in enumerate(range(0, len(x), chunk_rows)):
+        x_path = directory / f"x_{index:05d}.npy"
+        np.save(x_path, np.ascontiguousarray(x[start:start + chunk_rows], dtype=np.float32))
+        np.save(directory / f"y_{index:05d}.npy", np.ascontiguousarray(y[start:start + chunk_rows], dtype=np.float32))
+        paths.append(x_path)
+    return paths
+
+
+class ChunkedTensorDataset(IterableDataset):
+    """
+    Streams mini-batches from the `.npy` chunks written by `write_chunks`.
+    Chunks are split among DataLoader workers; with `shuffle`, the chunk order and the rows inside each chunk
+    are permuted with a generator seeded by (seed, epoch). Batches do not span chunks.
+    """
+    def __init__(self, directory: Path, batch_size: int, shuffle: bool = True, seed: int = 0, drop_last: bool = False):
+        self.chunk_paths = sorted(Path(directory).glob("x_*.npy"))
+        if not self.chunk_paths:
+            raise FileNotFoundError(f"No preprocessed chunks found in {directory}")
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self.drop_last = drop_last
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int):
+        """Workers get a copy of the dataset each epoch, so the epoch set here reaches them."""
+        self.epoch = epoch
+
+    def __iter__(self) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        rng = np.random.default_rng([self.seed, self.epoch])
+        order = rng.permutation(len(self.chunk_paths)) if self.shuffle else np.arange(len(self.chunk_paths))
+        worker = get_worker_info()
+        if worker is not None:
+            order = order[worker.id::worker.num_workers]
+            rng = np.random.default_rng([self.seed, self.epoch, worker.id])
+        for index in order:
+            x_path = self.chunk_paths[index]
+            x = np.load(x_path, mmap_mode="r")
+            y = np.load(x_path.with_name("y" + x_path.name[1:]), mmap_mode="r")
+            rows = rng.permutation(len(x)) if self.shuffle else np.arange(len(x))
+            for start in range(0, len(rows), self.batch_size):
+                selected = rows[start:start + self.batch_size]
+                if self.drop_last and len(selected) < self.batch_size:
+                    break
+                if not self.shuffle:
+                    selected = slice(start, start + len(selected))
+                yield torch.from_numpy(np.array(x[selected])), torch.from_numpy(np.array(y[selected]))
+
+
+def build_train_loader(x_train: torch.Tensor, y_train: torch.Tensor, batch_size: int, config: Dict[str, Any],
+                       seed: int) -> DataLoader:
+    """
+    Training DataLoader for the resolved `data_loader` config. `x_train` / `y_train` are CPU tensors;
+    in streaming mode they are written to a fresh directory under `chunk_dir` first and only read back
+    through memory-mapped chunks.
+    """
+    num_workers = int(config["num_workers"])
+    worker_options: Dict[str, Any] = {}
+    if num_workers > 0:
+        worker_options["prefetch_factor"] = int(config["prefetch_factor"])
+
+    if config["mode"] == "streaming":
+        chunk_root = Path(config["chunk_dir"])
+        chunk_root.mkdir(parents=True, exist_ok=True)
+        run_dir = Path(tempfile.mkdtemp(prefix="run-", dir=chunk_root))
+        paths = write_chunks(x_train.numpy(), y_train.numpy(), run_dir, int(config["chunk_rows"]))
+        log.info(f"✔ {len(paths)} preprocessed chunks of up to {config['chunk_rows']} rows written to {run_dir}")
+        dataset = ChunkedTensorDataset(run_dir, batch_size, shuffle=bool(config["shuffle"]), seed=seed,
+                                       drop_last=bool(config["drop_last"]))
+        # worker copies of the dataset are pickled without the finalizer; only the main process cleans up
+        weakref.finalize(dataset, shutil.rmtree, run_dir, ignore_errors=True)
+        # the dataset yields whole batches; workers are recreated every epoch so they see set_epoch
+        return DataLoader(dataset, batch_size=None, num_workers=num_workers, pin_memory=config["pin_memory"], **worker_options)
+
+    dataset = TensorDataset(x_train, y_train)
+    if config["shuffle"]:
+        generator = torch.Generator().manual_seed(seed)  # new permutation every epoch, same sequence every run
+        base_sampler = RandomSampler(dataset, generator=generator)
+    else:
+        base_sampler = SequentialSampler(dataset)
+    # each index list is gathered with one tensor indexing op instead of per-row __getitem__ + collate
+    sampler = BatchSampler(base_sampler, batch_size=batch_size, drop_last=bool(config["drop_last"]))
+    if num_workers > 0:
+        worker_options["persistent_workers"] = True
+    return DataLoader(dataset, sampler=sampler, batch_size=None, num_workers=num_workers,
+                      pin_memory=config["pin_memory"], **worker_options)
@@ -0,0 +1,361 @@
+"""
+sweep.py: parallel hyperparameter sweep over a training YAML (config/sweep/*.yaml).
+
+1. The base training config is expanded over `search_space` (hidden_layers, dropout_rate, learning_rate,
+   batch_size, activation_fn), as a full grid or a seeded random subset of it.
+2. The dataset is loaded, split and preprocessed once (or taken from the tensor cache, `tensor_cache.py`);
+   every worker process maps the `.npy` tensors copy-on-write, so trials share the same pages.
+3. Trials run in a process pool, each worker limited to `threads_per_trial` intra-op threads.
+4. Successive halving: all trials train up to the first rung (`min_epochs`), only the best
+   1/`reduction_factor` (lowest best val loss) resume up to the next rung (x `reduction_factor` epochs), and so
+   on until `training_params.epochs`. Trials keep their model / optimizer / scheduler / early stopping state
+   between rungs, and early stopping still ends a trial inside a rung.
+5. Every trial is an MLflow run nested under the sweep run (params, per-epoch metrics, `sweep_status` tag).
+   The sweep report and the training YAML of the best trial (ready for train.py) go to `reports/`.
+"""
+
+import os
+import sys
+import copy
+import time
+import yaml
+import torch
+import joblib
+import mlflow
+import argparse
+import itertools
+import numpy as np
+import logging as log
+import multiprocessing
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from mlflow.tracking import MlflowClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from src.training.train import CreditScoringModelTraining, setup_logging
+from src.training.data_pipeline import build_train_loader
+from src.training.tensor_cache import SPLIT_ARRAYS
+from src.training.acceleration import compile_for_training
+
+# search space key -> location in the training YAML
+SEARCH_SPACE_PATHS: Dict[str, Tuple[str, ...]] = {
+    "hidden_layers": ("model_config", "architecture", "hidden_layers"),
+    "dropout_rate": ("model_config", "architecture", "dropout_rate"),
+    "activation_fn": ("model_config", "architecture", "activation_fn"),
+    "learning_rate": ("training_params", "optimizer", "learning_rate"),
+    "batch_size": ("training_params", "batch_size"),
+}
+SWEEP_STRATEGIES = ("grid", "random")
+
+# tensors of the shared preprocessed data, loaded once per worker process
+_WORKER_DATA: Dict[str, torch.Tensor] = {}
+
+
+def expand_search_space(search_space: Dict[str, List[Any]], strategy: str = "grid", num_trials: int | None = None,
+                        seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Trial overrides of the search space: the full grid, or `num_trials` distinct grid points drawn with `seed`.
+    """
+    unknown = set(search_space) - set(SEARCH_SPACE_PATHS)
+    if unknown:
+        raise ValueError(f"Unsupported search space keys: {sorted(unknown)} (use {', '.join(SEARCH_SPACE_PATHS)}).")
+    if strategy not in SWEEP_STRATEGIES:
+        raise ValueError(f"sweep.strategy not supported: {strategy} (use {', '.join(SWEEP_STRATEGIES)}).")
+    keys = list(search_space)
+    grid = [dict(zip(keys, values)) for values in itertools.product(*(search_space[k] for k in keys))]
+    if strategy == "random" and num_trials is not None and num_trials < len(grid):
+        chosen = np.random.default_rng(seed).choice(len(grid), size=num_trials, replace=False)
+        grid = [grid[i] for i in sorted(chosen)]
+    return grid
+
+
+def apply_overrides(base_params: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of the training config with the trial overrides applied.
+    """
+    params = copy.deepcopy(base_params)
+    for key, value in overrides.items():
+        *parents, leaf = SEARCH_SPACE_PATHS[key]
+        node = params
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = value
+    return params
+
+
+def halving_rungs(min_epochs: int, reduction_factor: int, max_epochs: int) -> List[int]:
+    """
+    Epoch budgets of the successive halving rungs: min_epochs * reduction_factor^k, ending at max_epochs.
+    """
+    if min_epochs < 1 or reduction_factor < 2:
+        raise ValueError("successive_halving.min_epochs must be >= 1 and reduction_factor >= 2.")
+    rungs, budget = [], min_epochs
+    while budget < max_epochs:
+        rungs.append(budget)
+        budget *= reduction_factor
+    rungs.append(max_epochs)
+    return rungs
+
+
+def _init_worker(data_dir: str, threads_per_trial: int):
+    setup_logging(level=log.WARNING)
+    torch.set_num_threads(threads_per_trial)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:  # already set in this process
+        pass
+    for name in SPLIT_ARRAYS:
+        # copy-on-write mapping: pages shared by all workers, writable for torch.from_numpy
+        _WORKER_DATA[name] = torch.from_numpy(np.load(Path(data_dir) / f"{name}.npy", mmap_mode="c"))
+
+
+def _run_trial(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Trains one trial from `start_epoch` to `end_epoch`, resuming its saved state when start_epoch > 0.
+    """
+    started = time.perf_counter()
+    trial_dir = Path(task["trial_dir"])
+    trial_dir.mkdir(parents=True, exist_ok=True)
+    trainer = CreditScoringModelTraining(params=task["params"])
+    trainer.checkpoint_path = trial_dir / "best.pt"
+
+    x_train, y_train = _WORKER_DATA["x_train"], _WORKER_DATA["y_train"]
+    x_val, y_val = _WORKER_DATA["x_val"].to(trainer.device), _WORKER_DATA["y_val"].to(trainer.device)
+    model = trainer._build_model(x_train.shape[1])
+    criterion = trainer._setup_loss_function(y_train)
+    optimizer = trainer._build_optimizer(model)
+    scheduler = trainer._build_scheduler(optimizer)
+    forward_model = compile_for_training(model, trainer.acceleration_cfg, criterion, x_train[:trainer.batch_size].to(trainer.device),
+                                         y_train[:trainer.batch_size].to(trainer.device), trainer.device)
+
+    state_path = trial_dir / "state.pt"
+    if task["start_epoch"] > 0:
+        state = torch.load(state_path, map_location=trainer.device)
+        model.load_state_dict(state["model"])
+        optimizer.load_state_dict(state["optimizer"])
+        scheduler.load_state_dict(state["scheduler"])
+        trainer.early_stopping_state = state["early_stopping"]
+        trainer.history = state["history"]
+
+    # a resumed trial continues with new shuffles instead of replaying those of the first epochs
+    train_loader = build_train_loader(x_train, y_train, trainer.batch_size, trainer.data_loader_cfg,
+                                      seed=trainer.random_state + task["start_epoch"])
+    with mlflow.start_run(run_id=task["run_id"]):
+        epochs_run = trainer._run_training_loop(model, criterion, optimizer, scheduler, train_loader, x_val, y_val,
+                                                start_epoch=task["start_epoch"], end_epoch=task["end_epoch"],
+                                                forward_model=forward_model)
+    torch.save({
+        "model": model.state_dict(),
+        "optimizer": optimizer.state_dict(),
+        "scheduler": scheduler.state_dict(),
+        "early_stopping": trainer.early_stopping_state,
+        "history": trainer.history,
+    }, state_path)
+
+    best_val_loss = trainer.early_stopping_state["best_val_loss"]
+    best = trainer.history["val_loss"].index(best_val_loss)
+    return {
+        "trial_id": task["trial_id"],
+        "epochs_run": epochs_run,
+        "early_stopped": trainer.early_stopping_state["stopped"],
+        "best_val_loss": best_val_loss,
+        "best_epoch": trainer.history["epoch"][best],
+        "best_val_acc": trainer.history["val_acc"][best],
+        "best_val_auc": trainer.history["val_auc"][best],
+        "seconds": time.perf_counter() - started,
+    }
+
+
+class HyperparameterSweep:
+    def __init__(self, config_path: Path) -> None:
+        with open(config_path, "r") as f:
+            sweep_cfg = yaml.safe_load(f)["sweep"]
+
+        log.info("--- Config Sweep ---")
+        self.name = sweep_cfg["name"]
+        self.base_config_path = Path(sweep_cfg["base_config"])
+        with open(self.base_config_path, "r") as f:
+            self.base_params = yaml.safe_load(f)
+        self.trials = expand_search_space(sweep_cfg["search_space"], sweep_cfg.get("strategy", "grid"),
+                                          sweep_cfg.get("num_trials"), sweep_cfg.get("seed", 0))
+
+        execution_cfg = sweep_cfg.get("execution", {})
+        self.threads_per_trial = max(1, int(execution_cfg.get("threads_per_trial", 1)))
+        max_workers = execution_cfg.get("max_workers", "auto")
+        if max_workers == "auto":
+            max_workers = max(1, (os.cpu_count() or 1) // self.threads_per_trial)
+        self.max_workers = max(1, min(int(max_workers), len(self.trials)))
+
+        halving_cfg = sweep_cfg.get("successive_halving", {})
+        self.reduction_factor = int(halving_cfg.get("reduction_factor", 3))
+        max_epochs = self.base_params["training_params"]["epochs"]
+        self.rungs = halving_rungs(int(halving_cfg.get("min_epochs", max_epochs)), self.reduction_factor, max_epochs)
+
+        self.output_dir = Path(sweep_cfg.get("output_dir", "cache/sweeps")) / self.name
+        self.local_artifacts_dir = Path("reports")
+        self.local_artifacts_dir.mkdir(parents=True, exist_ok=True)
+
+    def _prepare_data(self, trainer: CreditScoringModelTraining) -> Path:
+        """
+        Loads, splits and preprocesses the dataset once (or takes it from the tensor cache) and returns the
+        directory of the `.npy` tensors shared by the trials.
+        """
+        arrays, preprocessor = trainer._split_and_preprocess()
+        if trainer.data_cache_entry is not None:
+            log.info(f"✔ trials share the cached preprocessed data in {trainer.data_cache_entry}")
+            return trainer.data_cache_entry
+
+        data_dir = self.output_dir / "data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        for name in SPLIT_ARRAYS:
+            np.save(data_dir / f"{name}.npy", np.ascontiguousarray(arrays[name]))
+        joblib.dump(preprocessor, data_dir / trainer.preprocessor_filename)
+        log.info(f"✔ preprocessed data shared by the trials written to {data_dir} ({len(arrays['x_train'])} training rows)")
+        return data_dir
+
+    def _run_rung(self, executor: ProcessPoolExecutor, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        futures = {task["trial_id"]: executor.submit(_run_trial, task) for task in tasks}
+        results = []
+        for trial_id, future in futures.items():
+            try:
+                results.append(future.result())
+            except Exception as e:
+                log.error(f"✘ trial {trial_id} failed: {e}")
+                results.append({"trial_id": trial_id, "failed": True, "best_val_loss": float("inf")})
+        return results
+
+    def run(self) -> Dict[str, Any]:
+        """Runs the sweep and returns the report."""
+        base_trainer = CreditScoringModelTraining(params=self.base_params)
+        mlflow.set_experiment(base_trainer.mlflow_project_name)
+        client = MlflowClient()
+        log.info(
+            f"✔ {len(self.trials)} trials, rungs (epochs): {self.rungs}, reduction factor {self.reduction_factor}, "
+            f"{self.max_workers} workers x {self.threads_per_trial} threads"
+        )
+
+        with mlflow.start_run(run_name=f"{self.name}-sweep") as sweep_run:
+            data_dir = self._prepare_data(base_trainer)
+            num_features = int(np.load(data_dir / "x_train.npy", mmap_mode="r").shape[1])
+            mlflow.log_params({
+                "base_config": str(self.base_config_path), "num_trials": len(self.trials), "rungs": str(self.rungs),
+                "reduction_factor": self.reduction_factor, "max_workers": self.max_workers,
+                "threads_per_trial": self.threads_per_trial,
+            })
+
+            records: Dict[str, Dict[str, Any]] = {}
+            for index, overrides in enumerate(self.trials):
+                trial_id = f"trial_{index:03d}"
+                params = apply_overrides(self.base_params, overrides)
+                # in-memory loader in the trial process: the pool already provides the parallelism
+                params["training_params"].setdefault("data_loader", {}).update({"mode": "memory", "num_workers": 0})
+                with mlflow.start_run(run_name=f"{self.name}-{trial_id}", nested=True) as trial_run:
+                    CreditScoringModelTraining(params=params)._log_basic_params(num_features=num_features)
+                records[trial_id] = {"trial_id": trial_id, "overrides": overrides, "params": params,
+                                     "run_id": trial_run.info.run_id, "status": "running", "seconds": 0.0}
+
+            active = list(records)
+            start_epoch = 0
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context, initializer=_init_worker,
+                                     initargs=(str(data_dir), self.threads_per_trial)) as executor:
+                for rung, end_epoch in enumerate(self.rungs):
+                    tasks = [
+                        {"trial_id": t, "params": records[t]["params"], "run_id": records[t]["run_id"],
+                         "trial_dir": str(self.output_dir / "trials" / t), "start_epoch": start_epoch, "end_epoch": end_epoch}
+                        for t in active if records[t]["status"] == "running"
+                    ]
+                    rung_started = time.perf_counter()
+                    for result in self._run_rung(executor, tasks):
+                        record = records[result["trial_id"]]
+                        record["seconds"] += result.pop("seconds", 0.0)
+                        record.update(result)
+                        if result.get("failed"):
+                            record["status"] = "failed"
+                        elif result["early_stopped"]:
+                            record["status"] = "early_stopped"
+                    log.info(f"✔ rung {rung} (epochs {start_epoch}-{end_epoch}): {len(tasks)} trials in {time.perf_counter() - rung_started:.1f}s")
+
+                    active.sort(key=lambda t: records[t]["best_val_loss"])
+                    if rung == len(self.rungs) - 1:
+                        break
+                    keep = max(1, len(active) // self.reduction_factor)
+                    for t in active[keep:]:
+                        if records[t]["status"] == "running":
+                            records[t]["status"] = f"pruned_at_epoch_{end_epoch}"
+                    active = active[:keep]
+                    start_epoch = end_epoch
+                    if all(records[t]["status"] != "running" for t in active):
+                        break
+
+            for record in records.values():
+                if record["status"] == "running":
+                    record["status"] = "completed"
+                client.set_tag(record["run_id"], "sweep_status", record["status"])
+
+            return self._write_report(records, sweep_run.info.run_id)
+
+    def _write_report(self, records: Dict[str, Dict[str, Any]], sweep_run_id: str) -> Dict[str, Any]:
+        ranked = sorted(records.values(), key=lambda r: r["best_val_loss"])
+        best = ranked[0]
+        trials = []
+        for record in ranked:
+            entry = {"trial_id": record["trial_id"], "mlflow_run_id": record["run_id"], "status": record["status"],
+                     **copy.deepcopy(record["overrides"])}
+            if not record.get("failed"):
+                entry.update({
+                    "epochs_run": record["epochs_run"], "best_epoch": record["best_epoch"],
+                    "best_val_loss": round(record["best_val_loss"], 4), "best_val_acc": round(record["best_val_acc"], 4),
+                    "best_val_auc": round(record["best_val_auc"], 4), "train_seconds": round(record["seconds"], 2),
+                })
+            trials.append(entry)
+        report = {
+            "sweep": self.name,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "base_config": str(self.base_config_path),
+            "mlflow_run_id": sweep_run_id,
+            "rungs_epochs": self.rungs,
+            "reduction_factor": self.reduction_factor,
+            "max_workers": self.max_workers,
+            "threads_per_trial": self.threads_per_trial,
+            "total_train_epochs": int(sum(r.get("epochs_run", 0) for r in records.values())),
+            "best_trial": copy.deepcopy(trials[0]),  # no YAML anchors
+            "trials": trials,
+        }
+
+        report_path = self.local_artifacts_dir / f"{self.name}_sweep_report.yaml"
+        with open(report_path, "w", encoding="utf-8") as f:
+            yaml.dump(report, f, indent=2, sort_keys=False)
+        # training config of the best trial, runnable with train.py as is
+        best_config_path = self.local_artifacts_dir / f"{self.name}_best_training_config.yaml"
+        with open(best_config_path, "w", encoding="utf-8") as f:
+            yaml.dump(apply_overrides(self.base_params, best["overrides"]), f, indent=2, sort_keys=False)
+
+        if not best.get("failed"):
+            mlflow.log_metrics({"best_val_loss": best["best_val_loss"], "best_val_acc": best["best_val_acc"],
+                                "best_val_auc": best["best_val_auc"]})
+        mlflow.log_artifact(str(report_path), artifact_path="reports")
+        mlflow.log_artifact(str(best_config_path), artifact_path="reports")
+        log.info(f"✔ Sweep report saved to {report_path}; best trial {best['trial_id']} ({best['overrides']})")
+        return report
+
+
+if __name__ == "__main__":
+    setup_logging()
+    parser = argparse.ArgumentParser(description="Parallel hyperparameter sweep with successive halving for the credit scoring MLP.")
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="config/sweep/credit_scoring-sweep_config-german_credit_risk_v130.yaml",
+        help="Path to the sweep YAML config."
+    )
+    cli_args = parser.parse_args()
+    log.info(f"Config path: {cli_args.config}")
+    HyperparameterSweep(Path(cli_args.config)).run()
+
+"""
+execute sweep file:
+python src/training/sweep.py --config config/sweep/credit_scoring-sweep_config-german_credit_risk_v130.yaml
+"""
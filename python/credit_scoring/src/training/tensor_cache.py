@@ -0,0 +1,92 @@
+"""
+tensor_cache.py: on-disk cache of the split and preprocessed training data (`training_params.data_cache`).
+
+An entry is a directory `<cache dir>/<key>/` with `x_train.npy`, `y_train.npy`, `x_val.npy`, `y_val.npy`
+(float32, y as a column), the fitted preprocessor (`preprocessor.joblib`) and `metadata.yaml`.
+The key is the sha256 of everything that determines those files: the dataset file contents, `test_size`,
+`random_state`, the feature lists of `CreditDataPreprocessor` and the scikit-learn version that pickled the
+preprocessor. A run whose key matches skips reading the CSV, splitting, fitting and transforming; changing
+only the architecture or the optimizer reuses the entry. Arrays are read back memory-mapped (copy-on-write).
+"""
+
+import os
+import sys
+import json
+import yaml
+import shutil
+import joblib
+import hashlib
+import sklearn
+import numpy as np
+import logging as log
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from src.core.hashing import file_sha256
+from src.processing.main import CreditDataPreprocessor
+
+CACHE_FORMAT_VERSION = 1
+SPLIT_ARRAYS = ("x_train", "y_train", "x_val", "y_val")
+DEFAULT_DATA_CACHE_CONFIG: Dict[str, Any] = {"enabled": True, "dir": "cache/preprocessed"}
+_PREPROCESSOR_FILENAME = "preprocessor.joblib"
+
+
+def tensor_cache_key(dataset_path: Path, test_size: float, random_state: int, preprocessor: CreditDataPreprocessor) -> str:
+    """
+    sha256 identifying the split + preprocessing of `dataset_path`.
+    """
+    fingerprint = {
+        "format_version": CACHE_FORMAT_VERSION,
+        "dataset_sha256": file_sha256(dataset_path),
+        "test_size": test_size,
+        "random_state": random_state,
+        "numerical_features": list(preprocessor.numerical_features),
+        "categorical_features": list(preprocessor.categorical_features),
+        "target_feature": preprocessor.target_feature,
+        "sklearn_version": sklearn.__version__,
+    }
+    return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def cache_entry_dir(cache_dir: Path, key: str) -> Path:
+    return Path(cache_dir) / key
+
+
+def load_cached_split(cache_dir: Path, key: str) -> Optional[Tuple[Dict[str, np.ndarray], Any]]:
+    """
+    (arrays, fitted preprocessor) of the entry, or None when it does not exist or is unreadable.
+    """
+    entry = cache_entry_dir(cache_dir, key)
+    if not (entry / "metadata.yaml").exists():
+        return None
+    try:
+        arrays = {name: np.load(entry / f"{name}.npy", mmap_mode="c") for name in SPLIT_ARRAYS}
+        preprocessor = joblib.load(entry / _PREPROCESSOR_FILENAME)
+    except Exception as e:
+        log.warning(f"✘ Ignoring unreadable tensor cache entry {entry}: {e}")
+        return None
+    return arrays, preprocessor
+
+
+def save_cached_split(cache_dir: Path, key: str, arrays: Dict[str, np.ndarray], preprocessor: Any,
+                      metadata: Dict[str, Any]) -> Path:
+    """
+    Writes the entry into a temporary directory and renames it into place, so concurrent runs
+    (e.g. several sweeps) never read a partial entry. `metadata.yaml` is written last and marks it complete.
+    """
+    entry = cache_entry_dir(cache_dir, key)
+    staging = entry.with_name(f".{key}.{os.getpid()}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    for name in SPLIT_ARRAYS:
+        np.save(staging / f"{name}.npy", np.ascontiguousarray(arrays[name], dtype=np.float32))
+    joblib.dump(preprocessor, staging / _PREPROCESSOR_FILENAME)
+    with open(staging / "metadata.yaml", "w", encoding="utf-8") as f:
+        yaml.dump({"key": key, "created_at": datetime.now(timezone.utc).isoformat(), **metadata}, f, sort_keys=False)
+    try:
+        staging.rename(entry)
+    except OSError:  # written meanwhile by another run with the same key
+        shutil.rmtree(staging, ignore_errors=True)
+    return entry
@@ -5,6 +5,7 @@ import os
 import sys
 import yaml
 import math
+import time
 import torch
 import joblib
 import mlflow
@@ -23,13 +24,24 @@ from typing import Tuple, Dict, Any, List
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import (
     accuracy_score, roc_auc_score, precision_recall_fscore_support,
-    roc_curve, precision_recall_curve, confusion_matrix, classification_report
+    roc_curve, precision_recall_curve, confusion_matrix, classification_report, brier_score_loss
 )
 from mlflow.models.signature import infer_signature
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 from src.processing.main import CreditDataPreprocessor
 from src.training.model import CreditScoringModel
+from src.training.data_pipeline import resolve_data_loader_config, build_train_loader
+from src.training.classification_metrics import binary_classification_metrics
+from src.training.acceleration import resolve_acceleration_config, autocast_context, compile_for_training
+from src.training.tensor_cache import (
+    DEFAULT_DATA_CACHE_CONFIG, SPLIT_ARRAYS, tensor_cache_key, cache_entry_dir, load_cached_split, save_cached_split
+)
+from src.inference.export import export_frozen_model, export_numpy_weights, export_model_bundle
+from src.inference.artifacts import frozen_model_path, numpy_weights_path, bundle_path, calibration_path, reference_stats_path
+from src.inference.calibration import ProbabilityCalibrator, fit_calibrator
+from src.inference.drift import reference_statistics, save_reference_statistics, load_reference_statistics
+from src.inference.encoder import CompiledFeatureEncoder
 
 
 def setup_logging(level=log.INFO, log_file: str | None = None):
@@ -50,9 +62,12 @@ def setup_logging(level=log.INFO, log_file: str | None = None):
 
 
 class CreditScoringModelTraining:
-    def __init__(self, config_path: Path) -> None:
-        with open(config_path, 'r') as f:
-            self.params = yaml.safe_load(f)
+    def __init__(self, config_path: Path | None = None, params: Dict[str, Any] | None = None) -> None:
+        # `params`: an already loaded (e.g. sweep-modified) training config instead of the YAML file
+        if params is None:
+            with open(config_path, 'r') as f:
+                params = yaml.safe_load(f)
+        self.params = params
         
         log.info(f"--- Config Training ---")
         # paths
@@ -77,6 +92,8 @@ class CreditScoringModelTraining:
         self.scheduler_factor = train_cfg['scheduler']['factor']
         self.epochs = train_cfg['epochs']
         self.batch_size = train_cfg['batch_size']
+        # validation pass every n epochs (training metrics come from the minibatches of every epoch)
+        self.eval_every_n_epochs = max(1, int(train_cfg.get('eval_every_n_epochs', 1)))
         
         # data
         self.test_size = train_cfg['test_size']
@@ -86,7 +103,14 @@ class CreditScoringModelTraining:
         self.early_stopping_patience = train_cfg['early_stopping']['patience']
         self.early_stopping_delta = train_cfg['early_stopping']['delta']
         
+        # calibration fitted on the validation split (threshold served by the API)
+        calibration_cfg = self.params.get('evaluation_params', {}).get('calibration', {})
+        self.calibration_method = calibration_cfg.get('method', 'platt')
+        self.threshold_criterion = calibration_cfg.get('threshold_criterion', 'youden')
+        
         self.model_name = self.params['model_config']['model_name']
+        # best weights of the loop (early stopping); sweep trials point it to their own directory
+        self.checkpoint_path = Path(f"models/{self.model_name}")
         self.mlflow_project_name = self.params['mlflow_config']['mlflow_project_name']
         
         # reproducibility
@@ -96,15 +120,32 @@ class CreditScoringModelTraining:
         # GPU
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         
+        # input pipeline (shuffling, worker prefetching, pinned memory, streaming from disk)
+        self.data_loader_cfg = resolve_data_loader_config(train_cfg.get('data_loader'), self.device)
+        
+        # on-disk cache of the split + preprocessed tensors
+        self.data_cache_cfg = {**DEFAULT_DATA_CACHE_CONFIG, **(train_cfg.get('data_cache') or {})}
+        self.data_cache_entry: Path | None = None
+        
+        # bf16 autocast / torch.compile of the training steps (fall back to fp32 / eager when unsupported)
+        self.acceleration_cfg = resolve_acceleration_config(train_cfg.get('acceleration'), self.device)
+        
         # instance
         self.data_preprocessor = CreditDataPreprocessor()
         
         # history
         self.history: Dict[str, List[float]] = {
+            "epoch": [],
             "train_loss": [], "val_loss": [],
             "train_acc": [], "val_acc": [],
             "train_auc": [], "val_auc": []
         }
+        # seconds of the training steps of every epoch (validation excluded)
+        self.epoch_times: List[float] = []
+        # early stopping state, kept across calls of the loop so a run can resume (sweep rungs)
+        self.early_stopping_state: Dict[str, Any] = {
+            "best_val_loss": float('inf'), "patience_counter": 0, "last_eval_epoch": -1, "stopped": False
+        }
         
         # artifacts folder
         self.local_artifacts_dir = Path("reports")
@@ -135,27 +176,68 @@ class CreditScoringModelTraining:
         )
         return df_train, df_val
     
-    def _preprocess_data(self, df_train: pd.DataFrame, df_val: pd.DataFrame) -> Tuple[torch.Tensor, ...]:
+    def _split_and_preprocess(self) -> Tuple[Dict[str, np.ndarray], Any]:
         """
-        Fits preprocessor on training data and transforms both sets.
+        Split + fitted preprocessor + transformed arrays (x_train, y_train, x_val, y_val; float32, y as a column).
+        Served from the tensor cache when its key (dataset hash, split and feature lists) matches; no other side effects.
         """
+        self.data_cache_entry = None
+        key = None
+        if self.data_cache_cfg["enabled"]:
+            key = tensor_cache_key(self.dataset_path, self.test_size, self.random_state, self.data_preprocessor)
+            cached = load_cached_split(self.data_cache_cfg["dir"], key)
+            if cached is not None:
+                self.data_cache_entry = cache_entry_dir(self.data_cache_cfg["dir"], key)
+                log.info(f"✔ preprocessed tensors loaded from cache {self.data_cache_entry}")
+                return cached
+        
+        df_train, df_val = self._load_and_split_data()
         log.info("--- Preprocessing data ---")
         preprocessor = self.data_preprocessor.fit_preprocessor(df_train)
-        
         x_train_processed, y_train = self.data_preprocessor.process_data(df_train, preprocessor)
         x_val_processed, y_val = self.data_preprocessor.process_data(df_val, preprocessor)
+        arrays = {
+            "x_train": np.asarray(x_train_processed, dtype=np.float32),
+            "y_train": np.asarray(y_train.values, dtype=np.float32).reshape(-1, 1),
+            "x_val": np.asarray(x_val_processed, dtype=np.float32),
+            "y_val": np.asarray(y_val.values, dtype=np.float32).reshape(-1, 1),
+        }
+        
+        if key is not None:
+            self.data_cache_entry = save_cached_split(self.data_cache_cfg["dir"], key, arrays, preprocessor, {
+                "dataset_path": str(self.dataset_path), "test_size": self.test_size, "random_state": self.random_state,
+                "train_rows": len(arrays["x_train"]), "val_rows": len(arrays["x_val"]), "num_features": arrays["x_train"].shape[1],
+            })
+            log.info(f"✔ preprocessed tensors cached in {self.data_cache_entry}")
+        return arrays, preprocessor
+    
+    def _preprocess_data(self) -> Tuple[torch.Tensor, ...]:
+        """
+        Fits preprocessor on training data and transforms both sets (or reuses the cached ones),
+        then saves the preprocessor and the reference statistics used for serving.
+        """
+        arrays, preprocessor = self._split_and_preprocess()
+        x_train_processed = arrays["x_train"]
         
-        # Convert to PyTorch tensors
-        x_train_tensor = torch.tensor(x_train_processed, dtype=torch.float32)
-        y_train_tensor = torch.tensor(y_train.values, dtype=torch.float32).view(-1, 1)
-        x_val_tensor = torch.tensor(x_val_processed, dtype=torch.float32)
-        y_val_tensor = torch.tensor(y_val.values, dtype=torch.float32).view(-1, 1)
+        # Convert to PyTorch tensors (the cached arrays are copy-on-write mappings: no copy)
+        x_train_tensor, y_train_tensor, x_val_tensor, y_val_tensor = (
+            torch.from_numpy(arrays[name]) for name in SPLIT_ARRAYS
+        )
         
         # Save the fitted preprocessor
         path_preprocessor = f"models/{self.preprocessor_filename}"
         joblib.dump(preprocessor, path_preprocessor)
         log.info(f"✔ preprocessor saved to {path_preprocessor}")
         
+        # reference distribution of the training split for the drift monitor of the API
+        encoder = CompiledFeatureEncoder.from_preprocessor(preprocessor)
+        path_reference = save_reference_statistics(
+            reference_stats_path(Path(f"models/{self.model_name}")),
+            reference_statistics(encoder, x_train_processed)
+        )
+        mlflow.log_artifact(str(path_reference), artifact_path="inference")
+        log.info(f"✔ reference statistics saved to {path_reference}")
+        
         return x_train_tensor, y_train_tensor, x_val_tensor, y_val_tensor
     
     # metrics
@@ -182,11 +264,8 @@ class CreditScoringModelTraining:
         model.eval()
         with torch.no_grad():
             logits = model(x)
-            loss = criterion(logits, y).item()
-            prob = torch.sigmoid(logits).detach().cpu().numpy().reshape(-1)
-            y_true = y.detach().cpu().numpy().reshape(-1)
-            m = self._compute_metrics(y_true, prob, threshold=0.5)
-            m["loss"] = loss
+            m = binary_classification_metrics(y, torch.sigmoid(logits), threshold=0.5)
+            m["loss"] = criterion(logits, y).item()
         return m
     
     # plots
@@ -258,25 +337,40 @@ class CreditScoringModelTraining:
 
         return roc_path, pr_path
     
-    def _run_training_loop(self, model, criterion, optimizer, scheduler, x_train, y_train, x_val, y_val):
-        """Executes the main training and validation loop with early stopping."""
-        best_val_loss = float('inf')
-        patience_counter = 0
-        epochs_run = 0
+    def _run_training_loop(self, model, criterion, optimizer, scheduler, train_loader, x_val, y_val,
+                           start_epoch: int = 0, end_epoch: int | None = None, forward_model: nn.Module | None = None):
+        """
+        Executes the main training and validation loop with early stopping.
+        Training metrics come from the minibatch outputs of the epoch (no extra pass over the training split);
+        the validation split is evaluated every `eval_every_n_epochs` epochs and always on the last one.
+        `start_epoch` / `end_epoch` run a slice of the schedule; early stopping state lives in `self.early_stopping_state`.
+        `forward_model`: compiled module sharing the parameters of `model`, used for the training steps
+        (checkpoints and validation use `model`).
+        """
+        state = self.early_stopping_state
+        end_epoch = self.epochs if end_epoch is None else min(end_epoch, self.epochs)
+        forward_model = model if forward_model is None else forward_model
+        epochs_run = start_epoch
         
         log.info("--- Starting training loop ---")
-        for epoch in range(self.epochs):
+        for epoch in range(start_epoch, end_epoch):
             model.train()
-            epoch_loss = 0
             epochs_run = epoch + 1
+            epoch_started = time.perf_counter()
+            loss_sum = torch.zeros((), device=self.device)
+            batch_logits, batch_labels = [], []
             
-            # mini-batches
-            for i in range(0, len(x_train), self.batch_size):
-                x_batch = x_train[i:i+self.batch_size]
-                y_batch = y_train[i:i+self.batch_size]
+            # mini-batches (reshuffled every epoch by the data pipeline)
+            if hasattr(train_loader.dataset, "set_epoch"):
+                train_loader.dataset.set_epoch(epoch)
+            for x_batch, y_batch in train_loader:
+                # pinned batches are copied asynchronously
+                x_batch = x_batch.to(self.device, non_blocking=True)
+                y_batch = y_batch.to(self.device, non_blocking=True)
                 
-                outputs = model(x_batch)
-                loss = criterion(outputs, y_batch)
+                with autocast_context(self.acceleration_cfg, self.device):
+                    outputs = forward_model(x_batch)
+                    loss = criterion(outputs, y_batch)
                 
                 optimizer.zero_grad()
                 loss.backward()
@@ -284,15 +378,39 @@ class CreditScoringModelTraining:
                 nn.utils.clip_grad_norm_(model.parameters(), max_norm=1.0)
                 
                 optimizer.step()
-                epoch_loss += loss.item()
+                # accumulated on the device: no host sync per batch
+                loss_sum += loss.detach() * len(x_batch)
+                batch_logits.append(outputs.detach().float())
+                batch_labels.append(y_batch)
+                
+            # training metrics of the epoch from the outputs already computed (train mode, weights moving during the epoch)
+            train_labels = torch.cat(batch_labels)
+            train_metrics = binary_classification_metrics(train_labels, torch.sigmoid(torch.cat(batch_logits)))
+            train_metrics["loss"] = (loss_sum / len(train_labels)).item()
+            current_lr = optimizer.param_groups[0]["lr"]
+            # .item() above waits for the device: the time covers every training step of the epoch
+            epoch_seconds = time.perf_counter() - epoch_started
+            self.epoch_times.append(epoch_seconds)
+            
+            # logs -> mlflow
+            mlflow.log_metrics({**{f"train_{k}": v for k, v in train_metrics.items()}, "lr": current_lr,
+                                "epoch_seconds": epoch_seconds}, step=epoch)
+            
+            if (epoch + 1) % self.eval_every_n_epochs != 0 and epoch != end_epoch - 1:
+                log.info(
+                    f"✔ Epoch [{epoch}/{self.epochs}] "
+                    f"✔ TrainLoss: {train_metrics['loss']:.4f} | TrainAcc: {train_metrics['accuracy']:.4f} | "
+                    f"TrainAUC: {train_metrics['roc_auc']:.4f} | LR: {current_lr:.6f}"
+                )
+                continue
                 
-            # metrics
-            train_metrics = self._evaluate_split(model, x_train, y_train, criterion)
+            # validation metrics
             val_metrics = self._evaluate_split(model, x_val, y_val, criterion)
             if scheduler is not None:
                 scheduler.step(val_metrics["loss"])
                 
             # save history
+            self.history["epoch"].append(epochs_run)
             self.history["train_loss"].append(train_metrics["loss"])
             self.history["val_loss"].append(val_metrics["loss"])
             self.history["train_acc"].append(train_metrics["accuracy"])
@@ -301,7 +419,6 @@ class CreditScoringModelTraining:
             self.history["val_auc"].append(val_metrics["roc_auc"])
             
             # logs -> console
-            current_lr = optimizer.param_groups[0]["lr"]
             log.info(
                 f"✔ Epoch [{epoch}/{self.epochs}] "
                 f"✔ TrainLoss: {train_metrics['loss']:.4f} | ValLoss: {val_metrics['loss']:.4f} | "
@@ -310,31 +427,18 @@ class CreditScoringModelTraining:
             )
             
             # logs -> mlflow
-            mlflow.log_metrics({
-                "train_loss": train_metrics["loss"],
-                "val_loss": val_metrics["loss"],
-                "train_accuracy": train_metrics["accuracy"],
-                "val_accuracy": val_metrics["accuracy"],
-                "train_precision": train_metrics["precision"],
-                "val_precision": val_metrics["precision"],
-                "train_recall": train_metrics["recall"],
-                "val_recall": val_metrics["recall"],
-                "train_f1": train_metrics["f1"],
-                "val_f1": val_metrics["f1"],
-                "train_roc_auc": train_metrics["roc_auc"],
-                "val_roc_auc": val_metrics["roc_auc"],
-                "lr": current_lr
-            }, step=epoch)
+            mlflow.log_metrics({f"val_{k}": v for k, v in val_metrics.items()}, step=epoch)
 
-            # Early stopping
-            if val_metrics["loss"] < best_val_loss - self.early_stopping_delta:
-                best_val_loss = val_metrics["loss"]
-                patience_counter = 0
-                path_model = f"models/{self.model_name}"
-                torch.save(model.state_dict(), path_model)
+            # Early stopping (patience in epochs: every evaluation accounts for the epochs since the previous one)
+            epochs_since_eval, state["last_eval_epoch"] = epoch - state["last_eval_epoch"], epoch
+            if val_metrics["loss"] < state["best_val_loss"] - self.early_stopping_delta:
+                state["best_val_loss"] = val_metrics["loss"]
+                state["patience_counter"] = 0
+                torch.save(model.state_dict(), self.checkpoint_path)
             else:
-                patience_counter += 1
-                if patience_counter >= self.early_stopping_patience:
+                state["patience_counter"] += epochs_since_eval
+                if state["patience_counter"] >= self.early_stopping_patience:
+                    state["stopped"] = True
                     log.info(f"✘ Early stopping activado en epoch {epoch}.")
                     break
                 
@@ -348,7 +452,8 @@ class CreditScoringModelTraining:
         final_metrics: Dict[str, float],
         num_features: int,
         epochs_run: int,
-        run_name: str
+        run_name: str,
+        calibration: Dict[str, Any] | None = None
     ):
         """Generates a YAML report, saves it locally, and logs it to MLflow."""
         log.info("--- Generating performance report ---")
@@ -375,9 +480,14 @@ class CreditScoringModelTraining:
                 "use_pos_weight": self.use_pos_weight,
                 "epochs_run": epochs_run,
                 "batch_size": self.batch_size,
+                "precision": self.acceleration_cfg["precision"],
+                "compile": self.acceleration_cfg["compile"],
+                "mean_epoch_seconds": round(float(np.mean(self.epoch_times)), 4) if self.epoch_times else None,
             },
             "final_validation_metrics": {k: round(v, 4) for k, v in final_metrics.items() if not math.isnan(v)}
         }
+        if calibration is not None:
+            report_data["calibration"] = calibration
         
         # Save locally
         report_filename = f"{run_name}_performance_report.yaml"
@@ -404,7 +514,14 @@ class CreditScoringModelTraining:
             "weight_decay": self.weight_decay,
             "use_pos_weight": self.use_pos_weight,
             "scheduler_patience": self.scheduler_patience,
-            "early_stopping_patience": self.early_stopping_patience
+            "early_stopping_patience": self.early_stopping_patience,
+            "eval_every_n_epochs": self.eval_every_n_epochs,
+            "data_loader_mode": self.data_loader_cfg["mode"],
+            "data_loader_shuffle": self.data_loader_cfg["shuffle"],
+            "data_loader_num_workers": self.data_loader_cfg["num_workers"],
+            "data_cache_enabled": self.data_cache_cfg["enabled"],
+            "precision": self.acceleration_cfg["precision"],
+            "compile": self.acceleration_cfg["compile"]
         })
         # tags útiles
         tags = self.params.get("mlflow_config", {}).get("mlflow_tags", [])
@@ -455,8 +572,8 @@ class CreditScoringModelTraining:
                 pip_requirements=pip_requirements
             )
     
-    def _log_plots_and_reports(self, y_true_val: np.ndarray, y_prob_val: np.ndarray):
-        epochs = list(range(1, len(self.history["train_loss"]) + 1))
+    def _log_plots_and_reports(self, y_true_val: np.ndarray, y_prob_val: np.ndarray, threshold: float = 0.5):
+        epochs = self.history["epoch"]
 
         # Pérdida y Accuracy (train vs val)
         loss_png = self._plot_and_save(epochs, self.history["train_loss"], self.history["val_loss"],
@@ -467,7 +584,7 @@ class CreditScoringModelTraining:
         # ROC / PR y Confusion Matrix (validación)
         roc_png, pr_png = self._plot_roc_pr(y_true_val, y_prob_val,
                                             roc_file="roc_val.png", pr_file="pr_val.png")
-        y_pred_val = (y_prob_val >= 0.5).astype(int)
+        y_pred_val = (y_prob_val >= threshold).astype(int)
         cm_png = self._plot_confusion_matrix(y_true_val, y_pred_val, filename="confusion_matrix_val.png")
 
         # Classification report como archivo de texto
@@ -486,6 +603,31 @@ class CreditScoringModelTraining:
         mlflow.log_artifact(str(cm_png), artifact_path="plots")
         mlflow.log_artifact(str(report_path), artifact_path="reports")
         
+    def _fit_calibration(self, y_true_val: np.ndarray, y_prob_val: np.ndarray, model_path: Path) -> Tuple[ProbabilityCalibrator, Dict[str, Any]]:
+        """
+        Fits the calibration map and the decision threshold, saves them next to the weights and logs them to MLflow.
+        """
+        log.info(f"--- Calibration ({self.calibration_method}, threshold: {self.threshold_criterion}) ---")
+        calibrator = fit_calibrator(y_true_val, y_prob_val, self.calibration_method, self.threshold_criterion)
+        prob_calibrated = calibrator.apply(y_prob_val)
+        calibrated_metrics = self._compute_metrics(y_true_val, prob_calibrated, threshold=calibrator.threshold)
+        
+        path_calibration = calibrator.save(calibration_path(model_path))
+        log.info(f"✔ Calibration saved to {path_calibration} (threshold: {calibrator.threshold:.4f})")
+        mlflow.log_metrics({f"final_val_calibrated_{k}": v for k, v in calibrated_metrics.items() if not math.isnan(v)})
+        mlflow.log_metric("decision_threshold", calibrator.threshold)
+        mlflow.log_artifact(str(path_calibration), artifact_path="inference")
+        
+        summary = {
+            "method": calibrator.method,
+            "threshold_criterion": self.threshold_criterion,
+            "decision_threshold": round(calibrator.threshold, 4),
+            "brier_score_raw": round(float(brier_score_loss(y_true_val, y_prob_val)), 4),
+            "brier_score_calibrated": round(float(brier_score_loss(y_true_val, prob_calibrated)), 4),
+            "calibrated_validation_metrics": {k: round(v, 4) for k, v in calibrated_metrics.items() if not math.isnan(v)},
+        }
+        return calibrator, summary
+        
     def _setup_loss_function(self, y_train: torch.Tensor) -> nn.Module:
         """Configures the loss function based on YAML parameters."""
         if self.use_pos_weight:
@@ -505,6 +647,33 @@ class CreditScoringModelTraining:
             log.info("✔ using standard BCE loss.")
             return nn.BCEWithLogitsLoss()
         
+    def _build_model(self, num_features: int) -> CreditScoringModel:
+        log.info(f"✔ initializing model with config: {self.hidden_layers}")
+        log.info(f"✔ initializing model with {num_features} input features.")
+        return CreditScoringModel(
+            num_features=num_features,
+            hidden_layers=self.hidden_layers,
+            dropout_rate=self.dropout_rate,
+            use_batch_norm=self.use_batch_norm,
+            activation_fn=self.activation_fn).to(self.device)
+    
+    def _build_optimizer(self, model: nn.Module) -> optim.Optimizer:
+        if self.optimizer_name.lower() == 'adam':
+            optimizer = optim.Adam(model.parameters(), lr=self.learning_rate, weight_decay=self.weight_decay)
+        elif self.optimizer_name.lower() == 'adamw':
+            optimizer = optim.AdamW(model.parameters(), lr=self.learning_rate, weight_decay=self.weight_decay)
+        elif self.optimizer_name.lower() == 'sgd':
+            optimizer = optim.SGD(model.parameters(), lr=self.learning_rate, weight_decay=self.weight_decay)
+        else:
+            raise ValueError(f"Optimizer {self.optimizer_name} not supported.")
+        log.info(f"✔ using optimizer: {self.optimizer_name} with lr={self.learning_rate}")
+        return optimizer
+    
+    def _build_scheduler(self, optimizer: optim.Optimizer):
+        # the scheduler steps once per validation pass: its patience (in epochs) is converted to passes
+        scheduler_patience = math.ceil(self.scheduler_patience / self.eval_every_n_epochs)
+        return optim.lr_scheduler.ReduceLROnPlateau(optimizer, mode='min', factor=self.scheduler_factor, patience=scheduler_patience)
+        
     def train(self):
         """Main method to orchestrate the model training pipeline."""
         log.info(f"✔ hardware used: {self.device}")
@@ -515,50 +684,42 @@ class CreditScoringModelTraining:
         with mlflow.start_run(run_name=f"{run_name_prefix}"):
             log.info("--- Init Training ---")
             
-            # 1. Load and split data
-            df_train, df_val = self._load_and_split_data()
-            
-            # 2. Preprocess data
-            x_train, y_train, x_val, y_val = self._preprocess_data(df_train, df_val)
+            # 1-2. Load, split and preprocess data (skipped when the tensor cache has them)
+            x_train, y_train, x_val, y_val = self._preprocess_data()
             num_features = x_train.shape[1]
             
-            x_train, y_train = x_train.to(self.device), y_train.to(self.device)
+            # the loader keeps (or streams) CPU batches; the validation split lives on the device
+            train_loader = build_train_loader(x_train, y_train, self.batch_size, self.data_loader_cfg, seed=self.random_state)
+            log.info(
+                f"✔ data pipeline: mode={self.data_loader_cfg['mode']}, shuffle={self.data_loader_cfg['shuffle']}, "
+                f"workers={self.data_loader_cfg['num_workers']}, pin_memory={self.data_loader_cfg['pin_memory']}"
+            )
             x_val, y_val = x_val.to(self.device), y_val.to(self.device)
             
             # 3. Configure model, optimizer, and loss function
-            log.info(f"✔ initializing model with config: {self.hidden_layers}")
-            log.info(f"✔ initializing model with {num_features} input features.")
-            model = CreditScoringModel(
-                num_features=num_features,
-                hidden_layers=self.hidden_layers,
-                dropout_rate=self.dropout_rate,
-                use_batch_norm=self.use_batch_norm,
-                activation_fn=self.activation_fn).to(self.device)
+            model = self._build_model(num_features)
             
             # loss function
             criterion = self._setup_loss_function(y_train)
             
-            # optimizer
-            if self.optimizer_name.lower() == 'adam':
-                optimizer = optim.Adam(model.parameters(), lr=self.learning_rate, weight_decay=self.weight_decay)
-            elif self.optimizer_name.lower() == 'adamw':
-                optimizer = optim.AdamW(model.parameters(), lr=self.learning_rate, weight_decay=self.weight_decay)
-            elif self.optimizer_name.lower() == 'sgd':
-                optimizer = optim.SGD(model.parameters(), lr=self.learning_rate, weight_decay=self.weight_decay)
-            else:
-                raise ValueError(f"Optimizer {self.optimizer_name} not supported.")
-            log.info(f"✔ using optimizer: {self.optimizer_name} with lr={self.learning_rate}")
+            # optimizer + scheduler
+            optimizer = self._build_optimizer(model)
+            scheduler = self._build_scheduler(optimizer)
             
-            scheduler = optim.lr_scheduler.ReduceLROnPlateau(optimizer, mode='min', factor=self.scheduler_factor, patience=self.scheduler_patience)
+            # compiled training steps (eager when disabled or unsupported)
+            forward_model = compile_for_training(model, self.acceleration_cfg, criterion, x_train[:self.batch_size].to(self.device),
+                                                 y_train[:self.batch_size].to(self.device), self.device)
+            log.info(f"✔ training precision: {self.acceleration_cfg['precision']}, compiled: {forward_model is not model}")
             
             # Log parameters to MLflow
             self._log_basic_params(num_features=num_features)
             
             # 4. Run training loop
-            epochs_run = self._run_training_loop(model, criterion, optimizer, scheduler, x_train, y_train, x_val, y_val)
+            epochs_run = self._run_training_loop(model, criterion, optimizer, scheduler, train_loader, x_val, y_val,
+                                                 forward_model=forward_model)
             
             # 5. Load best model and log artifacts
-            path_model = f"models/{self.model_name}"
+            path_model = str(self.checkpoint_path)
             log.info(f"✔ Loading best model from {path_model} and logging artifacts.")
             model.load_state_dict(torch.load(path_model, map_location=self.device))
             model.eval()
@@ -570,18 +731,33 @@ class CreditScoringModelTraining:
                 
             final_metrics = self._compute_metrics(y_val_np, prob_val, threshold=0.5)
             mlflow.log_metrics({f"final_val_{k}": v for k, v in final_metrics.items() if not math.isnan(v)})
+            
+            # 6. calibration + decision threshold on the validation split
+            calibrator, calibration_summary = self._fit_calibration(y_val_np, prob_val, Path(path_model))
+            prob_val_calibrated = calibrator.apply(prob_val)
 
-            # 6. plots & reports
-            self._log_plots_and_reports(y_val_np, prob_val)
+            # 7. plots & reports (at the threshold served by the API)
+            self._log_plots_and_reports(y_val_np, prob_val_calibrated, threshold=calibrator.threshold)
             
-            # 7. log model
-            self._generate_and_log_performance_report(model, final_metrics, num_features, epochs_run, run_name_prefix)
+            # 8. log model
+            self._generate_and_log_performance_report(model, final_metrics, num_features, epochs_run, run_name_prefix, calibration_summary)
             x_example = x_train[:5].detach().cpu()
             self._log_model_with_signature(model, x_example)
             path_preprocessor = f"models/{self.preprocessor_filename}"
             mlflow.log_artifact(path_preprocessor, artifact_path="preprocessing")
             log.info("✔ Preprocessor and model save in MLflow.")
             
+            # 9. export serving artifacts (BatchNorm folded, no Dropout)
+            path_frozen = export_frozen_model(model, frozen_model_path(Path(path_model)), num_features)
+            path_numpy = export_numpy_weights(model, numpy_weights_path(Path(path_model)), num_features)
+            # versioned bundle: architecture + weights + encoder tables + calibration, checksummed
+            reference_stats = load_reference_statistics(reference_stats_path(Path(path_model)))
+            path_bundle = export_model_bundle(model, Path(path_preprocessor), bundle_path(Path(path_model)), calibrator=calibrator,
+                                              reference_stats=reference_stats)
+            mlflow.log_artifact(str(path_frozen), artifact_path="inference")
+            mlflow.log_artifact(str(path_numpy), artifact_path="inference")
+            mlflow.log_artifact(str(path_bundle), artifact_path="inference")
+            
 
 if __name__ == "__main__":
     setup_logging()
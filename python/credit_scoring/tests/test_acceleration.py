@@ -0,0 +1,71 @@
+import os
+import sys
+import torch
+import pytest
+import torch.nn as nn
+import logging as log
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.training import acceleration
+from src.training.model import CreditScoringModel
+from src.training.acceleration import resolve_acceleration_config, autocast_context, compile_for_training
+
+CPU = torch.device("cpu")
+
+
+def _model() -> CreditScoringModel:
+    torch.manual_seed(0)
+    return CreditScoringModel(num_features=26, hidden_layers=[32, 16], dropout_rate=0.1, use_batch_norm=True, activation_fn="ReLU")
+
+
+def test_acceleration_config_and_bf16_fallback(monkeypatch):
+    """
+    Verifica los valores por defecto, la validación y la caída a fp32 cuando el dispositivo no soporta bf16.
+    """
+    log.info("TEST: Verificando la configuración de precisión mixta.")
+    config = resolve_acceleration_config(None, CPU)
+    assert config == {"precision": "fp32", "compile": False, "compile_mode": "default"}
+    with pytest.raises(ValueError):
+        resolve_acceleration_config({"precision": "fp16"}, CPU)
+
+    monkeypatch.setattr(acceleration, "bf16_supported", lambda device: False)
+    assert resolve_acceleration_config({"precision": "bf16"}, CPU)["precision"] == "fp32"
+    monkeypatch.setattr(acceleration, "bf16_supported", lambda device: True)
+    config = resolve_acceleration_config({"precision": "bf16"}, CPU)
+    assert config["precision"] == "bf16"
+
+    # bf16 autocast: bf16 activations, fp32 loss and fp32 gradients of the fp32 weights
+    model = _model().train()
+    with autocast_context(config, CPU):
+        logits = model(torch.randn(16, 26))
+        loss = nn.BCEWithLogitsLoss()(logits, torch.ones(16, 1))
+    loss.backward()
+    assert logits.dtype == torch.bfloat16 and loss.dtype == torch.float32
+    assert all(p.grad.dtype == torch.float32 for p in model.parameters())
+    log.info("✔ ¡Éxito! La precisión mixta se configura y cae a fp32 cuando no hay soporte.")
+
+
+def test_compile_probe_leaves_model_untouched_and_falls_back(monkeypatch):
+    """
+    Verifica que el paso de prueba de torch.compile no altera el modelo y que un fallo vuelve al modo eager.
+    """
+    log.info("TEST: Verificando torch.compile con fallback.")
+    model = _model()
+    before = {name: tensor.clone() for name, tensor in model.state_dict().items()}
+    config = {"precision": "fp32", "compile": True, "compile_mode": "default"}
+    x, y = torch.randn(32, 26), torch.ones(32, 1)
+
+    # stand-in compiler: a wrapper sharing the parameters, as torch.compile returns
+    monkeypatch.setattr(torch, "compile", lambda module, mode: nn.Sequential(module))
+    compiled = compile_for_training(model, config, nn.BCEWithLogitsLoss(), x, y, CPU)
+    assert compiled is not model and compiled[0] is model
+    assert all(p.grad is None for p in model.parameters())
+    assert all(torch.equal(before[name], tensor) for name, tensor in model.state_dict().items())
+
+    def failing_compile(module, mode):
+        raise RuntimeError("no C++ compiler")
+    monkeypatch.setattr(torch, "compile", failing_compile)
+    assert compile_for_training(model, config, nn.BCEWithLogitsLoss(), x, y, CPU) is model
+    assert compile_for_training(model, {**config, "compile": False}, nn.BCEWithLogitsLoss(), x, y, CPU) is model
+    log.info("✔ ¡Éxito! torch.compile no altera el modelo y cae a eager cuando falla.")
@@ -0,0 +1,169 @@
+import os
+import sys
+import time
+import pytest
+import logging as log
+from pathlib import Path
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.server.app import app
+from src.server.schemas import CreditRiskInput
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLE = CreditRiskInput.Config.schema_extra["example"]
+
+
+@pytest.fixture(scope="module")
+def client_fixture():
+    """Levanta la app (lifespan incluido) desde la raíz del proyecto y espera a que esté lista."""
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        with TestClient(app) as client:
+            deadline = time.monotonic() + 60
+            while client.get("/readyz").status_code != 200:
+                assert time.monotonic() < deadline, "El servicio no estuvo listo a tiempo."
+                time.sleep(0.1)
+            yield client
+    finally:
+        os.chdir(cwd)
+
+
+def test_requests_rejected_before_ready():
+    """
+    Verifica que sin modelo cargado las predicciones se rechazan rápido con 503.
+    """
+    log.info("TEST: Verificando el rechazo 503 antes de estar listo.")
+    client = TestClient(app)  # sin lifespan: el modelo nunca se carga
+    app.state.registry = None
+    app.state.load_error = None
+
+    assert client.get("/healthz").status_code == 200
+    assert client.get("/readyz").status_code == 503
+    response = client.post("/mlp_demo", json=EXAMPLE)
+    assert response.status_code == 503
+    assert response.headers.get("retry-after") == "1"
+    log.info("✔ ¡Éxito! Las solicitudes se rechazan con 503 mientras el modelo carga.")
+
+
+def test_ready_and_predicts(client_fixture):
+    """
+    Verifica readiness y que los endpoints de predicción responden una vez cargado el modelo.
+    """
+    log.info("TEST: Verificando readiness y predicciones.")
+    ready = client_fixture.get("/readyz").json()
+    assert ready["status"] == "ready"
+
+    single = client_fixture.post("/mlp_demo", json=EXAMPLE)
+    assert single.status_code == 200
+    assert single.json()["prediction"] in ("good", "bad")
+
+    batch = client_fixture.post("/mlp_demo/batch", json=[EXAMPLE, {**EXAMPLE, "Age": 50}])
+    assert batch.status_code == 200 and len(batch.json()) == 2
+    assert batch.json()[0]["probability"] == pytest.approx(single.json()["probability"], abs=1e-6)
+    log.info("✔ ¡Éxito! El servicio está listo y responde predicciones.")
+
+
+def test_overload_returns_429(client_fixture):
+    """
+    Verifica que con la cola de inferencia llena las predicciones se rechazan con 429.
+    """
+    log.info("TEST: Verificando la respuesta 429 por saturación.")
+    from src.server.app import inference_executor
+    max_pending = inference_executor.max_pending
+    inference_executor.max_pending = 0
+    try:
+        response = client_fixture.post("/mlp_demo", json={**EXAMPLE, "Age": 71})
+        assert response.status_code == 429
+        assert response.headers.get("retry-after") == "1"
+        assert client_fixture.post("/mlp_demo/batch", json=[{**EXAMPLE, "Age": 72}]).status_code == 429
+    finally:
+        inference_executor.max_pending = max_pending
+    assert client_fixture.post("/mlp_demo", json={**EXAMPLE, "Age": 71}).status_code == 200
+    log.info("✔ ¡Éxito! La saturación se comunica con 429 y Retry-After.")
+
+
+def test_metrics_endpoint(client_fixture):
+    """
+    Verifica que /metrics expone latencias por etapa y contadores por ruta tras una predicción.
+    """
+    log.info("TEST: Verificando el endpoint /metrics.")
+    client_fixture.post("/mlp_demo/batch", json=[{**EXAMPLE, "Age": 73}])
+    response = client_fixture.get("/metrics")
+    assert response.status_code == 200 and response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    for stage in ("encode", "forward", "postprocess"):
+        assert f'credit_scoring_inference_stage_seconds_count{{stage="{stage}"}}' in body
+    assert 'credit_scoring_http_requests_total{route="/mlp_demo/batch",status="200"}' in body
+    assert "credit_scoring_forward_batch_rows_count" in body
+    log.info("✔ ¡Éxito! Las métricas de inferencia están disponibles.")
+
+
+def test_explain_endpoint(client_fixture):
+    """
+    Verifica que /mlp_demo/explain devuelve la predicción y el aporte de cada campo de entrada.
+    """
+    log.info("TEST: Verificando el endpoint de explicaciones.")
+    response = client_fixture.post("/mlp_demo/explain", json=EXAMPLE)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["prediction"] in ("good", "bad") and body["method"] == "integrated_gradients"
+    assert set(body["attributions"]) == set(EXAMPLE)
+    log.info("✔ ¡Éxito! La explicación contiene todos los campos.")
+
+
+def _reference_probabilities(predictor, payloads):
+    """Probabilidades sin caché ni troceo: codificación y forward pass de todo el lote de una vez."""
+    features = predictor.encoder.encode_inputs([CreditRiskInput(**payload) for payload in payloads])
+    return predictor.predict_proba(features).tolist()
+
+
+def test_batch_matches_single_predictions(client_fixture):
+    """
+    Verifica que /mlp_demo/batch devuelve, en orden, las mismas predicciones que /mlp_demo solicitante a solicitante.
+    """
+    log.info("TEST: Verificando la paridad entre el lote y las predicciones individuales.")
+    payloads = [{**EXAMPLE, "Age": age, "Credit amount": amount} for age, amount in ((22, 800), (37, 5400), (64, 12000))]
+    batch = client_fixture.post("/mlp_demo/batch", json=payloads)
+    assert batch.status_code == 200
+    singles = [client_fixture.post("/mlp_demo", json=payload).json() for payload in payloads]
+
+    expected = _reference_probabilities(app.state.registry.active, payloads)
+    assert [r["probability"] for r in batch.json()] == pytest.approx(expected, abs=1e-6)
+    assert [r["probability"] for r in singles] == pytest.approx(expected, abs=1e-6)
+    assert [r["prediction"] for r in batch.json()] == [r["prediction"] for r in singles]
+    log.info("✔ ¡Éxito! El lote y las predicciones individuales coinciden.")
+
+
+def test_batch_larger_than_chunk_size(client_fixture, monkeypatch):
+    """
+    Verifica que un lote mayor que chunk_size se trocea sin perder, duplicar ni desordenar solicitantes.
+    """
+    log.info("TEST: Verificando los límites de trozo de predict_batch.")
+    predictor = app.state.registry.active
+    monkeypatch.setattr(predictor, "chunk_size", 3)
+    # 7 solicitantes -> trozos de 3, 3 y 1 filas
+    payloads = [{**EXAMPLE, "Age": 30 + i, "Duration": 10 + 3 * i} for i in range(7)]
+    response = client_fixture.post("/mlp_demo/batch", json=payloads)
+    assert response.status_code == 200 and len(response.json()) == len(payloads)
+
+    expected = _reference_probabilities(predictor, payloads)
+    assert [r["probability"] for r in response.json()] == pytest.approx(expected, abs=1e-6)
+    log.info("✔ ¡Éxito! El troceo respeta el orden y los límites de cada trozo.")
+
+
+def test_batch_above_max_items_returns_413(client_fixture, monkeypatch):
+    """
+    Verifica que un lote con más de BATCH_ENDPOINT_MAX_ITEMS solicitantes se rechaza con 413.
+    """
+    log.info("TEST: Verificando el límite de tamaño del lote.")
+    from src.core.config import settings
+    monkeypatch.setattr(settings, "BATCH_ENDPOINT_MAX_ITEMS", 4)
+
+    assert client_fixture.post("/mlp_demo/batch", json=[EXAMPLE] * 4).status_code == 200
+    response = client_fixture.post("/mlp_demo/batch", json=[EXAMPLE] * 5)
+    assert response.status_code == 413
+    assert "4" in response.json()["detail"]
+    log.info("✔ ¡Éxito! Los lotes demasiado grandes se rechazan con 413.")
@@ -0,0 +1,58 @@
+import os
+import sys
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+import logging as log
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.inference.batch_score import score_file, build_batch_predictor
+from src.server.schemas import CreditRiskInput
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLE = CreditRiskInput.Config.schema_extra["example"]
+
+
+@pytest.fixture
+def portfolio_fixture(tmp_path):
+    """Cartera pequeña con el formato de german_credit_risk.csv (índice, celdas vacías y columna Risk incluidos)."""
+    rows = []
+    for i, age in enumerate(range(20, 45)):
+        rows.append({
+            **EXAMPLE,
+            "Age": age,
+            "Credit amount": 500 + 300 * i,
+            "Saving accounts": np.nan if i % 3 == 0 else "little",
+            "Risk": "good",
+        })
+    path = tmp_path / "portfolio.csv"
+    pd.DataFrame(rows).to_csv(path, index=True)
+    return path
+
+
+@pytest.mark.parametrize("workers, output_name", [(0, "scored.csv"), (2, "scored.parquet")])
+def test_bulk_scoring_matches_predictor(portfolio_fixture, tmp_path, monkeypatch, workers, output_name):
+    """
+    Verifica que el scoring por lotes (en bloques, con o sin pool de procesos) coincide con preprocessor.transform + modelo.
+    """
+    log.info(f"TEST: Verificando el scoring masivo (workers={workers}).")
+    monkeypatch.chdir(PROJECT_ROOT)
+    output_path = tmp_path / output_name
+    rows = score_file(portfolio_fixture, output_path, version="v1.3.0", chunk_size=7, forward_chunk_size=4, workers=workers)
+
+    scored = pd.read_csv(output_path) if output_path.suffix == ".csv" else pd.read_parquet(output_path)
+    assert rows == len(scored) == 25
+    assert "Unnamed: 0" not in scored.columns and {"Risk", "prediction", "probability"} <= set(scored.columns)
+
+    # referencia: la misma lectura y preprocesamiento que el entrenamiento (pd.read_csv + preprocessor.transform)
+    predictor = build_batch_predictor("v1.3.0", backend="torch", forward_chunk_size=1024)
+    preprocessor = joblib.load(PROJECT_ROOT / "models" / "german_credit_risk_preprocessor.joblib")
+    source = pd.read_csv(portfolio_fixture).drop(columns=["Unnamed: 0", "Risk"])
+    # object dtype: el OneHotEncoder ajustado con pandas 2 no acepta el dtype string de pandas >= 3
+    expected = predictor.backend.predict_proba(np.asarray(preprocessor.transform(source.astype(object)), dtype=np.float32))
+    assert np.allclose(scored["probability"].to_numpy(), expected, atol=1e-6)
+    assert list(scored["prediction"]) == ["good" if p >= 0.5 else "bad" for p in expected]
+    log.info(f"✔ ¡Éxito! {rows} filas puntuadas en el orden de entrada.")
@@ -0,0 +1,133 @@
+import os
+import sys
+import time
+import asyncio
+import threading
+import logging as log
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.inference.batching import MicroBatcher
+
+
+class _RecordingPredictor:
+    """Predictor falso que registra el tamaño de cada lote recibido."""
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict_batch(self, items):
+        self.batch_sizes.append(len(items))
+        return [{"value": item * 2} for item in items]
+
+
+def test_concurrent_requests_are_grouped():
+    """
+    Verifica que solicitudes concurrentes se resuelven con un solo lote y cada una recibe su resultado.
+    """
+    log.info("TEST: Verificando el agrupamiento de solicitudes concurrentes.")
+    predictor = _RecordingPredictor()
+
+    async def scenario():
+        batcher = MicroBatcher(predictor.predict_batch, max_batch_size=64, max_wait_ms=50)
+        batcher.start()
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(scenario())
+    assert results == [{"value": i * 2} for i in range(10)]
+    assert predictor.batch_sizes == [10]
+    log.info("✔ ¡Éxito! Las 10 solicitudes se resolvieron en un único lote.")
+
+
+def test_batch_size_is_bounded():
+    """
+    Verifica que ningún lote supera max_batch_size.
+    """
+    log.info("TEST: Verificando el límite de tamaño de lote.")
+    predictor = _RecordingPredictor()
+
+    async def scenario():
+        batcher = MicroBatcher(predictor.predict_batch, max_batch_size=4, max_wait_ms=50)
+        batcher.start()
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(scenario())
+    assert [r["value"] for r in results] == [i * 2 for i in range(10)]
+    assert max(predictor.batch_sizes) <= 4
+    assert sum(predictor.batch_sizes) == 10
+    log.info(f"✔ ¡Éxito! Tamaños de lote: {predictor.batch_sizes}.")
+
+
+def test_batch_errors_are_propagated():
+    """
+    Verifica que un error en el predictor se propaga a todas las solicitudes del lote.
+    """
+    log.info("TEST: Verificando la propagación de errores.")
+
+    def failing_predict_batch(items):
+        raise ValueError("fallo de inferencia")
+
+    async def scenario():
+        batcher = MicroBatcher(failing_predict_batch, max_batch_size=8, max_wait_ms=10)
+        batcher.start()
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
+    log.info("✔ ¡Éxito! El error llegó a cada solicitud del lote.")
+
+
+def test_batches_run_concurrently_up_to_the_executor_size():
+    """
+    Verifica que hay tantos lotes en curso como workers del executor, y nunca más.
+    """
+    log.info("TEST: Verificando los lotes concurrentes del micro-batcher.")
+    lock = threading.Lock()
+    state = {"running": 0, "max_running": 0}
+
+    def slow_predict_batch(items):
+        with lock:
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+        time.sleep(0.05)
+        with lock:
+            state["running"] -= 1
+        return [item * 2 for item in items]
+
+    async def scenario(executor):
+        batcher = MicroBatcher(slow_predict_batch, max_batch_size=2, max_wait_ms=1, executor=executor, max_concurrent_batches=2)
+        batcher.start()
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(12)))
+        await batcher.stop()
+        return results
+
+    assert MicroBatcher(slow_predict_batch).max_concurrent_batches == 1, "Por defecto, un lote a la vez."
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = asyncio.run(scenario(executor))
+    assert results == [i * 2 for i in range(12)]
+    assert state["max_running"] == 2
+    log.info(f"✔ ¡Éxito! Lotes simultáneos: {state['max_running']}.")
+
+
+def test_wrong_result_count_fails_every_request():
+    """
+    Verifica que si el predictor devuelve un número de resultados distinto, ninguna solicitud queda colgada.
+    """
+    log.info("TEST: Verificando la validación del número de resultados.")
+
+    async def scenario():
+        batcher = MicroBatcher(lambda items: items[:-1], max_batch_size=8, max_wait_ms=10)
+        batcher.start()
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True), timeout=2)
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    log.info("✔ ¡Éxito! Todas las solicitudes del lote recibieron el error.")
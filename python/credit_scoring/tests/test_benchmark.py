@@ -0,0 +1,64 @@
+import os
+import sys
+import asyncio
+import pytest
+import logging as log
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.benchmark.inference import benchmark_version, load_test, summarize_latencies
+from src.inference.predictor import build_registry
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def project_root():
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    yield PROJECT_ROOT
+    os.chdir(cwd)
+
+
+def test_summarize_latencies():
+    """
+    Verifica los percentiles y el throughput calculados a partir de los tiempos medidos.
+    """
+    log.info("TEST: Verificando el resumen de latencias.")
+    summary = summarize_latencies([0.001] * 99 + [0.101], rows_per_call=32)
+    assert summary["p50_ms"] == 1.0
+    assert summary["mean_ms"] == 2.0
+    assert summary["throughput_rows_per_s"] == 16000.0
+    log.info("✔ ¡Éxito! El resumen de latencias es correcto.")
+
+
+def test_benchmark_version_reports_timing_metrics(project_root):
+    """
+    Verifica que el benchmark mide predictor y modelo crudo por tamaño de lote y completa los timing_metrics del YAML.
+    """
+    log.info("TEST: Verificando el benchmark de una versión de modelo.")
+    entry = build_registry().available_versions()["v1.3.0"]
+    report = benchmark_version(
+        entry["model_path"], entry["model_config"], backend="torch", batch_sizes=[1, 8], repeats=3,
+        timing_metrics=["average_inference_time", "average_processing_time", "total_benchmark_time"]
+    )
+    assert set(report["latency"]) == {1, 8}
+    for row in report["latency"].values():
+        assert row["predictor"]["p50_ms"] > 0 and row["raw_model"]["p50_ms"] > 0
+    metrics = report["timing_metrics"]
+    assert metrics["average_inference_time"] == report["latency"][1]["raw_model"]["mean_ms"]
+    assert metrics["average_processing_time"] == report["latency"][1]["predictor"]["mean_ms"]
+    assert metrics["total_benchmark_time"] > 0
+    log.info("✔ ¡Éxito! El benchmark reporta latencias y timing_metrics.")
+
+
+def test_load_test_in_process(project_root):
+    """
+    Verifica el load test en proceso de la API a través del cliente ASGI.
+    """
+    log.info("TEST: Verificando el load test de la API.")
+    result = asyncio.run(load_test(total_requests=20, concurrency=4))
+    assert result["status_codes"] == {200: 20}
+    assert result["throughput_rps"] > 0 and result["latency"]["p99_ms"] > 0
+    log.info("✔ ¡Éxito! El load test completó todas las solicitudes.")
@@ -0,0 +1,113 @@
+import os
+import sys
+import torch
+import pytest
+import numpy as np
+import logging as log
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.training.model import CreditScoringModel
+from src.inference.export import export_model_bundle
+from src.inference.bundle import load_model_bundle
+from src.inference.calibration import ProbabilityCalibrator
+from src.inference.artifacts import bundle_path
+from src.inference.predictor import CreditRiskPredictor
+from src.server.schemas import CreditRiskInput
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PREPROCESSOR_PATH = PROJECT_ROOT / "models" / "german_credit_risk_preprocessor.joblib"
+EXAMPLE = CreditRiskInput.Config.schema_extra["example"]
+MODEL_CONFIG = {"num_features": 26, "hidden_layers": [64, 32], "dropout_rate": 0.1, "use_batch_norm": True, "activation_fn": "ReLU"}
+
+
+def _write_bundle(tmp_path: Path):
+    torch.manual_seed(0)
+    model = CreditScoringModel(**MODEL_CONFIG).eval()
+    calibrator = ProbabilityCalibrator("platt", threshold=0.42, slope=1.3, intercept=-0.2)
+    model_path = tmp_path / "model_v9.9.9.pt"  # the bundle alone is enough to serve
+    path = export_model_bundle(model, PREPROCESSOR_PATH, bundle_path(model_path), calibrator=calibrator)
+    return model, calibrator, model_path, path
+
+
+def test_bundle_serves_the_trained_model(tmp_path):
+    """
+    Verifica que el predictor sirve desde el bundle (sin .pt) con la arquitectura, los pesos y la calibración guardados.
+    """
+    log.info("TEST: Verificando la carga del bundle versionado.")
+    model, calibrator, model_path, path = _write_bundle(tmp_path)
+    bundle = load_model_bundle(path, preprocessor_path=PREPROCESSOR_PATH)
+    assert bundle.model_config == MODEL_CONFIG
+    assert bundle.model_info["total_parameters"] == model.get_model_info()["total_parameters"]
+
+    inputs = [CreditRiskInput(**{**EXAMPLE, "Age": age, "Duration": duration}) for age in (21, 50) for duration in (6, 48)]
+    features = bundle.encoder.encode_inputs(inputs)
+    with torch.no_grad():
+        expected = calibrator.apply(torch.sigmoid(model(torch.from_numpy(features))).view(-1).numpy())
+
+    for backend in ("torch", "numpy", "torch_int8"):
+        # the architecture passed by the caller is replaced by the one in the bundle
+        predictor = CreditRiskPredictor(model_path, PREPROCESSOR_PATH, model_config={"num_features": 26}, backend=backend)
+        assert predictor.bundle is not None and predictor.threshold == 0.42
+        probabilities = np.array([r["probability"] for r in predictor.predict_batch(inputs)])
+        assert np.allclose(probabilities, expected, atol=1e-2 if backend == "torch_int8" else 1e-5), backend
+
+    explanation = predictor.explain(inputs[:1])[0]
+    assert abs(explanation["convergence_delta"]) < 0.05
+    log.info("✔ ¡Éxito! El bundle reproduce el modelo y su calibración en todos los backends.")
+
+
+def test_bundle_rejects_corruption_and_mismatches(tmp_path):
+    """
+    Verifica que se rechaza un bundle corrupto, uno de otro preprocesador y uno de otra arquitectura.
+    """
+    log.info("TEST: Verificando las validaciones del bundle.")
+    _, _, model_path, path = _write_bundle(tmp_path)
+
+    other_preprocessor = tmp_path / "other_preprocessor.joblib"
+    other_preprocessor.write_bytes(PREPROCESSOR_PATH.read_bytes() + b"\0")
+    with pytest.raises(ValueError, match="no corresponde"):
+        load_model_bundle(path, preprocessor_path=other_preprocessor)
+    with pytest.raises(ValueError, match="no corresponde"):
+        CreditRiskPredictor(model_path, other_preprocessor, model_config=MODEL_CONFIG)
+
+    with pytest.raises(ValueError, match="arquitectura"):
+        CreditRiskPredictor(model_path, PREPROCESSOR_PATH, model_config={**MODEL_CONFIG, "hidden_layers": [128, 64]})
+
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF  # last byte of the last array
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="Checksum"):
+        load_model_bundle(path)
+    log.info("✔ ¡Éxito! Los bundles inválidos se rechazan al cargar.")
+
+
+def test_chunks_are_encoded_into_a_reused_buffer(tmp_path):
+    """
+    Verifica que los trozos se codifican en un buffer por hilo reutilizado y que el shadow recibe una copia.
+    """
+    log.info("TEST: Verificando el buffer de características preasignado.")
+    _, _, model_path, _ = _write_bundle(tmp_path)
+    predictor = CreditRiskPredictor(model_path, PREPROCESSOR_PATH, model_config={}, chunk_size=3, backend="numpy")
+    buffer = predictor._feature_buffer()
+    assert buffer.shape == (3, predictor.encoder.num_features) and predictor._feature_buffer() is buffer
+
+    class _Shadow:
+        def __init__(self):
+            self.batches = []
+
+        def submit(self, version, features, probabilities, threshold):
+            self.batches.append(features)
+
+    predictor.shadow = _Shadow()
+    inputs = [CreditRiskInput(**{**EXAMPLE, "Age": 20 + i, "Duration": 6 + i}) for i in range(7)]
+    single = [predictor.predict(item)["probability"] for item in inputs]
+    batched = [r["probability"] for r in predictor.predict_batch(inputs)]
+    assert np.allclose(batched, single, atol=1e-6)
+
+    # 7 single requests + chunks of 3, 3 and 1 rows, none of them aliasing the shared buffer
+    assert [len(features) for features in predictor.shadow.batches] == [1] * 7 + [3, 3, 1]
+    assert not any(np.shares_memory(features, buffer) for features in predictor.shadow.batches)
+    assert np.allclose(predictor.shadow.batches[7], predictor.encoder.encode_inputs(inputs[:3]))
+    log.info("✔ ¡Éxito! El buffer se reutiliza y el shadow puntúa copias estables.")
@@ -0,0 +1,60 @@
+import os
+import sys
+import time
+import logging as log
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.inference.cache import PredictionCache, canonical_key
+from src.server.schemas import CreditRiskInput
+
+EXAMPLE = CreditRiskInput.Config.schema_extra["example"]
+
+
+def test_canonical_key_ignores_aliases_and_numeric_types():
+    """
+    Verifica que payloads equivalentes (orden de campos, 9055 vs 9055.0) comparten la misma clave.
+    """
+    log.info("TEST: Verificando la clave canónica del caché.")
+    original = CreditRiskInput(**EXAMPLE)
+    reordered = CreditRiskInput(**dict(reversed(list(EXAMPLE.items()))))
+    as_float = CreditRiskInput(**{**EXAMPLE, "Credit amount": 9055.0})
+    other = CreditRiskInput(**{**EXAMPLE, "Age": 36})
+
+    assert canonical_key(original) == canonical_key(reordered) == canonical_key(as_float)
+    assert canonical_key(original) != canonical_key(other)
+    log.info("✔ ¡Éxito! La clave canónica es estable.")
+
+
+def test_lru_eviction_and_counters():
+    """
+    Verifica la política LRU y los contadores de hits/misses/evictions.
+    """
+    log.info("TEST: Verificando la política LRU del caché.")
+    cache = PredictionCache(max_size=2)
+    cache.put("a", {"probability": 0.1})
+    cache.put("b", {"probability": 0.2})
+    assert cache.get("a") == {"probability": 0.1}  # 'a' pasa a ser el más reciente
+    cache.put("c", {"probability": 0.3})          # expulsa 'b'
+
+    assert cache.get("b") is None
+    assert cache.get("c") == {"probability": 0.3}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (2, 1, 1, 2)
+    log.info(f"✔ ¡Éxito! Contadores: {stats}.")
+
+
+def test_ttl_expiration():
+    """
+    Verifica que las entradas expiran con el TTL.
+    """
+    log.info("TEST: Verificando la expiración por TTL.")
+    cache = PredictionCache(max_size=8, ttl_seconds=0.05)
+    cache.put("a", {"probability": 0.5})
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    assert cache.expirations == 1
+
+    cache.put("b", {"probability": 0.5})
+    assert cache.get("b") == {"probability": 0.5} and len(cache) == 1
+    log.info("✔ ¡Éxito! El TTL funciona.")
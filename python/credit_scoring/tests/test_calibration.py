@@ -0,0 +1,84 @@
+import os
+import sys
+import shutil
+import numpy as np
+import logging as log
+from pathlib import Path
+from sklearn.isotonic import IsotonicRegression
+from sklearn.metrics import brier_score_loss
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.server.schemas import CreditRiskInput
+from src.inference.artifacts import calibration_path
+from src.inference.calibration import ProbabilityCalibrator, fit_calibrator, optimal_threshold
+from src.inference.predictor import CreditRiskPredictor, MODEL_PATH, PREPROCESSOR_PATH, BEST_MODEL_CONFIG
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _overconfident_scores(n=4000, seed=0):
+    """Etiquetas con P(good) = p y un modelo que reporta p "estirado" (sobreconfiado)."""
+    rng = np.random.default_rng(seed)
+    true_prob = rng.uniform(0.05, 0.95, n)
+    y = (rng.uniform(size=n) < true_prob).astype(int)
+    logit = np.log(true_prob / (1 - true_prob))
+    return y, 1 / (1 + np.exp(-3 * logit))
+
+
+def test_platt_and_isotonic_improve_calibration():
+    """
+    Verifica que Platt e isotónica reducen el Brier score de un modelo sobreconfiado y que la isotónica coincide con sklearn.
+    """
+    log.info("TEST: Verificando el ajuste de la calibración.")
+    y, prob = _overconfident_scores()
+    raw_brier = brier_score_loss(y, prob)
+    for method in ("platt", "isotonic"):
+        calibrator = fit_calibrator(y, prob, method=method)
+        assert brier_score_loss(y, calibrator.apply(prob)) < raw_brier
+        assert 0.0 < calibrator.threshold < 1.0
+
+    isotonic = fit_calibrator(y, prob, method="isotonic")
+    reference = IsotonicRegression(out_of_bounds="clip", y_min=0.0, y_max=1.0).fit(prob, y)
+    assert np.allclose(isotonic.apply(prob), reference.predict(prob))
+    log.info("✔ ¡Éxito! La calibración mejora el Brier score.")
+
+
+def test_optimal_threshold_separates_classes():
+    """
+    Verifica que el umbral óptimo (Youden y F1) separa dos clases perfectamente separables.
+    """
+    log.info("TEST: Verificando la búsqueda del umbral óptimo.")
+    y = np.array([0, 0, 0, 1, 1, 1])
+    prob = np.array([0.1, 0.2, 0.3, 0.7, 0.8, 0.9])
+    for criterion in ("youden", "f1"):
+        threshold = optimal_threshold(y, prob, criterion)
+        assert np.array_equal((prob >= threshold).astype(int), y)
+    log.info("✔ ¡Éxito! El umbral separa las clases.")
+
+
+def test_predictor_loads_calibration_and_threshold(tmp_path):
+    """
+    Verifica que el predictor aplica la calibración guardada junto a los pesos y usa su umbral al iniciar.
+    """
+    log.info("TEST: Verificando la calibración en el predictor.")
+    model_path = tmp_path / MODEL_PATH.name
+    shutil.copy(PROJECT_ROOT / MODEL_PATH, model_path)
+    applicant = CreditRiskInput(**CreditRiskInput.Config.schema_extra["example"])
+
+    def build(**kwargs):
+        return CreditRiskPredictor(model_path=model_path, preprocessor_path=PROJECT_ROOT / PREPROCESSOR_PATH,
+                                   model_config=BEST_MODEL_CONFIG, **kwargs)
+
+    raw = build().predict_batch([applicant])[0]["probability"]
+    calibrator = ProbabilityCalibrator("platt", threshold=0.99, slope=0.5, intercept=0.1)
+    calibrator.save(calibration_path(model_path))
+
+    predictor = build()
+    result = predictor.predict_batch([applicant])[0]
+    assert predictor.threshold == 0.99
+    assert np.isclose(result["probability"], calibrator.apply(np.array([raw]))[0], atol=1e-6)
+    assert result["prediction"] == "bad"
+    assert build(threshold=0.01).predict_batch([applicant])[0]["prediction"] == "good"
+    assert build(use_calibration=False).predict_batch([applicant])[0]["probability"] == raw
+    log.info("✔ ¡Éxito! El predictor usa la calibración y el umbral entrenados.")
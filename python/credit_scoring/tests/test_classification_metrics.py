@@ -0,0 +1,42 @@
+import os
+import sys
+import math
+import torch
+import logging as log
+from sklearn.metrics import accuracy_score, precision_recall_fscore_support, roc_auc_score
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.training.classification_metrics import binary_classification_metrics
+
+
+def test_torch_metrics_match_sklearn():
+    """
+    Verifica que las métricas vectorizadas en torch coinciden con sklearn, incluso con probabilidades empatadas.
+    """
+    log.info("TEST: Verificando las métricas de clasificación en torch.")
+    generator = torch.Generator().manual_seed(0)
+    y_true = (torch.rand(1000, 1, generator=generator) < 0.3).float()
+    # scores rounded to 2 decimals: many ties
+    y_prob = torch.round((0.6 * torch.rand(1000, 1, generator=generator) + 0.3 * y_true) * 100) / 100
+
+    metrics = binary_classification_metrics(y_true, y_prob, threshold=0.5)
+    y_np, prob_np = y_true.view(-1).numpy(), y_prob.view(-1).numpy()
+    pred_np = (prob_np >= 0.5).astype(int)
+    precision, recall, f1, _ = precision_recall_fscore_support(y_np, pred_np, average="binary", zero_division=0)
+    assert math.isclose(metrics["accuracy"], accuracy_score(y_np, pred_np))
+    assert math.isclose(metrics["precision"], precision) and math.isclose(metrics["recall"], recall)
+    assert math.isclose(metrics["f1"], f1)
+    assert math.isclose(metrics["roc_auc"], roc_auc_score(y_np, prob_np), rel_tol=1e-9)
+    log.info("✔ ¡Éxito! Las métricas en torch coinciden con sklearn.")
+
+
+def test_torch_metrics_degenerate_cases():
+    """
+    Verifica los casos sin predicciones positivas y con una sola clase (AUC indefinido).
+    """
+    log.info("TEST: Verificando los casos degenerados de las métricas.")
+    metrics = binary_classification_metrics(torch.zeros(10), torch.full((10,), 0.2))
+    assert metrics["accuracy"] == 1.0 and metrics["precision"] == 0.0 and metrics["f1"] == 0.0
+    assert math.isnan(metrics["roc_auc"])
+    log.info("✔ ¡Éxito! Los casos degenerados se manejan como en sklearn con zero_division=0.")
@@ -0,0 +1,77 @@
+import os
+import sys
+import torch
+import pytest
+import logging as log
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.training.data_pipeline import resolve_data_loader_config, build_train_loader
+
+
+def _epoch_rows(loader, epoch: int):
+    if hasattr(loader.dataset, "set_epoch"):
+        loader.dataset.set_epoch(epoch)
+    rows, sizes = [], []
+    for x_batch, y_batch in loader:
+        assert torch.equal(x_batch[:, 0], y_batch.view(-1)), "x e y deben mantenerse alineados."
+        rows.extend(int(v) for v in x_batch[:, 0])
+        sizes.append(len(x_batch))
+    return rows, sizes
+
+
+@pytest.mark.parametrize("mode, num_workers", [("memory", 0), ("memory", 2), ("streaming", 0), ("streaming", 2)])
+def test_train_loader_shuffles_every_epoch_reproducibly(tmp_path, mode, num_workers):
+    """
+    Verifica que cada época recorre todas las filas una vez, en otro orden, y que la secuencia se repite con la misma semilla.
+    """
+    log.info(f"TEST: Verificando el pipeline de datos ({mode}, workers={num_workers}).")
+    n = 250
+    x = torch.arange(n, dtype=torch.float32).view(-1, 1).repeat(1, 3)
+    y = torch.arange(n, dtype=torch.float32).view(-1, 1)
+    config = resolve_data_loader_config(
+        {"mode": mode, "num_workers": num_workers, "chunk_rows": 64, "chunk_dir": str(tmp_path / "chunks")}, torch.device("cpu")
+    )
+    assert config["pin_memory"] is False and config["shuffle"] is True
+
+    loader = build_train_loader(x, y, batch_size=32, config=config, seed=7)
+    first, sizes = _epoch_rows(loader, 0)
+    second, _ = _epoch_rows(loader, 1)
+    assert sorted(first) == list(range(n)) and sorted(second) == list(range(n))
+    assert first != second and first != list(range(n))
+    assert max(sizes) == 32
+
+    again, _ = _epoch_rows(build_train_loader(x, y, batch_size=32, config=config, seed=7), 0)
+    assert again == first
+    log.info("✔ ¡Éxito! El pipeline baraja por época de forma reproducible.")
+
+
+def test_data_loader_config_validation():
+    """
+    Verifica los valores por defecto y el rechazo de modos desconocidos.
+    """
+    log.info("TEST: Verificando la configuración del pipeline de datos.")
+    config = resolve_data_loader_config(None, torch.device("cpu"))
+    assert config["mode"] == "memory" and config["num_workers"] == 0 and config["pin_memory"] is False
+    with pytest.raises(ValueError):
+        resolve_data_loader_config({"mode": "parquet"}, torch.device("cpu"))
+    log.info("✔ ¡Éxito! La configuración del pipeline se valida correctamente.")
+
+
+def test_streaming_runs_use_separate_chunk_directories(tmp_path):
+    """
+    Verifica que dos loaders en streaming con el mismo chunk_dir no comparten archivos y que cada uno limpia los suyos.
+    """
+    log.info("TEST: Verificando los directorios de chunks por ejecución.")
+    x = torch.arange(100, dtype=torch.float32).view(-1, 1)
+    config = resolve_data_loader_config({"mode": "streaming", "chunk_rows": 16, "chunk_dir": str(tmp_path)}, torch.device("cpu"))
+
+    first = build_train_loader(x, x, batch_size=8, config=config, seed=0)
+    second = build_train_loader(x * 2, x * 2, batch_size=8, config=config, seed=0)
+    first_dir, second_dir = first.dataset.chunk_paths[0].parent, second.dataset.chunk_paths[0].parent
+    assert first_dir != second_dir and first_dir.parent == second_dir.parent == tmp_path
+    assert sorted(row for batch, _ in first for row in batch.view(-1).tolist()) == list(range(100))
+
+    del first
+    assert not first_dir.exists() and second_dir.exists()
+    log.info("✔ ¡Éxito! Cada ejecución escribe y limpia su propio directorio de chunks.")
@@ -0,0 +1,127 @@
+import os
+import sys
+import torch
+import joblib
+import numpy as np
+import pandas as pd
+import logging as log
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.training.model import CreditScoringModel
+from src.inference.export import export_model_bundle
+from src.inference.encoder import CompiledFeatureEncoder
+from src.inference.drift import DriftMonitor, reference_statistics, psi
+from src.inference.artifacts import bundle_path
+from src.inference.predictor import CreditRiskPredictor
+from src.benchmark.inference import synthetic_payloads
+from src.server.schemas import CreditRiskInput
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PREPROCESSOR_PATH = PROJECT_ROOT / "models" / "german_credit_risk_preprocessor.joblib"
+
+
+def _inputs(n: int, seed: int):
+    return [CreditRiskInput(**payload) for payload in synthetic_payloads(n, seed=seed)]
+
+
+def _training_features(encoder: CompiledFeatureEncoder, n: int, seed: int) -> np.ndarray:
+    """
+    The same applicants as `_inputs(n, seed)`, encoded as in training: missing accounts are NaN in the dataset.
+    """
+    frame = pd.DataFrame(synthetic_payloads(n, seed=seed)).replace({"Saving accounts": {"NA": np.nan}, "Checking account": {"NA": np.nan}})
+    return encoder.encode_frame(frame)
+
+
+def test_drift_monitor_matches_reference_and_detects_shift():
+    """
+    Verifica que los mismos datos de referencia no muestran drift y que un desplazamiento de Age sí se detecta.
+    """
+    log.info("TEST: Verificando el monitor de drift en streaming.")
+    encoder = CompiledFeatureEncoder.from_preprocessor(joblib.load(PREPROCESSOR_PATH))
+    reference = reference_statistics(encoder, _training_features(encoder, 2000, seed=0))
+    # served rows: missing accounts arrive as the API's "NA"
+    features = encoder.encode_inputs(_inputs(2000, seed=0))
+
+    monitor = DriftMonitor(reference, encoder, min_samples=100)
+    assert monitor.report()["status"] == "insufficient_data"
+    # same rows in uneven batches: identical histograms, mean and std
+    for start in range(0, len(features), 37):
+        monitor.update(features[start:start + 37])
+    report = monitor.report()
+    assert report["rows"] == 2000 and report["status"] == "stable"
+    assert all(entry["psi"] < 1e-9 for entry in report["numerical"].values())
+    assert all(entry["psi"] < 1e-9 for entry in report["categorical"].values())
+    saving = report["categorical"]["Saving accounts"]
+    assert saving["counts"]["NA"] == saving["reference_counts"]["NA"] > 0 and saving["counts"]["__unknown__"] == 0
+    age = report["numerical"]["Age"]
+    assert abs(age["mean"] - age["reference_mean"]) < 1e-6 and abs(age["std"] - age["reference_std"]) < 1e-6
+
+    # applicants 15 years older
+    monitor.reset()
+    shifted = features.copy()
+    shifted[:, 0] += 15.0 / encoder.scales[0]
+    monitor.update(shifted)
+    report = monitor.report()
+    assert report["numerical"]["Age"]["status"] == "significant" and report["numerical"]["Age"]["ks"] > 0.2
+    assert report["numerical"]["Duration"]["status"] == "stable" and report["status"] == "significant"
+    assert psi([10, 10], [10, 10]) == 0.0
+    log.info("✔ ¡Éxito! El monitor de drift reproduce la referencia y detecta el desplazamiento.")
+
+
+def test_predictor_updates_drift_from_bundle(tmp_path):
+    """
+    Verifica que el predictor toma las estadísticas de referencia del bundle y actualiza el monitor en cada predicción.
+    """
+    log.info("TEST: Verificando el monitoreo de drift en el predictor.")
+    encoder = CompiledFeatureEncoder.from_preprocessor(joblib.load(PREPROCESSOR_PATH))
+    reference = reference_statistics(encoder, _training_features(encoder, 65, seed=2))
+
+    torch.manual_seed(0)
+    model = CreditScoringModel(num_features=26, hidden_layers=[32], dropout_rate=0.1, use_batch_norm=True, activation_fn="ReLU").eval()
+    model_path = tmp_path / "model.pt"
+    export_model_bundle(model, PREPROCESSOR_PATH, bundle_path(model_path), reference_stats=reference)
+
+    predictor = CreditRiskPredictor(model_path, PREPROCESSOR_PATH, {"num_features": 26}, backend="numpy",
+                                    monitor_drift=True, drift_min_samples=10)
+    assert predictor.drift is not None
+    inputs = _inputs(65, seed=2)
+    predictor.predict_batch(inputs[:64])
+    predictor.predict(inputs[64])
+    report = predictor.drift.report()
+    # the reference applicants themselves, served through the API: no drift
+    assert report["rows"] == 65 and report["status"] == "stable"
+    assert max(predictor.drift.psi_values().values()) < 1e-9
+    assert sum(report["categorical"]["Purpose"]["counts"].values()) == 65
+
+    disabled = CreditRiskPredictor(model_path, PREPROCESSOR_PATH, {"num_features": 26}, backend="numpy")
+    assert disabled.drift is None
+    log.info("✔ ¡Éxito! El predictor alimenta el monitor de drift.")
+
+
+def test_cached_predictions_update_drift(tmp_path):
+    """
+    Verifica que las solicitudes repetidas servidas desde el caché también actualizan los conteos de drift.
+    """
+    log.info("TEST: Verificando el monitoreo de drift con aciertos de caché.")
+    encoder = CompiledFeatureEncoder.from_preprocessor(joblib.load(PREPROCESSOR_PATH))
+    reference = reference_statistics(encoder, _training_features(encoder, 65, seed=2))
+    torch.manual_seed(0)
+    model = CreditScoringModel(num_features=26, hidden_layers=[32], dropout_rate=0.1, use_batch_norm=True, activation_fn="ReLU").eval()
+    model_path = tmp_path / "model.pt"
+    export_model_bundle(model, PREPROCESSOR_PATH, bundle_path(model_path), reference_stats=reference)
+
+    predictor = CreditRiskPredictor(model_path, PREPROCESSOR_PATH, {"num_features": 26}, backend="numpy",
+                                    cache_size=16, monitor_drift=True, drift_min_samples=10)
+    applicant = _inputs(1, seed=3)[0]
+    first = predictor.predict(applicant)
+    assert predictor.lookup(applicant) == first, "El acierto de caché no debe exponer la fila codificada."
+    results = predictor.predict_batch([applicant] * 3)
+    assert all(result == first for result in results)
+    assert predictor.cache.stats()["hits"] == 4
+
+    report = predictor.drift.report()
+    assert report["rows"] == 5
+    assert max(report["categorical"]["Purpose"]["counts"].values()) == 5, "Las 5 solicitudes repetidas cuentan en su categoría."
+    log.info("✔ ¡Éxito! Los aciertos de caché se cuentan en el monitor de drift.")
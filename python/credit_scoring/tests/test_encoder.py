@@ -0,0 +1,107 @@
+import os
+import sys
+import itertools
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+import logging as log
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.inference.encoder import CompiledFeatureEncoder
+from src.server.schemas import (
+    CreditRiskInput, SexEnum, HousingEnum, SavingAccountsEnum, CheckingAccountEnum, PurposeEnum
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PREPROCESSOR_PATH = PROJECT_ROOT / "models" / "german_credit_risk_preprocessor.joblib"
+DATASET_PATH = (PROJECT_ROOT / "../../datasets/genia_services_csv_german_credit_risk_v1.0.0_training_20250825/german_credit_risk.csv").resolve()
+
+
+@pytest.fixture(scope="module")
+def preprocessor_fixture():
+    """Carga el ColumnTransformer entrenado."""
+    return joblib.load(PREPROCESSOR_PATH)
+
+
+@pytest.fixture(scope="module")
+def encoder_fixture(preprocessor_fixture):
+    """Compila el encoder a partir del preprocesador entrenado."""
+    return CompiledFeatureEncoder.from_preprocessor(preprocessor_fixture)
+
+
+def _sklearn_features(preprocessor, df: pd.DataFrame) -> np.ndarray:
+    """Ruta de referencia: la misma conversión que usaba el predictor."""
+    return np.asarray(preprocessor.transform(df), dtype=np.float32)
+
+
+def test_parity_on_category_grid(preprocessor_fixture, encoder_fixture):
+    """
+    Verifica que el encoder es idéntico al sklearn path en todas las combinaciones de categorías,
+    incluyendo los valores 'NA' de la API y los NaN del dataset.
+    """
+    log.info("TEST: Verificando paridad del encoder sobre la grilla de categorías.")
+    rng = np.random.default_rng(42)
+    categorical_values = [
+        [e.value for e in SexEnum],
+        [e.value for e in HousingEnum],
+        [e.value for e in SavingAccountsEnum] + [np.nan],
+        [e.value for e in CheckingAccountEnum] + [np.nan],
+        [e.value for e in PurposeEnum],
+    ]
+    records = []
+    for sex, housing, saving, checking, purpose in itertools.product(*categorical_values):
+        records.append({
+            "Age": int(rng.integers(19, 76)),
+            "Sex": sex,
+            "Job": int(rng.integers(0, 4)),
+            "Housing": housing,
+            "Saving accounts": saving,
+            "Checking account": checking,
+            "Credit amount": float(rng.uniform(250, 18500)),
+            "Duration": int(rng.integers(4, 73)),
+            "Purpose": purpose,
+        })
+
+    expected = _sklearn_features(preprocessor_fixture, pd.DataFrame(records))
+    actual = encoder_fixture.encode_records(records)
+    assert actual.dtype == np.float32
+    assert np.array_equal(actual, expected), "El encoder compilado no coincide con preprocessor.transform."
+    assert np.array_equal(encoder_fixture.encode_frame(pd.DataFrame(records)), expected), "encode_frame no coincide con preprocessor.transform."
+    log.info(f"✔ ¡Éxito! {len(records)} combinaciones idénticas al sklearn path.")
+
+
+def test_parity_on_api_inputs(preprocessor_fixture, encoder_fixture):
+    """
+    Verifica la paridad partiendo de objetos CreditRiskInput validados (ruta de la API).
+    """
+    log.info("TEST: Verificando paridad del encoder con entradas de la API.")
+    example = CreditRiskInput.Config.schema_extra["example"]
+    inputs = [
+        CreditRiskInput(**example),
+        CreditRiskInput(**{**example, "Saving accounts": "quite rich", "Checking account": "little", "Purpose": "radio/TV"}),
+        CreditRiskInput(**{**example, "Sex": "female", "Housing": "rent", "Credit amount": 1234.5}),
+    ]
+    expected = _sklearn_features(preprocessor_fixture, pd.DataFrame([item.dict(by_alias=True) for item in inputs]))
+
+    buffer = np.empty((8, encoder_fixture.num_features), dtype=np.float32)
+    actual = encoder_fixture.encode_inputs(inputs, out=buffer)
+    assert np.array_equal(actual, expected)
+    log.info("✔ ¡Éxito! Las entradas de la API se codifican igual que con sklearn.")
+
+
+@pytest.mark.skipif(not DATASET_PATH.exists(), reason="Dataset no disponible (ejecuta `dvc pull`).")
+def test_parity_on_dataset(preprocessor_fixture, encoder_fixture):
+    """
+    Verifica la paridad del encoder sobre todo el dataset de entrenamiento.
+    """
+    log.info("TEST: Verificando paridad del encoder sobre el dataset completo.")
+    df = pd.read_csv(DATASET_PATH)
+    df = df.drop(columns=[c for c in ("Unnamed: 0", "Risk") if c in df.columns])
+
+    expected = _sklearn_features(preprocessor_fixture, df)
+    actual = encoder_fixture.encode_records(df.to_dict(orient="records"))
+    assert np.array_equal(actual, expected)
+    log.info(f"✔ ¡Éxito! {len(df)} filas del dataset idénticas al sklearn path.")
@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+import threading
+import logging as log
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.inference.executor import InferenceExecutor, InferenceOverloadedError
+
+
+def test_admission_is_bounded():
+    """
+    Verifica que el executor rechaza solicitudes cuando todos los cupos están ocupados y los libera al terminar.
+    """
+    log.info("TEST: Verificando el control de admisión del executor.")
+    executor = InferenceExecutor(max_workers=1, max_pending=2)
+    with executor.admit(), executor.admit():
+        with pytest.raises(InferenceOverloadedError):
+            with executor.admit():
+                pass
+        assert executor.stats()["pending"] == 2
+    stats = executor.stats()
+    assert (stats["pending"], stats["rejected"]) == (0, 1)
+    executor.shutdown()
+    log.info(f"✔ ¡Éxito! Estadísticas: {stats}.")
+
+
+def test_blocking_inference_keeps_event_loop_responsive():
+    """
+    Verifica que una inferencia lenta en el executor no bloquea el event loop.
+    """
+    log.info("TEST: Verificando que el event loop sigue respondiendo.")
+    executor = InferenceExecutor(max_workers=1, max_pending=4)
+
+    def slow_inference():
+        time.sleep(0.3)
+        return threading.current_thread().name
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        inference = loop.run_in_executor(executor, slow_inference)
+        ticks = 0
+        while not inference.done():
+            await asyncio.sleep(0.01)
+            ticks += 1
+        return await inference, ticks
+
+    thread_name, ticks = asyncio.run(scenario())
+    assert thread_name.startswith("inference")
+    assert ticks > 10, "El event loop quedó bloqueado durante la inferencia."
+    executor.shutdown()
+    log.info(f"✔ ¡Éxito! El event loop atendió {ticks} ticks durante la inferencia.")
@@ -0,0 +1,63 @@
+import os
+import sys
+import torch
+import joblib
+import numpy as np
+import logging as log
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.server.schemas import CreditRiskInput
+from src.inference.encoder import CompiledFeatureEncoder
+from src.inference.explain import IntegratedGradientsExplainer
+from src.inference.predictor import CreditRiskPredictor, MODEL_PATH, PREPROCESSOR_PATH, BEST_MODEL_CONFIG
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLE = CreditRiskInput.Config.schema_extra["example"]
+APPLICANT = {**EXAMPLE, "Saving accounts": "little", "Checking account": "moderate"}
+
+
+def test_integrated_gradients_on_linear_model_are_exact():
+    """
+    Verifica que con un modelo lineal los aportes por campo son exactamente peso x (x - referencia) sumados por campo.
+    """
+    log.info("TEST: Verificando integrated gradients sobre un modelo lineal.")
+    encoder = CompiledFeatureEncoder.from_preprocessor(joblib.load(PROJECT_ROOT / PREPROCESSOR_PATH))
+    torch.manual_seed(0)
+    model = torch.nn.Linear(encoder.num_features, 1).eval()
+    explainer = IntegratedGradientsExplainer(model, encoder, steps=8)
+    features = encoder.encode_records([APPLICANT])
+
+    explanation = explainer.explain(features)[0]
+    contributions = (model.weight.detach().numpy()[0] * features[0]) @ explainer.field_matrix
+    expected = dict(zip(explainer.fields, contributions))
+    assert set(explanation["attributions"]) == set(EXAMPLE)
+    for field, value in explanation["attributions"].items():
+        assert abs(value - expected[field]) < 1e-5
+    assert abs(explanation["convergence_delta"]) < 1e-5
+    log.info("✔ ¡Éxito! Los aportes del modelo lineal son exactos.")
+
+
+def test_predictor_explanations_match_prediction_and_are_cached():
+    """
+    Verifica que la explicación incluye la predicción servida, converge y se responde desde el caché la segunda vez.
+    """
+    log.info("TEST: Verificando las explicaciones del predictor.")
+    predictor = CreditRiskPredictor(
+        model_path=PROJECT_ROOT / MODEL_PATH,
+        preprocessor_path=PROJECT_ROOT / PREPROCESSOR_PATH,
+        model_config=BEST_MODEL_CONFIG,
+        explain_steps=64,
+        explanation_cache_size=8
+    )
+    applicant = CreditRiskInput(**APPLICANT)
+    explanation = predictor.explain([applicant])[0]
+    prediction = predictor.predict_batch([applicant])[0]
+    assert explanation["prediction"] == prediction["prediction"]
+    assert np.isclose(explanation["probability"], prediction["probability"])
+    assert abs(explanation["convergence_delta"]) < 0.05
+
+    assert predictor.explain([applicant])[0] == explanation
+    assert predictor.explanation_cache.stats()["hits"] == 1
+    log.info(f"✔ ¡Éxito! Aportes: {explanation['attributions']}.")
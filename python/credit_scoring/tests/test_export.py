@@ -0,0 +1,84 @@
+import os
+import sys
+import torch
+import torch.nn as nn
+import pytest
+import logging as log
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.training.model import CreditScoringModel
+from src.inference.export import fold_batch_norm, export_frozen_model, fold_to_numpy
+from src.inference.torch_backend import TorchBackend
+from src.inference.artifacts import frozen_model_path
+
+
+@pytest.fixture(scope="module")
+def trained_like_model():
+    """Modelo con estadísticas de BatchNorm no triviales, como si estuviera entrenado."""
+    torch.manual_seed(0)
+    model = CreditScoringModel(num_features=26, hidden_layers=[64, 32], dropout_rate=0.2, use_batch_norm=True, activation_fn="ReLU")
+    for module in model.modules():
+        if isinstance(module, nn.BatchNorm1d):
+            module.running_mean.uniform_(-1, 1)
+            module.running_var.uniform_(0.5, 2.0)
+            module.weight.data.uniform_(0.5, 1.5)
+            module.bias.data.uniform_(-0.5, 0.5)
+    return model.eval()
+
+
+def test_fold_batch_norm_removes_bn_and_dropout(trained_like_model):
+    """
+    Verifica que el grafo plegado solo contiene Linear y activaciones, y que conserva la salida.
+    """
+    log.info("TEST: Verificando el plegado de BatchNorm.")
+    fused = fold_batch_norm(trained_like_model)
+
+    assert not any(isinstance(m, (nn.BatchNorm1d, nn.Dropout)) for m in fused)
+    assert [type(m) for m in fused] == [nn.Linear, nn.ReLU, nn.Linear, nn.ReLU, nn.Linear]
+
+    x = torch.randn(128, 26)
+    with torch.no_grad():
+        assert torch.allclose(trained_like_model(x), fused(x), atol=1e-5)
+    log.info("✔ ¡Éxito! El grafo plegado es equivalente al modelo original.")
+
+
+def test_export_roundtrip(trained_like_model, tmp_path):
+    """
+    Verifica que el artefacto TorchScript se guarda junto a los pesos y se recarga con la misma salida.
+    """
+    log.info("TEST: Verificando la exportación TorchScript.")
+    output_path = frozen_model_path(tmp_path / "genia_services_mlp_credit_scoring_model_v9.9.9.pt")
+    assert output_path.name == "genia_services_mlp_credit_scoring_model_v9.9.9.torchscript.pt"
+
+    export_frozen_model(trained_like_model, output_path, num_features=26)
+    loaded = torch.jit.load(str(output_path))
+
+    x = torch.randn(16, 26)
+    with torch.no_grad():
+        assert torch.allclose(trained_like_model(x), loaded(x), atol=1e-5)
+    log.info("✔ ¡Éxito! El grafo congelado se recarga y reproduce la salida del modelo.")
+
+
+def test_torch_backend_prefers_frozen_graph(trained_like_model, tmp_path):
+    """
+    Verifica que el backend torch carga el grafo congelado cuando está al día, aunque reciba pesos compartidos.
+    """
+    log.info("TEST: Verificando que el backend torch usa el grafo TorchScript congelado.")
+    model_path = tmp_path / "genia_services_mlp_credit_scoring_model_v9.9.9.pt"
+    torch.save(trained_like_model.state_dict(), model_path)
+    torch.manual_seed(1)
+    other_model = CreditScoringModel(num_features=26, hidden_layers=[64, 32], dropout_rate=0.2, use_batch_norm=True, activation_fn="ReLU").eval()
+    x = torch.randn(16, 26)
+    with torch.no_grad():
+        expected = torch.sigmoid(trained_like_model(x)).view(-1).numpy()
+
+    # sin grafo congelado: los pesos compartidos (de otro modelo) se usan tal cual
+    backend = TorchBackend(model_path, model_config={}, shared_model=fold_to_numpy(other_model))
+    assert not isinstance(backend.model, torch.jit.ScriptModule)
+
+    export_frozen_model(trained_like_model, frozen_model_path(model_path), num_features=26)
+    backend = TorchBackend(model_path, model_config={}, shared_model=fold_to_numpy(other_model))
+    assert isinstance(backend.model, torch.jit.ScriptModule)
+    assert torch.allclose(torch.from_numpy(backend.predict_proba(x.numpy())), torch.from_numpy(expected), atol=1e-5)
+    log.info("✔ ¡Éxito! El grafo congelado tiene prioridad sobre los pesos compartidos.")
@@ -0,0 +1,47 @@
+import os
+import sys
+import logging as log
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.metrics import REGISTRY, Counter, Histogram, MetricsRegistry
+
+
+def test_prometheus_text_format():
+    """
+    Verifica el formato de texto de Prometheus de contadores e histogramas (buckets acumulados, _sum y _count).
+    """
+    log.info("TEST: Verificando el formato de las métricas.")
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("test_requests_total", "Requests.", ("route", "status")))
+    histogram = registry.register(Histogram("test_stage_seconds", "Stage latency.", buckets=(0.01, 0.1), labelnames=("stage",)))
+    registry.register_gauge("test_queue", "Queue depth.", lambda: [((), 3)])
+
+    counter.inc("/mlp_demo", "200")
+    counter.inc("/mlp_demo", "200")
+    for value in (0.005, 0.05, 0.5):
+        histogram.observe(value, "forward")
+
+    lines = registry.render().splitlines()
+    assert 'test_requests_total{route="/mlp_demo",status="200"} 2' in lines
+    assert 'test_stage_seconds_bucket{stage="forward",le="0.01"} 1' in lines
+    assert 'test_stage_seconds_bucket{stage="forward",le="0.1"} 2' in lines
+    assert 'test_stage_seconds_bucket{stage="forward",le="+Inf"} 3' in lines
+    assert 'test_stage_seconds_count{stage="forward"} 3' in lines
+    assert "# TYPE test_queue gauge" in lines and "test_queue 3" in lines
+    log.info("✔ ¡Éxito! Las métricas se exponen en formato Prometheus.")
+
+
+def test_disabled_metrics_are_not_recorded():
+    """
+    Verifica que con METRICS_ENABLED=false las observaciones no se registran.
+    """
+    log.info("TEST: Verificando las métricas deshabilitadas.")
+    histogram = Histogram("test_disabled_seconds", "Disabled.")
+    REGISTRY.enabled = False
+    try:
+        histogram.observe(0.1)
+    finally:
+        REGISTRY.enabled = True
+    assert histogram.count() == 0
+    log.info("✔ ¡Éxito! Sin métricas habilitadas no se registra nada.")
@@ -0,0 +1,39 @@
+import os
+import sys
+import torch
+import numpy as np
+import pytest
+import logging as log
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.training.model import CreditScoringModel
+from src.inference.export import export_numpy_weights
+from src.inference.numpy_backend import NumpyBackend
+
+
+@pytest.mark.parametrize("activation_fn", ["ReLU", "LeakyReLU", "GELU"])
+def test_numpy_backend_matches_torch(activation_fn, tmp_path):
+    """
+    Verifica que el backend NumPy (BatchNorm plegado) reproduce las probabilidades del modelo PyTorch.
+    """
+    log.info(f"TEST: Verificando el backend NumPy con activación {activation_fn}.")
+    torch.manual_seed(0)
+    model = CreditScoringModel(num_features=26, hidden_layers=[64, 32, 16], dropout_rate=0.1, use_batch_norm=True, activation_fn=activation_fn)
+    for module in model.modules():
+        if isinstance(module, torch.nn.BatchNorm1d):
+            module.running_mean.uniform_(-1, 1)
+            module.running_var.uniform_(0.5, 2.0)
+    model.eval()
+
+    weights_path = export_numpy_weights(model, tmp_path / "model.npz", num_features=26)
+    backend = NumpyBackend(weights_path)
+
+    x = torch.randn(256, 26)
+    with torch.no_grad():
+        expected = torch.sigmoid(model(x)).view(-1).numpy()
+    actual = backend.predict_proba(x.numpy())
+
+    assert actual.dtype == np.float32 and actual.shape == (256,)
+    assert np.allclose(actual, expected, atol=1e-5)
+    log.info("✔ ¡Éxito! El backend NumPy coincide con PyTorch.")
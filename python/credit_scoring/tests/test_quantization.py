@@ -0,0 +1,30 @@
+import os
+import sys
+import torch
+import torch.nn as nn
+import logging as log
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.training.model import CreditScoringModel
+from src.inference.quantization import quantize_dynamic_int8
+
+
+def test_dynamic_int8_quantization_close_to_fp32():
+    """
+    Verifica que el modelo cuantizado a int8 no contiene BatchNorm/Dropout y se mantiene cerca del fp32.
+    """
+    log.info("TEST: Verificando la cuantización dinámica int8.")
+    torch.manual_seed(0)
+    model = CreditScoringModel(num_features=26, hidden_layers=[128, 64], dropout_rate=0.2, use_batch_norm=True, activation_fn="ReLU").eval()
+    quantized = quantize_dynamic_int8(model)
+
+    assert not any(isinstance(m, (nn.BatchNorm1d, nn.Dropout, nn.Linear)) for m in quantized.modules())
+
+    x = torch.randn(512, 26)
+    with torch.no_grad():
+        prob_fp32 = torch.sigmoid(model(x))
+        prob_int8 = torch.sigmoid(quantized(x))
+    assert (prob_fp32 - prob_int8).abs().max().item() < 0.05
+    assert ((prob_fp32 >= 0.5) == (prob_int8 >= 0.5)).float().mean().item() > 0.95
+    log.info("✔ ¡Éxito! El modelo int8 reproduce las probabilidades del modelo fp32.")
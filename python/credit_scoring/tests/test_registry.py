@@ -0,0 +1,165 @@
+import os
+import sys
+import pytest
+import threading
+import numpy as np
+import logging as log
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.inference.registry import ModelRegistry
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class _FakePredictor:
+    """Predictor falso: registra la versión y los lotes de warm-up."""
+    def __init__(self, model_path, model_config):
+        self.model_path = model_path
+        self.model_config = model_config
+        self.warmed_up_with = None
+
+    def warmup(self, batch_sizes):
+        self.warmed_up_with = batch_sizes
+
+
+@pytest.fixture
+def registry_fixture():
+    return ModelRegistry(
+        models_dir=PROJECT_ROOT / "models",
+        config_dir=PROJECT_ROOT / "config" / "training",
+        num_features=26,
+        predictor_factory=_FakePredictor
+    )
+
+
+def test_versions_are_discovered(registry_fixture):
+    """
+    Verifica que el registro descubre las versiones de models/ con la arquitectura de su YAML de entrenamiento.
+    """
+    log.info("TEST: Verificando el descubrimiento de versiones.")
+    versions = registry_fixture.available_versions()
+    assert {"v1.0.0", "v1.1.0", "v1.2.0", "v1.3.0"} <= set(versions)
+    assert versions["v1.0.0"]["model_config"]["hidden_layers"] == [128, 64]
+    assert versions["v1.3.0"]["model_config"]["hidden_layers"] == [256, 128, 64, 64]
+    log.info(f"✔ ¡Éxito! Versiones encontradas: {sorted(versions)}.")
+
+
+def test_activate_swaps_after_warmup(registry_fixture):
+    """
+    Verifica que activar una versión la precalienta y reemplaza al predictor activo.
+    """
+    log.info("TEST: Verificando el hot swap de versiones.")
+    first = registry_fixture.activate("v1.3.0")
+    assert registry_fixture.active is first and first.warmed_up_with is not None
+
+    second = registry_fixture.activate("v1.2.0")
+    assert registry_fixture.active is second and registry_fixture.active_version == "v1.2.0"
+    assert registry_fixture.history[-1]["previous_version"] == "v1.3.0"
+
+    with pytest.raises(KeyError):
+        registry_fixture.activate("v9.9.9")
+    assert registry_fixture.active is second, "Una activación fallida no debe cambiar la versión activa."
+    log.info("✔ ¡Éxito! El swap es atómico y una versión inválida no afecta al predictor activo.")
+
+
+def test_shadow_follows_active_predictor(registry_fixture, monkeypatch):
+    """
+    Verifica que el scorer shadow se adjunta al predictor activo y sobrevive al hot swap.
+    """
+    log.info("TEST: Verificando el scoring shadow en el registro.")
+
+    monkeypatch.setattr(_FakePredictor, "predict_proba", lambda self, features: features[:, 0], raising=False)
+    monkeypatch.setattr(_FakePredictor, "threshold", 0.4, raising=False)
+    registry_fixture.activate("v1.3.0")
+    shadow = registry_fixture.enable_shadow(["v1.3.0", "v1.2.0"])
+    assert list(shadow.shadows) == ["v1.2.0"], "La versión activa no debe usarse como shadow."
+    assert registry_fixture.active.shadow is shadow
+    assert shadow.threshold == 0.4, "El scorer shadow debe usar el umbral del predictor activo."
+
+    registry_fixture.activate("v1.1.0")
+    assert registry_fixture.active.shadow is shadow
+    assert shadow.primary_version == "v1.1.0"
+    shadow.close()
+    log.info("✔ ¡Éxito! El scorer shadow acompaña al predictor activo.")
+
+
+def test_shadow_thresholds_follow_each_version(registry_fixture, monkeypatch):
+    """
+    Verifica que cada modelo shadow usa su propio umbral y que el del primario se actualiza en el hot swap.
+    """
+    log.info("TEST: Verificando los umbrales del scoring shadow tras un hot swap.")
+    thresholds = {"v1.1.0": 0.3, "v1.2.0": 0.6, "v1.3.0": 0.45}
+    monkeypatch.setattr(_FakePredictor, "predict_proba", lambda self, features: features[:, 0], raising=False)
+    monkeypatch.setattr(_FakePredictor, "threshold",
+                        property(lambda self: next(t for v, t in thresholds.items() if v in self.model_path.name)),
+                        raising=False)
+    registry_fixture.activate("v1.3.0")
+    shadow = registry_fixture.enable_shadow(["v1.2.0"])
+    assert shadow.stats()["threshold"] == 0.45
+    assert shadow.stats()["shadows"]["v1.2.0"]["threshold"] == 0.6
+
+    registry_fixture.activate("v1.1.0")
+    stats = shadow.stats()
+    assert stats["primary_version"] == "v1.1.0" and stats["threshold"] == 0.3
+    assert stats["shadows"]["v1.2.0"]["threshold"] == 0.6
+    shadow.close()
+    log.info(f"✔ ¡Éxito! Umbrales shadow: {stats['threshold']} (primario) / {stats['shadows']['v1.2.0']['threshold']} (v1.2.0).")
+
+
+def test_activating_a_shadow_version_removes_it_from_shadows(registry_fixture, monkeypatch):
+    """
+    Verifica que al activar una versión que estaba en shadow deja de compararse contra sí misma.
+    """
+    log.info("TEST: Verificando la activación de una versión shadow.")
+    monkeypatch.setattr(_FakePredictor, "predict_proba", lambda self, features: features[:, 0], raising=False)
+    monkeypatch.setattr(_FakePredictor, "threshold", 0.5, raising=False)
+    registry_fixture.activate("v1.3.0")
+    shadow = registry_fixture.enable_shadow(["v1.2.0", "v1.1.0"])
+
+    registry_fixture.activate("v1.2.0")
+    assert list(shadow.shadows) == ["v1.1.0"]
+    assert list(shadow.stats()["shadows"]) == ["v1.1.0"]
+    assert registry_fixture.status()["shadow_versions"] == ["v1.1.0"]
+
+    registry_fixture.activate("v1.1.0")
+    assert shadow.shadows == {} and registry_fixture.active.shadow is shadow
+    shadow.submit("v1.1.0", np.zeros((2, 26), dtype=np.float32), np.zeros(2), 0.5)
+    shadow.join()
+    shadow.close()
+    log.info("✔ ¡Éxito! La versión activada se retira del conjunto shadow.")
+
+
+def test_old_predictor_batches_are_not_mixed_after_swap(registry_fixture, monkeypatch):
+    """
+    Verifica que los lotes del predictor reemplazado (en cola o enviados tras el swap) no entran en los agregados del nuevo primario.
+    """
+    log.info("TEST: Verificando el aislamiento del scoring shadow durante un hot swap.")
+    release = threading.Event()
+
+    def blocking_predict_proba(self, features):
+        release.wait(timeout=5)
+        return features[:, 0]
+
+    monkeypatch.setattr(_FakePredictor, "predict_proba", blocking_predict_proba, raising=False)
+    monkeypatch.setattr(_FakePredictor, "threshold", 0.5, raising=False)
+    old = registry_fixture.activate("v1.3.0")
+    shadow = registry_fixture.enable_shadow(["v1.2.0"])
+    features = np.ones((4, 26), dtype=np.float32)
+
+    in_flight = old.shadow  # referencia que una solicitud en curso ya leyó del predictor anterior
+    in_flight.submit(old.version, features, np.zeros(4), old.threshold)  # en cola: el shadow está bloqueado
+    new = registry_fixture.activate("v1.1.0")
+    assert old.shadow is None and new.shadow is shadow
+    in_flight.submit(old.version, features, np.zeros(4), old.threshold)  # enviado después del swap
+    new.shadow.submit(new.version, features[:2], np.ones(2), new.threshold)
+    release.set()
+    shadow.join()
+
+    stats = shadow.stats()
+    assert stats["primary_version"] == "v1.1.0"
+    assert stats["shadows"]["v1.2.0"]["rows"] == 2 and stats["shadows"]["v1.2.0"]["agreement_rate"] == 1.0
+    assert stats["stale_batches"] == 2
+    shadow.close()
+    log.info(f"✔ ¡Éxito! Lotes descartados del predictor anterior: {stats['stale_batches']}.")
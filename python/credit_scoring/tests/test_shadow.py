@@ -0,0 +1,79 @@
+import os
+import sys
+import numpy as np
+import logging as log
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.inference.shadow import ShadowScorer
+
+
+def _primary(features):
+    return 1.0 / (1.0 + np.exp(-features[:, 0]))
+
+
+def test_shadow_aggregates_agreement_and_deltas():
+    """
+    Verifica que el scorer shadow agrega acuerdo y deltas de probabilidad contra el modelo primario.
+    """
+    log.info("TEST: Verificando las métricas del scoring shadow.")
+    scorer = ShadowScorer({
+        "same": _primary,
+        "inverted": lambda features: 1.0 - _primary(features),
+    })
+    scorer.set_primary_version("v1.3.0")
+    features = np.random.default_rng(0).standard_normal((64, 26)).astype(np.float32)
+    scorer.submit("v1.3.0", features, _primary(features), 0.5)
+    scorer.join()
+
+    stats = scorer.stats()
+    assert stats["primary_version"] == "v1.3.0" and stats["dropped_batches"] == 0
+    assert stats["shadows"]["same"]["rows"] == 64
+    assert stats["shadows"]["same"]["agreement_rate"] == 1.0
+    assert stats["shadows"]["same"]["max_abs_delta"] == 0.0
+    assert stats["shadows"]["inverted"]["agreement_rate"] < 0.1
+    scorer.close()
+    log.info(f"✔ ¡Éxito! Métricas shadow: {stats['shadows']}.")
+
+
+def test_shadow_errors_never_reach_the_caller():
+    """
+    Verifica que un modelo shadow que falla solo incrementa su contador de errores.
+    """
+    log.info("TEST: Verificando el aislamiento de errores del modelo shadow.")
+    def broken(features):
+        raise RuntimeError("shadow roto")
+
+    scorer = ShadowScorer({"broken": broken})
+    features = np.zeros((4, 26), dtype=np.float32)
+    scorer.submit(None, features, _primary(features), 0.5)
+    scorer.join()
+    assert scorer.stats()["shadows"]["broken"]["errors"] == 1
+
+    scorer.set_primary_version("v1.2.0")  # cambiar el modelo primario reinicia los agregados
+    assert scorer.stats()["shadows"]["broken"]["errors"] == 0
+    scorer.close()
+    log.info("✔ ¡Éxito! Los errores shadow quedan aislados del camino principal.")
+
+
+def test_shadow_labels_use_each_model_threshold():
+    """
+    Verifica que el primario y cada modelo shadow etiquetan con su propio umbral de decisión.
+    """
+    log.info("TEST: Verificando los umbrales por versión del scoring shadow.")
+    # probabilidades idénticas: solo los umbrales distintos pueden generar desacuerdo
+    scorer = ShadowScorer({"strict": _primary, "same": _primary}, threshold=0.5, shadow_thresholds={"strict": 0.99})
+    scorer.set_primary_version("v1.3.0")
+    features = np.linspace(-3, 3, 64, dtype=np.float32)[:, None] * np.ones((1, 26), dtype=np.float32)
+    scorer.submit("v1.3.0", features, _primary(features), 0.5)
+    scorer.join()
+
+    stats = scorer.stats()
+    assert stats["shadows"]["same"]["threshold"] == 0.5 and stats["shadows"]["same"]["agreement_rate"] == 1.0
+    assert stats["shadows"]["strict"]["threshold"] == 0.99 and stats["shadows"]["strict"]["shadow_good_rate"] == 0.0
+    assert stats["shadows"]["strict"]["agreement_rate"] == 0.5
+
+    scorer.set_primary_version("v1.2.0", threshold=0.7)
+    assert scorer.stats()["threshold"] == 0.7
+    scorer.close()
+    log.info(f"✔ ¡Éxito! Métricas shadow por umbral: {stats['shadows']}.")
@@ -0,0 +1,80 @@
+import os
+import sys
+import torch
+import pytest
+import numpy as np
+import logging as log
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.training.model import CreditScoringModel
+from src.inference.export import export_shared_artifacts
+from src.inference.shared_artifacts import load_shared_artifacts, verify_shared_artifacts
+from src.inference.torch_backend import TorchBackend
+from src.inference.predictor import CreditRiskPredictor
+from src.server.schemas import CreditRiskInput
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PREPROCESSOR_PATH = PROJECT_ROOT / "models" / "german_credit_risk_preprocessor.joblib"
+EXAMPLE = CreditRiskInput.Config.schema_extra["example"]
+
+
+def test_shared_artifacts_roundtrip(tmp_path):
+    """
+    Verifica que el archivo compartido reproduce el encoder y el modelo, y que los pesos se mapean sin copia.
+    """
+    log.info("TEST: Verificando los artefactos compartidos (mmap).")
+    torch.manual_seed(0)
+    model = CreditScoringModel(num_features=26, hidden_layers=[64, 32], dropout_rate=0.1, use_batch_norm=True, activation_fn="ReLU").eval()
+    weights_path = tmp_path / "model.pt"
+    torch.save(model.state_dict(), weights_path)
+    shared_path = export_shared_artifacts(model, PREPROCESSOR_PATH, tmp_path / "model.shared.bin", weights_path)
+
+    encoder, numpy_model = load_shared_artifacts(shared_path)
+    assert all(isinstance(w.base, np.ndarray) and not w.flags.owndata for w in numpy_model.weights_t)
+    assert not numpy_model.weights_t[0].flags.writeable, "El mapeo de solo lectura no debe poder modificarse."
+
+    inputs = [CreditRiskInput(**{**EXAMPLE, "Age": age, "Saving accounts": saving}) for age in (20, 45, 70) for saving in ("little", "NA")]
+    features = encoder.encode_inputs(inputs)
+    with torch.no_grad():
+        expected = model(torch.from_numpy(features)).numpy()
+    assert np.allclose(numpy_model(features), expected, atol=1e-5)
+
+    # el backend torch usa los mismos buffers (copy-on-write) como parámetros
+    _, writable_model = load_shared_artifacts(shared_path, writable=True)
+    backend = TorchBackend(shared_path, model_config={}, shared_model=writable_model)
+    assert np.allclose(backend.predict_proba(features), torch.sigmoid(torch.from_numpy(expected)).view(-1).numpy(), atol=1e-5)
+    log.info("✔ ¡Éxito! Encoder y pesos mapeados reproducen el modelo original.")
+
+
+def test_shared_artifacts_reject_other_sources(tmp_path):
+    """
+    Verifica que un archivo compartido construido con otros pesos se rechaza por sha256 aunque sea más reciente que ellos.
+    """
+    log.info("TEST: Verificando la procedencia de los artefactos compartidos.")
+    torch.manual_seed(0)
+    model = CreditScoringModel(num_features=26, hidden_layers=[16], dropout_rate=0.1, use_batch_norm=True, activation_fn="ReLU").eval()
+    weights_path = tmp_path / "model.pt"
+    torch.save(model.state_dict(), weights_path)
+    shared_path = export_shared_artifacts(model, PREPROCESSOR_PATH, tmp_path / "model.shared.bin", weights_path)
+    verify_shared_artifacts(shared_path, weights_path, PREPROCESSOR_PATH)
+
+    # pesos nuevos (p. ej. tras un git checkout) con un archivo compartido de mtime posterior
+    torch.manual_seed(1)
+    retrained = CreditScoringModel(num_features=26, hidden_layers=[16], dropout_rate=0.1, use_batch_norm=True, activation_fn="ReLU")
+    torch.save(retrained.state_dict(), weights_path)
+    os.utime(shared_path, (weights_path.stat().st_mtime + 60,) * 2)
+    with pytest.raises(ValueError, match="no corresponde"):
+        verify_shared_artifacts(shared_path, weights_path, PREPROCESSOR_PATH)
+    with pytest.raises(ValueError, match="no corresponde"):
+        load_shared_artifacts(shared_path, weights_path, PREPROCESSOR_PATH)
+
+    # el predictor ignora el archivo compartido y sirve los pesos nuevos
+    config = {"num_features": 26, "hidden_layers": [16], "dropout_rate": 0.1, "use_batch_norm": True, "activation_fn": "ReLU"}
+    predictor = CreditRiskPredictor(weights_path, PREPROCESSOR_PATH, config, use_shared_artifacts=True, use_bundle=False, use_calibration=False)
+    features = predictor.encoder.encode_inputs([CreditRiskInput(**EXAMPLE)])
+    with torch.no_grad():
+        expected = torch.sigmoid(retrained.eval()(torch.from_numpy(features))).view(-1).numpy()
+    assert np.allclose(predictor.predict_proba(features), expected, atol=1e-5)
+    log.info("✔ ¡Éxito! Los artefactos compartidos desactualizados se detectan por sha256.")
@@ -0,0 +1,69 @@
+import os
+import sys
+import json
+import queue
+import logging
+import logging as log
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.structured_logging import JsonFormatter, NonBlockingQueueHandler, configure_logging, shutdown_logging, sample
+
+
+def _record(msg, *args, fields=None):
+    record = logging.LogRecord("credit_scoring", logging.INFO, __file__, 1, msg, args, None)
+    if fields is not None:
+        record.fields = fields
+    return record
+
+
+def test_json_formatter_includes_fields():
+    """
+    Verifica que cada registro se serializa como una línea JSON con los campos estructurados.
+    """
+    log.info("TEST: Verificando el formato JSON de los logs.")
+    line = JsonFormatter().format(_record("✔ Predicción %s", "generada", fields={"prediction": "good", "probability": 0.91}))
+    payload = json.loads(line)
+    assert payload["message"] == "✔ Predicción generada"
+    assert payload["level"] == "INFO" and payload["prediction"] == "good" and payload["probability"] == 0.91
+    log.info("✔ ¡Éxito! El registro JSON contiene los campos estructurados.")
+
+
+def test_queue_handler_drops_instead_of_blocking():
+    """
+    Verifica que con la cola llena los registros se descartan y se cuentan sin bloquear al llamador.
+    """
+    log.info("TEST: Verificando el descarte de logs con la cola llena.")
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+    for i in range(5):
+        handler.handle(_record("registro %d", i))
+    assert handler.queue.qsize() == 2 and handler.dropped == 3
+    assert handler.queue.get_nowait().getMessage() == "registro 0"
+    log.info("✔ ¡Éxito! Los registros sobrantes se descartan.")
+
+
+def test_configure_and_shutdown_restore_root_logger():
+    """
+    Verifica que configure_logging instala el handler de cola y shutdown_logging restaura el logger raíz.
+    """
+    log.info("TEST: Verificando la configuración del logging asíncrono.")
+    root = logging.getLogger()
+    handlers_before, level_before = list(root.handlers), root.level
+    handler = configure_logging("WARNING", "json", queue_max_size=10)
+    try:
+        assert handler in root.handlers and root.level == logging.WARNING
+        assert not any(type(h) is logging.StreamHandler for h in root.handlers)
+    finally:
+        shutdown_logging()
+    assert set(root.handlers) == set(handlers_before) and root.level == level_before
+    log.info("✔ ¡Éxito! El logger raíz se restaura al apagar el servicio.")
+
+
+def test_sampling_rate_bounds():
+    """
+    Verifica los extremos de la tasa de muestreo de logs por solicitud.
+    """
+    log.info("TEST: Verificando el muestreo de logs.")
+    assert all(sample(1.0) for _ in range(100))
+    assert not any(sample(0.0) for _ in range(100))
+    log.info("✔ ¡Éxito! El muestreo respeta los extremos.")
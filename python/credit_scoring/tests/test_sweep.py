@@ -0,0 +1,72 @@
+import os
+import sys
+import yaml
+import torch
+import mlflow
+import pytest
+import logging as log
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.training import sweep
+from src.training.sweep import expand_search_space, apply_overrides, halving_rungs
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BASE_CONFIG = PROJECT_ROOT / "config" / "training" / "credit_scoring-training_config-german_credit_risk_v130.yaml"
+
+
+def test_search_space_and_rungs():
+    """
+    Verifica la expansión del espacio de búsqueda (grid y random reproducible) y los rungs de successive halving.
+    """
+    log.info("TEST: Verificando el espacio de búsqueda del sweep.")
+    space = {"hidden_layers": [[64, 32], [128]], "learning_rate": [0.01, 0.001, 0.0001], "activation_fn": ["ReLU", "GELU"]}
+    grid = expand_search_space(space)
+    assert len(grid) == 12 and grid[0] == {"hidden_layers": [64, 32], "learning_rate": 0.01, "activation_fn": "ReLU"}
+    sampled = expand_search_space(space, "random", num_trials=5, seed=3)
+    assert len(sampled) == 5 and sampled == expand_search_space(space, "random", num_trials=5, seed=3)
+    assert all(trial in grid for trial in sampled)
+    with pytest.raises(ValueError):
+        expand_search_space({"momentum": [0.9]})
+
+    base = yaml.safe_load(BASE_CONFIG.read_text())
+    params = apply_overrides(base, {"hidden_layers": [16], "batch_size": 64, "learning_rate": 0.01})
+    assert params["model_config"]["architecture"]["hidden_layers"] == [16]
+    assert params["training_params"]["batch_size"] == 64 and params["training_params"]["optimizer"]["learning_rate"] == 0.01
+    assert base["training_params"]["batch_size"] == 32, "La configuración base no debe modificarse."
+
+    assert halving_rungs(5, 3, 100) == [5, 15, 45, 100]
+    assert halving_rungs(10, 2, 10) == [10]
+    log.info("✔ ¡Éxito! El espacio de búsqueda y los rungs son correctos.")
+
+
+def test_trial_resumes_between_rungs(tmp_path, monkeypatch):
+    """
+    Verifica que un trial entrena hasta el primer rung y reanuda su estado (historial, early stopping) en el siguiente.
+    """
+    log.info("TEST: Verificando la reanudación de un trial entre rungs.")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", f"sqlite:///{tmp_path / 'mlflow.db'}")
+    generator = torch.Generator().manual_seed(0)
+    x = torch.randn(300, 8, generator=generator)
+    y = (x[:, :1] + 0.5 * torch.randn(300, 1, generator=generator) > 0).float()
+    for name, tensor in {"x_train": x[:240], "y_train": y[:240], "x_val": x[240:], "y_val": y[240:]}.items():
+        monkeypatch.setitem(sweep._WORKER_DATA, name, tensor)
+
+    params = apply_overrides(yaml.safe_load(BASE_CONFIG.read_text()), {"hidden_layers": [16], "batch_size": 64})
+    params["training_params"].update({"epochs": 6, "eval_every_n_epochs": 2})
+    with mlflow.start_run() as run:
+        pass
+    task = {"trial_id": "trial_000", "params": params, "run_id": run.info.run_id, "trial_dir": str(tmp_path / "trial"),
+            "start_epoch": 0, "end_epoch": 3}
+    first = sweep._run_trial(task)
+    assert first["epochs_run"] == 3 and not first["early_stopped"]
+    second = sweep._run_trial({**task, "start_epoch": 3, "end_epoch": 6})
+    assert second["epochs_run"] == 6 and second["best_val_loss"] <= first["best_val_loss"]
+
+    state = torch.load(tmp_path / "trial" / "state.pt")
+    # evaluaciones en la última época de cada rung y cada eval_every_n_epochs
+    assert state["history"]["epoch"] == [2, 3, 4, 6]
+    assert (tmp_path / "trial" / "best.pt").exists()
+    log.info("✔ ¡Éxito! El trial reanuda su estado entre rungs.")
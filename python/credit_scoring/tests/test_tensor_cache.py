@@ -0,0 +1,59 @@
+import os
+import sys
+import yaml
+import numpy as np
+import pandas as pd
+import logging as log
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.training.train import CreditScoringModelTraining
+from src.training.tensor_cache import tensor_cache_key
+from src.processing.main import CreditDataPreprocessor
+from src.benchmark.inference import synthetic_payloads
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BASE_CONFIG = PROJECT_ROOT / "config" / "training" / "credit_scoring-training_config-german_credit_risk_v130.yaml"
+
+
+def _trainer(dataset_path: Path, **training_params) -> CreditScoringModelTraining:
+    params = yaml.safe_load(BASE_CONFIG.read_text())
+    params["data_source"]["data_path"]["dataset_path"] = str(dataset_path)
+    params["training_params"]["data_cache"] = {"enabled": True, "dir": str(dataset_path.parent / "cache")}
+    params["training_params"].update(training_params)
+    return CreditScoringModelTraining(params=params)
+
+
+def test_preprocessed_tensors_are_cached(tmp_path, monkeypatch):
+    """
+    Verifica que una segunda ejecución con la misma clave reutiliza los tensores sin leer el CSV,
+    y que cambiar el dataset o el split invalida la clave.
+    """
+    log.info("TEST: Verificando el cache de tensores preprocesados.")
+    monkeypatch.chdir(tmp_path)
+    rows = pd.DataFrame(synthetic_payloads(200, seed=0))
+    rows["Risk"] = np.where(np.arange(200) % 3 == 0, "bad", "good")
+    dataset_path = tmp_path / "german_credit_risk.csv"
+    rows.to_csv(dataset_path, index=True)
+
+    first_trainer = _trainer(dataset_path)
+    first, _ = first_trainer._split_and_preprocess()
+    assert first_trainer.data_cache_entry is not None and (first_trainer.data_cache_entry / "metadata.yaml").exists()
+
+    # the cache hit must not touch the CSV
+    monkeypatch.setattr(pd, "read_csv", lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("CSV leído")))
+    second_trainer = _trainer(dataset_path, batch_size=128)
+    second, preprocessor = second_trainer._split_and_preprocess()
+    assert second_trainer.data_cache_entry == first_trainer.data_cache_entry
+    for name in ("x_train", "y_train", "x_val", "y_val"):
+        np.testing.assert_array_equal(first[name], second[name])
+    assert second["y_train"].shape == (160, 1) and second["x_train"].dtype == np.float32
+    assert preprocessor.transform(rows.drop(columns=["Risk"]).head(3)).shape[1] == second["x_train"].shape[1]
+
+    key = tensor_cache_key(dataset_path, 0.2, 42, CreditDataPreprocessor())
+    assert key != tensor_cache_key(dataset_path, 0.25, 42, CreditDataPreprocessor())
+    assert key != tensor_cache_key(dataset_path, 0.2, 7, CreditDataPreprocessor())
+    rows.head(150).to_csv(dataset_path, index=True)
+    assert key != tensor_cache_key(dataset_path, 0.2, 42, CreditDataPreprocessor())
+    log.info("✔ ¡Éxito! El cache de tensores se reutiliza y se invalida correctamente.")